@@ -15,9 +15,11 @@ This is typically used as the handler for dynamic views.  See the
 **traits.has_dynamic_view** module.
 """
 
+from types import FunctionType
+
 # Enthought library imports
 from traits.api import HasTraits, List
-from .ui import Dispatcher
+from .ui import dispatch_changed_methods
 
 # Local imports.
 from .handler import Handler
@@ -92,27 +94,10 @@ class DelegatingHandler(Handler):
             # sure this is right!
             h.init(info)
 
-            for name in self._each_trait_method(h):
-                if name[-8:] == "_changed":
-                    prefix = name[:-8]
-                    col = prefix.find("_", 1)
-                    if col >= 0:
-                        object = context.get(prefix[:col])
-                        if object is not None:
-                            logger.debug(
-                                "\tto method [%s] on handler[%s]", name, h
-                            )
-                            method = getattr(h, name)
-                            trait_name = prefix[col + 1 :]
-                            self._dispatchers.append(
-                                Dispatcher(method, info, object, trait_name)
-                            )
-
-                            # Also invoke the method immediately so initial
-                            # user interface state can be correctly set.
-                            if object.base_trait(trait_name).type != "event":
-                                method(info)
+            logger.debug("\tto methods on handler[%s]", h)
+            dispatch_changed_methods(h, info, context, self._dispatchers)
 
+            for name in ["tree_item_selected", "inspect_object"]:
                 # fixme: These are explicit workarounds for problems with:-
                 #
                 # 'GeometryHierarchyViewHandler'
@@ -137,7 +122,7 @@ class DelegatingHandler(Handler):
                 # - which is called directly as as action from the context menu
                 #   defined in the tree editor.
                 #
-                elif name in ["tree_item_selected", "inspect_object"]:
+                if isinstance(getattr(type(h), name, None), FunctionType):
                     self.__dict__[name] = self._create_delegate(h, name)
 
         return True
@@ -24,14 +24,12 @@ from traits.api import (
     Instance,
     List,
     Property,
-    ReadOnly,
     Set,
     Str,
     TraitError,
     TraitListEvent,
     Tuple,
     Undefined,
-    cached_property,
 )
 from traits.trait_base import not_none, xgetattr, xsetattr
 
@@ -39,13 +37,46 @@ from .editor_factory import EditorFactory
 
 from .context_value import ContextValue
 
+from .helper import extended_getter
+
 from .undo import UndoItem
 
 from .item import Item
 
+from .profiling import record
+
 # Reference to an EditorFactory object
 factory_trait = Instance(EditorFactory)
 
+#: Whether editors coalesce the updates of their controls when neither the
+#: editor nor its factory specifies it (see set_coalesce_updates_default).
+_COALESCE_UPDATES_DEFAULT = False
+
+
+def set_coalesce_updates_default(coalesce):
+    """Sets whether editors coalesce the updates of their controls by default.
+
+    When updates are coalesced, an editor updates its control at most once
+    per iteration of the event loop with the latest value of its trait,
+    rather than after every change of the trait.  This is off by default, so
+    that editors are updated synchronously (which is what most tests expect).
+
+    Parameters
+    ----------
+    coalesce : bool
+        Whether updates are coalesced by default.
+
+    Returns
+    -------
+    previous : bool
+        The previous default, so that it can be restored.
+    """
+    global _COALESCE_UPDATES_DEFAULT
+
+    previous = _COALESCE_UPDATES_DEFAULT
+    _COALESCE_UPDATES_DEFAULT = bool(coalesce)
+    return previous
+
 
 class Editor(HasPrivateTraits):
     """Represents an editing control for an object trait in a Traits-based
@@ -62,8 +93,9 @@ class Editor(HasPrivateTraits):
     #: The object this editor is editing (e.g. object.link1.link2):
     object = Instance(HasTraits, clean_up=True)
 
-    #: The name of the trait this editor is editing (e.g. 'value'):
-    name = ReadOnly()
+    #: The name of the trait this editor is editing (e.g. 'value').  It can
+    #: only be set once, and is then changed by :meth:`rebind`:
+    name = Property()
 
     #: The context object the editor is editing (e.g. object):
     context_object = Property()
@@ -76,8 +108,9 @@ class Editor(HasPrivateTraits):
     #: Original value of object.name (e.g. object.link1.link2.value):
     old_value = Any(clean_up=True)
 
-    #: Text description of the object trait being edited:
-    description = ReadOnly()
+    #: Text description of the object trait being edited.  It can only be
+    #: set once, and is then changed by :meth:`rebind`:
+    description = Property()
 
     #: The Item object used to create this editor:
     item = Instance(Item, (), clean_up=True)
@@ -115,6 +148,12 @@ class Editor(HasPrivateTraits):
     #: The current editor invalid state status:
     invalid = Bool(False)
 
+    #: Is the control updated at most once per iteration of the event loop
+    #: (with the latest value) rather than after every change of the trait?
+    #: Defaults to the factory's **coalesce_updates** if it is not None, or
+    #: to the global default set by :func:`set_coalesce_updates_default`.
+    coalesce_updates = Bool()
+
     # -- private trait definitions ------------------------------------------
 
     #: A set to track values being updated to prevent infinite recursion.
@@ -126,6 +165,23 @@ class Editor(HasPrivateTraits):
     #: A list of all values synchronized from.
     _user_from = List(Tuple(Str, Callable))
 
+    #: The values synchronized with traits of the context object, as tuples
+    #: of the arguments of sync_value and of the entries it added to
+    #: _user_to and _user_from, so that they can be moved by rebind.
+    _context_syncs = List()
+
+    #: The name of the trait being edited (see name):
+    _edited_name = Any(Undefined)
+
+    #: The description of the trait being edited (see description):
+    _edited_description = Any(Undefined)
+
+    #: The cached context object (see context_object), or None:
+    _cached_context_object = Any()
+
+    #: The cached extended name (see extended_name), or None:
+    _cached_extended_name = Any()
+
     # ------------------------------------------------------------------------
     # Editor interface
     # ------------------------------------------------------------------------
@@ -206,6 +262,21 @@ class Editor(HasPrivateTraits):
         """
         return self.factory.string_value(value, format_func)
 
+    def string_value_key(self):
+        """Returns a hashable key identifying the formatting performed by
+        :meth:`string_value`.
+
+        Editors whose keys are equal format values identically, so values
+        they format can be shared between them.  If the formatting cannot be
+        identified this returns None.
+        """
+        if type(self).string_value is not Editor.string_value:
+            return None
+        factory = self.factory
+        if type(factory).string_value is not EditorFactory.string_value:
+            return None
+        return (factory.format_func, factory.format_str)
+
     def restore_prefs(self, prefs):
         """Restores saved user preference information for the editor.
 
@@ -243,14 +314,15 @@ class Editor(HasPrivateTraits):
         parent : toolkit control
             The parent toolkit object of the editor's toolkit objects.
         """
-        name = self.extended_name
-        if name != "None":
-            self.context_object.on_trait_change(
-                self._update_editor, name, dispatch="ui"
-            )
-        self.init(parent)
-        self._sync_values()
-        self.update_editor()
+        with record(self.__class__.__name__, "editor"):
+            name = self.extended_name
+            if name != "None":
+                self.context_object.on_trait_change(
+                    self._update_editor, name, dispatch="ui"
+                )
+            self.init(parent)
+            self._sync_values()
+            self.update_editor()
 
     def dispose(self):
         """Disposes of the contents of an editor.
@@ -280,6 +352,63 @@ class Editor(HasPrivateTraits):
         for name in self.trait_names(clean_up=True):
             setattr(self, name, None)
 
+    def rebind(
+        self, object, name, item=None, object_name=None, description=""
+    ):
+        """Binds a prepared editor to another object trait.
+
+        This allows the editor's toolkit control to be reused to edit a trait
+        of the same type (eg. by views which only create editors for the
+        visible items).  The editor should have been created by an equivalent
+        editor factory.  The tooltip of its control is set again, and the
+        values synchronized with traits of the context object are moved to
+        the new context object.
+
+        Parameters
+        ----------
+        object : HasTraits
+            The object to edit.
+        name : str
+            The name of the trait to edit.
+        item : Item or None
+            The Item the editor is now created for, if it changes.
+        object_name : str or None
+            The full name of the object in the UI's context (eg.
+            'object.link1'), if it changes.
+        description : str
+            The description of the trait to edit.
+        """
+        context_object = self.context_object
+        extended_name = self.extended_name
+        if extended_name != "None":
+            context_object.on_trait_change(
+                self._update_editor, extended_name, remove=True
+            )
+
+        if item is not None:
+            self.item = item
+        if object_name is not None:
+            self.object_name = object_name
+        self.object = object
+        self._edited_name = name
+        self._edited_description = description
+        self._cached_context_object = self._cached_extended_name = None
+        self.old_value = getattr(object, name, Undefined)
+
+        if self.context_object is not context_object:
+            self._resync_context_values()
+
+        extended_name = self.extended_name
+        if extended_name != "None":
+            self.context_object.on_trait_change(
+                self._update_editor, extended_name, dispatch="ui"
+            )
+
+        if self.control is not None and not self.set_tooltip():
+            # Remove the tooltip of the previous trait:
+            self.set_tooltip_text(self.control, "")
+        self.update_editor()
+
     # -- Undo/redo methods --------------------------------------------------
 
     def log_change(self, undo_factory, *undo_args):
@@ -369,6 +498,8 @@ class Editor(HasPrivateTraits):
         if user_name == "":
             return
 
+        arguments = (user_name, editor_name, mode, is_list, is_event)
+        n_to, n_from = len(self._user_to), len(self._user_from)
         key = "%s:%s" % (user_name, editor_name)
 
         parts = user_name.split(".")
@@ -398,6 +529,15 @@ class Editor(HasPrivateTraits):
                     editor_value = xgetattr(self, editor_name)
                     xsetattr(user_object, xuser_name, editor_value)
 
+        if len(parts) == 1:
+            self._context_syncs.append(
+                (
+                    arguments,
+                    self._user_to[n_to:],
+                    self._user_from[n_from:],
+                )
+            )
+
     # -- Utility methods -----------------------------------------------------
 
     def parse_extended_name(self, name):
@@ -422,7 +562,7 @@ class Editor(HasPrivateTraits):
             name = base_name
             object = self.context_object
 
-        return (object, name, partial(xgetattr, object, name))
+        return (object, name, partial(extended_getter(name), object))
 
     def set_tooltip(self, control=None):
         """Sets the tooltip for a specified toolkit control.
@@ -597,8 +737,17 @@ class Editor(HasPrivateTraits):
 
         # If the change was not caused by the editor itself:
         if not self.updating:
-            # Update the editor control to reflect the current object state:
-            self.update_editor()
+            # Update the editor control to reflect the current object state,
+            # unless the UI is batching updates, in which case it is done
+            # when the batch ends, or the editor coalesces its updates, in
+            # which case it is done on the next iteration of the event loop:
+            ui = self.ui
+            if ui._defer_update(self, self.update_editor):
+                return
+            if self.coalesce_updates:
+                ui._coalesce_update(self, self.update_editor)
+            else:
+                self.update_editor()
 
     def _sync_values(self):
         """Initialize and synchronize editor and factory traits
@@ -747,6 +896,22 @@ class Editor(HasPrivateTraits):
                 (editor_name + "_items", editor_list_modified)
             )
 
+    def _resync_context_values(self):
+        """Moves the values synchronized with traits of the previous context
+        object to the current context object.
+        """
+        context_syncs, self._context_syncs = self._context_syncs, []
+        for arguments, user_to, user_from in context_syncs:
+            for entry in user_to:
+                object, name, handler = entry
+                object.on_trait_change(handler, name, remove=True)
+                self._user_to.remove(entry)
+            for entry in user_from:
+                name, handler = entry
+                self.on_trait_change(handler, name, remove=True)
+                self._user_from.remove(entry)
+            self.sync_value(*arguments)
+
     def __set_value(self, value):
         """Set the value of the trait the editor is editing.
 
@@ -768,28 +933,72 @@ class Editor(HasPrivateTraits):
                 self.error(excp)
                 raise
 
+    # -- Traits default value methods ---------------------------------------
+
+    def _coalesce_updates_default(self):
+        """Returns the factory's setting, or the global default."""
+        coalesce = getattr(self.factory, "coalesce_updates", None)
+        if coalesce is None:
+            return _COALESCE_UPDATES_DEFAULT
+        return coalesce
+
     # -- Traits property getters and setters --------------------------------
 
-    @cached_property
+    def _get_name(self):
+        return self._edited_name
+
+    def _set_name(self, name):
+        self._check_read_only("name")
+        self._edited_name = name
+
+    def _get_description(self):
+        return self._edited_description
+
+    def _set_description(self, description):
+        self._check_read_only("description")
+        self._edited_description = description
+
+    def _check_read_only(self, name):
+        """Raises a TraitError if a read-only trait has already been set."""
+        if getattr(self, name) is not Undefined:
+            raise TraitError(
+                "Cannot modify the read only '%s' attribute of a '%s' "
+                "object." % (name, self.__class__.__name__)
+            )
+
     def _get_context_object(self):
         """Returns the context object the editor is using
 
         In some cases a proxy object is edited rather than an object directly
-        in the context, in which case we return ``self.object``.
+        in the context, in which case we return ``self.object``.  The result
+        is cached until the editor is rebound.
         """
-        object_name = self.object_name
-        context_key = object_name.split(".", 1)[0]
-        if (object_name != "") and (context_key in self.ui.context):
-            return self.ui.context[context_key]
+        context_object = self._cached_context_object
+        if context_object is None:
+            object_name = self.object_name
+            context_key = object_name.split(".", 1)[0]
+            if (object_name != "") and (context_key in self.ui.context):
+                context_object = self.ui.context[context_key]
+            else:
+                # This handles the case of a 'ListItemProxy', which is not in
+                # the ui.context, but is the editor 'object':
+                context_object = self.object
+            self._cached_context_object = context_object
 
-        # This handles the case of a 'ListItemProxy', which is not in the
-        # ui.context, but is the editor 'object':
-        return self.object
+        return context_object
 
-    @cached_property
     def _get_extended_name(self):
-        """Returns the extended trait name being edited."""
-        return ("%s.%s" % (self.object_name, self.name)).split(".", 1)[1]
+        """Returns the extended trait name being edited.
+
+        The result is cached until the editor is rebound.
+        """
+        extended_name = self._cached_extended_name
+        if extended_name is None:
+            extended_name = self._cached_extended_name = (
+                "%s.%s" % (self.object_name, self.name)
+            ).split(".", 1)[1]
+
+        return extended_name
 
     def _get_value_trait(self):
         """Returns the trait the editor is editing (Property implementation)."""
@@ -20,6 +20,7 @@ from traits.api import (
     Str,
     Bool,
     Any,
+    Enum,
     Property,
 )
 
@@ -64,6 +65,12 @@ class EditorFactory(HasPrivateTraits):
     #: Example: left,vcenter
     text_alignment = Str()
 
+    #: Do created editors update their control at most once per iteration of
+    #: the event loop, with the latest value, rather than after every change
+    #: of the trait?  If None, the global default set with
+    #: :func:`traitsui.editor.set_coalesce_updates_default` is used.
+    coalesce_updates = Enum(None, True, False)
+
     #: The editor class to use for 'simple' style views.
     simple_editor_class = Property()
 
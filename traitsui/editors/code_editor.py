@@ -12,7 +12,7 @@
 useful for tools such as debuggers.
 """
 
-from traits.api import Instance, Str, Enum, Bool
+from traits.api import Instance, Int, Str, Enum, Bool
 
 from traitsui.editor_factory import EditorFactory
 from traitsui.toolkit_traits import Color
@@ -69,6 +69,20 @@ class CodeEditor(EditorFactory):
     #: Is user input set on every change?
     auto_set = Bool(True)
 
+    #: The delay (in milliseconds) after the last change before user input is
+    #: set, when **auto_set** is True.  If 0, it is set on every change.
+    auto_set_delay = Int(0)
+
+    #: Is the displayed text updated incrementally?  If True, text appended
+    #: to the value, and small changes to it, are applied to the displayed
+    #: document rather than replacing its whole text (Qt only).
+    incremental = Bool(False)
+
+    #: The maximum number of lines displayed, for log views.  If it is not 0,
+    #: the oldest lines are discarded from the display, the text is updated
+    #: incrementally, and the editor is read-only (Qt only).
+    max_lines = Int(0)
+
     #: Should the editor auto-scroll when a new **selected_line** value is set?
     auto_scroll = Bool(True)
 
@@ -107,6 +107,12 @@ class TableEditor(EditorFactory):
     #: Should the editor become active after the first click
     edit_on_first_click = Bool(True)
 
+    #: Should the editors of the cells be kept when editing ends, and bound to
+    #: the next cell of the same column which is edited, rather than created
+    #: for each edit?  The editors of the columns must support being bound to
+    #: other objects (see :py:meth:`traitsui.editor.Editor.rebind`).
+    reuse_cell_editors = Bool(False)
+
     #: Can the user reorder the items in the table?
     reorderable = Bool(False)
 
@@ -11,7 +11,7 @@
 """ Defines the text editor factory for all traits toolkit backends.
 """
 
-from traits.api import Dict, Str, Any, Bool
+from traits.api import Dict, Str, Any, Bool, Int
 
 from traitsui.editor_factory import EditorFactory
 from traitsui.group import Group
@@ -89,6 +89,17 @@ class TextEditor(EditorFactory):
     #: more general feature.
     cancel_button = Bool(False)
 
+    #: Is the text of a multi-line editor updated incrementally?  If True,
+    #: text appended to the value, and small changes to it, are applied to
+    #: the displayed document rather than replacing its whole text (Qt only).
+    incremental = Bool(False)
+
+    #: The maximum number of lines displayed by a multi-line editor, for log
+    #: views.  If it is not 0, the oldest lines are discarded from the
+    #: display, the text is updated incrementally, and the editor is
+    #: read-only (Qt only).
+    max_lines = Int(0)
+
     # -------------------------------------------------------------------------
     #  Traits view definition:
     # -------------------------------------------------------------------------
@@ -11,7 +11,18 @@
 """ Defines the tree editor factory for all traits user interface toolkits.
 """
 
-from traits.api import Any, Dict, Bool, Tuple, Int, List, Instance, Str, Enum
+from traits.api import (
+    Any,
+    Dict,
+    Bool,
+    Tuple,
+    Int,
+    Float,
+    List,
+    Instance,
+    Str,
+    Enum,
+)
 
 from traitsui.dock_window_theme import DockWindowTheme
 from traitsui.editor_factory import EditorFactory
@@ -182,6 +193,21 @@ class TreeEditor(EditorFactory):
     #: tree
     word_wrap = Bool(False)
 
+    #: The number of seconds a node must stay collapsed before its children
+    #: are released (a negative value never releases them).  The children of
+    #: released nodes are created again when the nodes are next expanded.
+    #: This works only in the qt backend.
+    release_collapsed_delay = Float(-1.0)
+
+    #: The maximum number of collapsed nodes whose children are kept (0 keeps
+    #: all of them).  The children of the least recently collapsed nodes are
+    #: released first.  This works only in the qt backend.
+    max_collapsed_nodes = Int(0)
+
+    #: The optional extended trait name of the trait to synchronize with the
+    #: number of nodes in the tree:
+    node_count = Str()
+
 
 # This alias is deprecated and will be removed in TraitsUI 8.
 ToolkitEditorFactory = TreeEditor
@@ -110,6 +110,16 @@ class Group(ViewSubElement):
     #: Should the group be scrollable along the direction of orientation?
     scrollable = Bool(False)
 
+    #: Should the editors of a scrollable group only be created for the items
+    #: in or near the visible area? This makes views with thousands of items
+    #: fast to open, and editors are reused for items of the same kind as the
+    #: group is scrolled. It only applies to vertical groups containing only
+    #: trait items without **visible_when** or **enabled_when** conditions,
+    #: and is currently only supported by the Qt toolkit. The editors of
+    #: items outside of the visible area are not returned by
+    #: ``UI.get_editors``, nor bound to the UIInfo object.
+    virtual = Bool(False)
+
     #: The number of columns in the group
     columns = Range(1, 50)
 
@@ -576,6 +586,9 @@ class ShadowGroup(Group):
     #: Should the group be scrollable along the direction of orientation?
     scrollable = ShadowDelegate
 
+    #: Should editors only be created for the visible items?
+    virtual = ShadowDelegate
+
     #: The number of columns in the group
     columns = ShadowDelegate
 
@@ -14,6 +14,7 @@
 
 # avoid deprecation warning
 from inspect import getfullargspec
+from weakref import WeakKeyDictionary
 
 from traits.api import HasPrivateTraits, HasTraits, Instance
 
@@ -45,6 +46,45 @@ def close_dock_control(dock_control):
     return True
 
 
+#: Cache of the parsed 'object_name_changed' methods of each handler class
+_changed_methods_cache = WeakKeyDictionary()
+
+
+def changed_methods(handler):
+    """Returns the 'object_name_changed' methods defined by a handler.
+
+    The result only depends on the class of the handler, and so is computed
+    once per class and cached.
+
+    Parameters
+    ----------
+    handler : HasTraits
+        The handler whose methods are returned.
+
+    Returns
+    -------
+    methods : tuple of (str, str, str)
+        A tuple of (object_name, trait_name, method_name) for each method,
+        in the order the methods are defined.
+    """
+    klass = type(handler)
+    try:
+        return _changed_methods_cache[klass]
+    except KeyError:
+        pass
+
+    methods = []
+    for name in handler._each_trait_method(handler):
+        if name[-8:] == "_changed":
+            prefix = name[:-8]
+            col = prefix.find("_", 1)
+            if col >= 0:
+                methods.append((prefix[:col], prefix[col + 1 :], name))
+
+    methods = _changed_methods_cache[klass] = tuple(methods)
+    return methods
+
+
 class Handler(HasPrivateTraits):
     """Provides access to and control over the run-time workings of a
     Traits-based user interface.
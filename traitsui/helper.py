@@ -12,7 +12,10 @@
     user interfaces.
 """
 
-from operator import itemgetter
+from collections import OrderedDict
+from functools import lru_cache, partial
+from operator import attrgetter, itemgetter
+import weakref
 
 from traits.api import BaseTraitHandler, CTrait, Enum, TraitError
 
@@ -42,6 +45,111 @@ def user_name_for(name):
     return result
 
 
+@lru_cache(maxsize=1024)
+def extended_getter(name):
+    """Returns a callable which gets an extended attribute of an object.
+
+    The callable is equivalent to ``xgetattr(object, name)`` for an extended
+    name of the form ``name[.name2[.name3...]]``, but the name is only split
+    once, and the callables are memoised by name.
+
+    Parameters
+    ----------
+    name : str
+        The extended attribute name.
+    """
+    return attrgetter(name)
+
+
+class IdentityMap:
+    """A mapping whose keys are compared by identity, such as the objects
+    displayed by a tree editor.
+
+    Unlike a dictionary keyed by ``id(object)``, the entries of objects which
+    support weak references do not keep them alive and are discarded when
+    the objects are garbage collected, so that an entry is never returned for
+    a new object which reuses the id of a dead one.  Other objects (eg.
+    tuples) are referenced strongly while they are in the map.
+    """
+
+    def __init__(self):
+        # (reference, value) pairs keyed by the id of the object:
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, object):
+        return self._entry(object) is not None
+
+    def __getitem__(self, object):
+        entry = self._entry(object)
+        if entry is None:
+            raise KeyError(object)
+        return entry[1]
+
+    def __setitem__(self, object, value):
+        key = id(object)
+        entry = self._entry(object)
+        if entry is not None:
+            self._entries[key] = (entry[0], value)
+            return
+
+        try:
+            ref = weakref.ref(object, partial(self._discard, key))
+        except TypeError:
+            ref = partial(_identity, object)
+        self._entries[key] = (ref, value)
+
+    def __delitem__(self, object):
+        if self._entry(object) is None:
+            raise KeyError(object)
+        del self._entries[id(object)]
+
+    def get(self, object, default=None):
+        """Returns the value of an object, or a default if it has none."""
+        entry = self._entry(object)
+        if entry is None:
+            return default
+        return entry[1]
+
+    def setdefault(self, object, default=None):
+        """Returns the value of an object, setting it to a default if it has
+        none.
+        """
+        entry = self._entry(object)
+        if entry is None:
+            self[object] = default
+            return default
+        return entry[1]
+
+    def values(self):
+        """Returns the values of the live objects in the map."""
+        return [value for ref, value in self._entries.values()]
+
+    def clear(self):
+        """Removes all the entries of the map."""
+        self._entries.clear()
+
+    def _entry(self, object):
+        """Returns the entry of an object, or None if it has none."""
+        entry = self._entries.get(id(object))
+        if entry is None or entry[0]() is not object:
+            return None
+        return entry
+
+    def _discard(self, key, ref):
+        """Discards the entry of a dead object."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._entries[key]
+
+
+def _identity(object):
+    """Returns an object (used as a strong reference by IdentityMap)."""
+    return object
+
+
 def commatize(value):
     """Formats a specified value as an integer string with embedded commas.
     For example: commatize( 12345 ) returns "12,345".
@@ -55,8 +163,162 @@ def commatize(value):
     return "-" + result
 
 
-def enum_values_changed(values, strfunc=str):
-    """Recomputes the mappings for a new set of enumeration values."""
+#: The maximum number of enumeration mappings memoised by enum_values_changed.
+ENUM_MAPPING_CACHE_SIZE = 128
+
+#: The memoised enumeration mappings, keyed by the id of their source of
+#: values and by the key of their formatting function, in least recently used
+#: order.  Each entry holds the source (to keep its id valid), the version of
+#: the source and the tuple of its items the mappings were computed for, and
+#: the mappings.
+_enum_mapping_cache = OrderedDict()
+
+#: The versions of the sources of enumeration values which have been
+#: modified, keyed by the id of the source, in least recently used order.
+#: Each entry holds the source and the token of its current version.
+_enum_values_versions = OrderedDict()
+
+
+def enum_values_changed(values, strfunc=str, strfunc_key=None):
+    """Recomputes the mappings for a new set of enumeration values.
+
+    If a key for the formatting function is given, the result is memoised
+    on the identity and version of the source of the values and on that key,
+    so that editors over the same source share the same mappings.  Memoised
+    mappings are only reused while the source holds the same items, and
+    editors must call :func:`invalidate_enum_values` when the source is
+    modified in a way that changes the names of its items.  The returned
+    names list and dictionaries are then shared and must not be modified.
+
+    Parameters
+    ----------
+    values : sequence, dict, CTrait or BaseTraitHandler
+        The source of the enumeration values.
+    strfunc : callable
+        The function used to format each value as a name.
+    strfunc_key : hashable or None
+        A key which identifies the formatting performed by strfunc, used in
+        place of strfunc when memoising so that different functions which
+        format identically (eg. the string_value methods of different
+        editors) can share mappings.  If None, the mappings are computed
+        without being memoised.
+
+    Returns
+    -------
+    names, mapping, inverse_mapping : list, dict, dict
+        The names of the values in display order, the mapping from names to
+        values, and the mapping from values to names.
+    """
+    if strfunc_key is None:
+        return _compute_enum_mappings(values, strfunc)
+
+    key = (id(values), strfunc_key)
+    try:
+        entry = _enum_mapping_cache.get(key)
+    except TypeError:
+        # Unhashable formatting key:
+        return _compute_enum_mappings(values, strfunc)
+
+    version = _enum_values_version(values)
+    if (
+        entry is not None
+        and entry[0] is values
+        and entry[1] is version
+        and _same_enum_items(entry[2], values)
+    ):
+        _enum_mapping_cache.move_to_end(key)
+        return entry[3]
+
+    result = _compute_enum_mappings(values, strfunc)
+    items = tuple(_enum_items(values))
+    _enum_mapping_cache[key] = (values, version, items, result)
+    _enum_mapping_cache.move_to_end(key)
+    if len(_enum_mapping_cache) > ENUM_MAPPING_CACHE_SIZE:
+        _enum_mapping_cache.popitem(last=False)
+
+    return result
+
+
+def invalidate_enum_values(values, change=None):
+    """Invalidates the memoised mappings of a source of enumeration values.
+
+    Parameters
+    ----------
+    values : sequence, dict, CTrait or BaseTraitHandler
+        The source of the enumeration values, which has been modified.
+    change : object or None
+        The change event of the modification.  Invalidating a source again
+        for the same change does nothing, so that the editors notified of
+        the same change share the mappings they recompute.  If None, the
+        mappings are always invalidated.
+    """
+    key = id(values)
+    entry = _enum_values_versions.get(key)
+    if (
+        change is not None
+        and entry is not None
+        and entry[0] is values
+        and entry[1] is change
+    ):
+        return
+
+    _enum_values_versions[key] = (
+        values,
+        object() if change is None else change,
+    )
+    for cache_key, entry in list(_enum_mapping_cache.items()):
+        if entry[0] is values:
+            del _enum_mapping_cache[cache_key]
+    _enum_values_versions.move_to_end(key)
+    if len(_enum_values_versions) > ENUM_MAPPING_CACHE_SIZE:
+        _enum_values_versions.popitem(last=False)
+
+
+def _enum_values_version(values):
+    """Returns the token of the current version of a source of enumeration
+    values, or None if it has not been modified.
+    """
+    entry = _enum_values_versions.get(id(values))
+    if entry is None or entry[0] is not values:
+        return None
+    return entry[1]
+
+
+def _enum_items(values):
+    """Yields the items of a source of enumeration values which its mappings
+    are computed from.
+    """
+    if isinstance(values, dict):
+        for name, value in values.items():
+            yield name
+            yield value
+    elif not isinstance(values, SequenceTypes):
+        handler = values
+        if isinstance(handler, CTrait):
+            handler = handler.handler
+        if handler.is_mapped:
+            yield from handler.map.keys()
+        else:
+            yield from handler.values
+    else:
+        yield from values
+
+
+def _same_enum_items(items, values):
+    """Returns whether a source of enumeration values holds the same items
+    (by identity) as when its mappings were computed.
+    """
+    n_items = len(items)
+    i = 0
+    for item in _enum_items(values):
+        if i >= n_items or items[i] is not item:
+            return False
+        i += 1
+    return i == n_items
+
+
+def _compute_enum_mappings(values, strfunc):
+    """Computes the mappings for a set of enumeration values."""
 
     if isinstance(values, dict):
         data = [(strfunc(v), n) for n, v in values.items()]
@@ -257,6 +257,16 @@ class Item(ViewSubElement):
     #: status (passed through to the item's editor):
     invalid = Str()
 
+    #: Should a read-only item be displayed as a plain label, without creating
+    #: an editor for it? This only applies to items using the default editor
+    #: of a scalar trait (such as an Int, Float or Str) and the 'readonly'
+    #: style, and is currently only supported by the Qt toolkit. Such items
+    #: support formatting and the **visible_when** and **enabled_when**
+    #: conditions, use less memory and are faster to create, which matters
+    #: for views displaying thousands of values. However they are not
+    #: returned by ``UI.get_editors``, nor bound to the UIInfo object.
+    lightweight = Bool(False)
+
     def __init__(self, value=None, **traits):
         """Initializes the item object."""
         super().__init__(**traits)
@@ -117,6 +117,15 @@ class KeyBindings(HasPrivateTraits):
     #: The child KeyBindings of this object (if any):
     children = List(transient=True)
 
+    #: Lazily built mapping from key names to the matching bindings of this
+    #: object, as (KeyBindings, KeyBinding, method name, methods) tuples where
+    #: methods are the resolved methods of this object's controllers:
+    _own_index = Any(transient=True)
+
+    #: Lazily built mapping like '_own_index' for this object and all of its
+    #: descendants, in the order that they are searched:
+    _tree_index = Any(transient=True)
+
     # -------------------------------------------------------------------------
     #  Traits view definitions:
     # -------------------------------------------------------------------------
@@ -175,6 +184,7 @@ class KeyBindings(HasPrivateTraits):
         del self.bindings
 
         self.parent = self._root = None
+        self._own_index = self._tree_index = None
 
     def edit(self):
         """Edits a possibly hierarchical set of KeyBindings."""
@@ -198,6 +208,7 @@ class KeyBindings(HasPrivateTraits):
         if event.new != "":
             for a_binding in self._match_binding(event.new, skip={event.object}):
                 a_binding.clear_binding(event.new)
+        self._invalidate_index()
 
     @observe("children.items")
     def _children_modified(self, event):
@@ -210,6 +221,20 @@ class KeyBindings(HasPrivateTraits):
         else:
             for item in event.added:
                 item.parent = self
+        self._invalidate_index()
+
+    @observe(
+        [
+            "bindings.items",
+            "bindings:items:method_name",
+            "prefix",
+            "suffix",
+            "controllers.items",
+        ]
+    )
+    def _dispatch_modified(self, event):
+        """Handles changes which affect which methods a key dispatches to."""
+        self._invalidate_index()
 
     # -- Private Methods ------------------------------------------------------
 
@@ -225,33 +250,82 @@ class KeyBindings(HasPrivateTraits):
         """Process the specified key for the specified set of controllers for
         this KeyBindings object and all of its children.
         """
-        # Search through our own bindings for a match:
-        for binding in self._match_binding(key_name):
-            method_name = "%s%s%s" % (
-                self.prefix,
-                binding.method_name,
-                self.suffix,
-            )
-            for controller in controllers + self.controllers:
+        # Look up the matching bindings of this object (and, if recursive,
+        # of its children) in the dispatch index:
+        if recursive:
+            entries = self._get_tree_index().get(key_name, ())
+        else:
+            entries = self._get_own_index().get(key_name, ())
+
+        for owner, binding, method_name, methods in entries:
+            for controller in controllers:
                 method = getattr(controller, method_name, None)
                 if method is not None:
                     result = method(*args)
                     if result is not False:
                         return True
 
+            for method in methods:
+                result = method(*args)
+                if result is not False:
+                    return True
+
             if binding.method_name == "edit_bindings":
-                self.edit()
+                owner.edit()
                 return True
 
-        # If recursive, continue searching through a children's bindings:
-        if recursive:
-            for child in self.children:
-                if child._do(key_name, controllers, args, recursive):
-                    return True
-
         # Indicate no one processed the key:
         return False
 
+    def _get_own_index(self):
+        """Returns the dispatch index for the bindings of this object."""
+        if self._own_index is None:
+            index = {}
+            for binding in self.bindings:
+                method_name = "%s%s%s" % (
+                    self.prefix,
+                    binding.method_name,
+                    self.suffix,
+                )
+                methods = [
+                    method
+                    for method in (
+                        getattr(controller, method_name, None)
+                        for controller in self.controllers
+                    )
+                    if method is not None
+                ]
+                entry = (self, binding, method_name, methods)
+                for key_name in {binding.binding1, binding.binding2}:
+                    index.setdefault(key_name, []).append(entry)
+            self._own_index = index
+
+        return self._own_index
+
+    def _get_tree_index(self):
+        """Returns the dispatch index for the bindings of this object and all
+        of its descendants.
+        """
+        if self._tree_index is None:
+            index = {
+                key_name: list(entries)
+                for key_name, entries in self._get_own_index().items()
+            }
+            for child in self.children:
+                for key_name, entries in child._get_tree_index().items():
+                    index.setdefault(key_name, []).extend(entries)
+            self._tree_index = index
+
+        return self._tree_index
+
+    def _invalidate_index(self):
+        """Discards the dispatch indices which include this object."""
+        self._own_index = None
+        key_bindings = self
+        while key_bindings is not None:
+            key_bindings._tree_index = None
+            key_bindings = key_bindings.parent
+
     def _match_binding(self, binding, skip=frozenset()):
         """Return all KeyBinding instances that match the given binding.
         """
@@ -0,0 +1,310 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Opt-in instrumentation of the phases of building a user interface.
+
+Profiling is enabled either by using the :func:`profile_ui` context manager,
+which collects everything built while it is active into a :class:`UIProfile`,
+or by setting the ``TRAITSUI_PROFILE_UI`` environment variable to the path of
+a directory, in which case a Chrome trace-event JSON file is written to that
+directory for every top-level view that is built.
+
+When profiling is not active, :func:`record` returns a shared context manager
+which does nothing and the functions decorated with :func:`recorded` are
+called directly, so the instrumentation only costs a check of the active
+profile.
+"""
+
+import functools
+import itertools
+import json
+import os
+import threading
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+#: The environment variable used to request automatic profiling.
+PROFILE_ENV_VAR = "TRAITSUI_PROFILE_UI"
+
+#: The profile currently collecting timings (if any).
+_active_profile = None
+
+#: Counter used to generate unique trace file names.
+_trace_counter = itertools.count()
+
+#: The context manager returned by record when profiling is not active.
+_null_record = nullcontext()
+
+
+class TimingStats:
+    """Accumulated timings for a set of similar operations.
+
+    Attributes
+    ----------
+    count : int
+        The number of times the operation was performed.
+    total : float
+        The total time spent in the operation, in seconds.
+    widgets : int
+        The number of toolkit widgets created by the operation, where known.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.widgets = 0
+
+    @property
+    def mean(self):
+        """The mean time spent in the operation, in seconds."""
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+    def __repr__(self):
+        return "{}(count={}, total={:.6f}, widgets={})".format(
+            self.__class__.__name__, self.count, self.total, self.widgets
+        )
+
+
+class UIProfile:
+    """The timings collected while building one or more user interfaces.
+
+    Attributes
+    ----------
+    phases : dict of str: TimingStats
+        Timings of the construction phases (eg. "View.ui", "prepare_ui",
+        "restore_prefs"), keyed by phase name.
+    editors : dict of str: TimingStats
+        Timings of ``Editor.prepare`` keyed by editor class name.  The widget
+        counts are those of the editors' controls.
+    items : dict of str: TimingStats
+        Timings of building each Item (including its editor and label) keyed
+        by the Item's id, or name if it has no id.
+    events : list of tuple
+        The raw (name, category, start, end, args) records, with times in
+        seconds as returned by :func:`time.perf_counter`.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.editors = {}
+        self.items = {}
+        self.events = []
+        self._thread_id = threading.get_ident()
+
+    @property
+    def total_widgets(self):
+        """The total number of widgets created by the profiled editors."""
+        return sum(stats.widgets for stats in self.editors.values())
+
+    def add_event(self, name, category, start, end, args=None):
+        """Adds a timing record to the profile.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase, editor class or item.
+        category : str
+            One of "phase", "editor" or "item".  Other categories are only
+            included in the trace events.
+        start, end : float
+            The start and end times as returned by :func:`time.perf_counter`.
+        args : dict or None
+            Additional information about the record.  A "widgets" value is
+            accumulated in the corresponding statistics, and for "item"
+            records an "editor" value gives the editor class the widgets are
+            accumulated against.
+        """
+        args = {} if args is None else args
+        self.events.append((name, category, start, end, args))
+
+        if category == "phase":
+            stats = self.phases.setdefault(name, TimingStats())
+        elif category == "editor":
+            stats = self.editors.setdefault(name, TimingStats())
+        elif category == "item":
+            stats = self.items.setdefault(name, TimingStats())
+        else:
+            return
+
+        widgets = args.get("widgets", 0)
+        stats.count += 1
+        stats.total += end - start
+        stats.widgets += widgets
+        if category == "item" and "editor" in args:
+            editor_stats = self.editors.setdefault(
+                args["editor"], TimingStats()
+            )
+            editor_stats.widgets += widgets
+
+    def to_chrome_trace(self):
+        """Returns the profile in the Chrome trace-event format.
+
+        The result can be serialized as JSON and loaded into a trace viewer
+        such as ``chrome://tracing`` or Perfetto.
+
+        Returns
+        -------
+        trace : dict
+            A dictionary with a "traceEvents" list of complete ("X") events.
+        """
+        pid = os.getpid()
+        trace_events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": self._thread_id,
+                "args": {key: str(value) for key, value in args.items()},
+            }
+            for name, category, start, end, args in self.events
+        ]
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        """Writes the profile to a file in the Chrome trace-event format.
+
+        Parameters
+        ----------
+        path : str
+            The path of the JSON file to write.
+        """
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.to_chrome_trace(), trace_file)
+
+
+def active_profile():
+    """Returns the UIProfile collecting timings, or None if not profiling."""
+    return _active_profile
+
+
+@contextmanager
+def profile_ui(trace_file=None):
+    """Context manager that profiles the user interfaces built within it.
+
+    Profiles may be nested, in which case the inner profile collects the
+    timings while it is active.
+
+    Parameters
+    ----------
+    trace_file : str or None
+        If given, the path of a file to write the collected timings to in the
+        Chrome trace-event format when the context exits.
+
+    Yields
+    ------
+    profile : UIProfile
+        The object in which timings are collected.
+    """
+    global _active_profile
+
+    previous = _active_profile
+    profile = _active_profile = UIProfile()
+    try:
+        yield profile
+    finally:
+        _active_profile = previous
+        if trace_file is not None:
+            profile.write_chrome_trace(trace_file)
+
+
+def record(name, category="phase", args=None):
+    """Context manager that records the time spent in a block.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase, editor class or item.
+    category : str
+        The category of the record; see :meth:`UIProfile.add_event`.
+    args : dict or None
+        Additional information about the record.
+
+    Yields
+    ------
+    args : dict or None
+        The dictionary of additional information, which the block may add to,
+        or None if profiling is not active.
+    """
+    profile = _active_profile
+    if profile is None:
+        return _null_record
+
+    return _record(profile, name, category, args)
+
+
+def recorded(name, category="phase"):
+    """Decorator recording the time spent in each call of a function.
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase, editor class or item.
+    category : str
+        The category of the record; see :meth:`UIProfile.add_event`.
+    """
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profile = _active_profile
+            if profile is None:
+                return function(*args, **kwargs)
+
+            with _record(profile, name, category, None):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def _record(profile, name, category, args):
+    """Context manager adding the time spent in a block to a profile."""
+    args = {} if args is None else args
+    start = perf_counter()
+    try:
+        yield args
+    finally:
+        profile.add_event(name, category, start, perf_counter(), args)
+
+
+@contextmanager
+def record_view(view, kind):
+    """Context manager that records building a view.
+
+    If no profile is active and the ``TRAITSUI_PROFILE_UI`` environment
+    variable is set, the view is profiled and a trace file is written to the
+    directory named by the variable.
+
+    Parameters
+    ----------
+    view : View
+        The view being built.
+    kind : str
+        The kind of user interface being built.
+    """
+    directory = os.environ.get(PROFILE_ENV_VAR)
+    if _active_profile is None and directory:
+        file_name = "traitsui-profile-{}-{}.json".format(
+            os.getpid(), next(_trace_counter)
+        )
+        trace_file = os.path.join(directory, file_name)
+        with profile_ui(trace_file=trace_file):
+            with record("View.ui", args={"title": view.title, "kind": kind}):
+                yield
+    else:
+        with record("View.ui", args={"title": view.title, "kind": kind}):
+            yield
@@ -21,13 +21,139 @@
 # ------------------------------------------------------------------------------
 
 """ Implements a wrapper around the PyQt clipboard that handles Python objects
-using pickle.
+using pickle, and the MIME data used to drag Python objects.
 """
 
-from pyface.qt import QtGui
+from itertools import count
+from pickle import dumps, PickleError
+from uuid import uuid4
+import warnings
+from weakref import WeakValueDictionary
+
+from pyface.qt import QtCore, QtGui
 from pyface.ui.qt.mimedata import PyMimeData, str2bytes
 from traits.api import HasTraits, Instance, Property
 
+#: The MIME type of the token identifying MIME data created by this process.
+LOCAL_MIME_TYPE = "application/x-traitsui-local-instance"
+
+#: The LocalPyMimeData instances alive, keyed by token.
+_local_mime_data = WeakValueDictionary()
+
+#: The source of the tokens of LocalPyMimeData instances, which are prefixed
+#: with an identifier of the process.
+_tokens = count()
+_process_id = uuid4().hex
+
+
+class LocalPyMimeData(PyMimeData):
+    """MIME data passing Python objects by reference within the process.
+
+    The objects are dragged to widgets of the same process by reference,
+    through a token identifying the MIME data.  The pickled format is listed
+    without pickling the objects, which are only pickled when its data is
+    requested, eg. by another application, so starting a drag is cheap and
+    unpicklable objects can be dragged within the application.  If an object
+    cannot be pickled, the data requested is a pickle of None (which
+    PyMimeData reads as no instance), and from then on the pickled format is
+    no longer listed and ``NOPICKLE_MIME_TYPE`` is set, as for PyMimeData.
+
+    Parameters
+    ----------
+    data : any
+        The Python object to wrap.
+    pickle : bool
+        Whether the object is made available to other applications by
+        pickling it.
+    """
+
+    def __init__(self, data=None, pickle=True):
+        QtCore.QMimeData.__init__(self)
+
+        self._local_instance = data
+        self._pickle = pickle and data is not None
+        self._pickled = None
+
+        if not pickle:
+            self.setData(self.NOPICKLE_MIME_TYPE, str2bytes(str(id(data))))
+
+        if data is not None:
+            token = "{}:{}".format(_process_id, next(_tokens))
+            _local_mime_data[token] = self
+            self.setData(LOCAL_MIME_TYPE, str2bytes(token))
+
+    # -- QMimeData interface --------------------------------------------------
+
+    def formats(self):
+        """Reimplemented to include the pickled format, if available."""
+        formats = super().formats()
+        if self._pickle and self.MIME_TYPE not in formats:
+            formats.append(self.MIME_TYPE)
+        return formats
+
+    def hasFormat(self, mime_type):
+        """Reimplemented to include the pickled format, if available."""
+        if mime_type == self.MIME_TYPE:
+            return self._pickle
+        return mime_type in super().formats()
+
+    def retrieveData(self, mime_type, preferred_type):
+        """Reimplemented to pickle the object when it is first requested."""
+        if mime_type == self.MIME_TYPE:
+            pickled = self._pickled_data()
+            if pickled is not None:
+                return pickled
+        return super().retrieveData(mime_type, preferred_type)
+
+    # -- Private methods ------------------------------------------------------
+
+    def _pickled_data(self):
+        """Returns the pickled object, pickling it when first requested, or
+        None if it is not pickled.
+        """
+        if self._pickle and self._pickled is None:
+            data = self._local_instance
+            try:
+                self._pickled = QtCore.QByteArray(
+                    dumps(data.__class__) + dumps(data)
+                )
+            except (PickleError, TypeError, AttributeError):
+                self._pickle = False
+                warnings.warn(
+                    "Could not pickle dragged object {!r}, using {} "
+                    "mimetype instead".format(data, self.NOPICKLE_MIME_TYPE),
+                    RuntimeWarning,
+                )
+                self.setData(
+                    self.NOPICKLE_MIME_TYPE, str2bytes(str(id(data)))
+                )
+                # The format may have been listed already, so its data must
+                # still be readable:
+                self._pickled = QtCore.QByteArray(
+                    dumps(type(None)) + dumps(None)
+                )
+        return self._pickled
+
+
+def instance_from_mime_data(mime_data):
+    """Returns the Python object of dragged or copied MIME data, or None.
+
+    Objects dragged from this process with :class:`LocalPyMimeData` are
+    returned by reference, without unpickling them.
+
+    Parameters
+    ----------
+    mime_data : QMimeData
+        The MIME data, eg. of a drop event.
+    """
+    if mime_data.hasFormat(LOCAL_MIME_TYPE):
+        token = bytes(mime_data.data(LOCAL_MIME_TYPE)).decode("ascii")
+        local_mime_data = _local_mime_data.get(token)
+        if local_mime_data is not None:
+            return local_mime_data.instance()
+
+    return PyMimeData.coerce(mime_data).instance()
+
 
 # -------------------------------------------------------------------------
 #  '_Clipboard' class:
@@ -25,7 +25,7 @@ interface toolkit, useful for tools such as debuggers.
 """
 
 
-from pyface.qt import QtGui
+from pyface.qt import QtCore, QtGui
 from pyface.key_pressed_event import KeyPressedEvent
 from pyface.ui.qt.code_editor.code_widget import AdvancedCodeWidget
 from traits.api import (
@@ -42,6 +42,7 @@ from traits.trait_base import SequenceTypes
 from .constants import OKColor, ErrorColor
 from .editor import Editor
 from .helper import pixmap_cache
+from .incremental_text import update_text
 
 
 # Marker line constants:
@@ -129,10 +130,22 @@ class SourceEditor(Editor):
         # Set up listeners for the signals we care about
         code_editor = self._widget.code
 
-        if self.readonly:
+        if factory.max_lines > 0:
+            code_editor.setMaximumBlockCount(factory.max_lines)
+            code_editor.setUndoRedoEnabled(False)
+
+        if self.readonly or factory.max_lines > 0:
             code_editor.setReadOnly(True)
         else:
-            if factory.auto_set:
+            if factory.auto_set and factory.auto_set_delay > 0:
+                # Set the value once the user stops typing (or leaves):
+                self._update_timer = timer = QtCore.QTimer()
+                timer.setSingleShot(True)
+                timer.setInterval(factory.auto_set_delay)
+                timer.timeout.connect(self.update_object)
+                code_editor.textChanged.connect(self._schedule_update_object)
+                code_editor.focus_lost.connect(self._flush_update_object)
+            elif factory.auto_set:
                 code_editor.textChanged.connect(self.update_object)
             else:
                 code_editor.focus_lost.connect(self.update_object)
@@ -178,7 +191,15 @@ class SourceEditor(Editor):
         """Disposes of the contents of an editor."""
         # Make sure that the editor does not try to update as the control is
         # being destroyed:
-        if not self.factory.auto_set:
+        if self._update_timer is not None:
+            self._update_timer.stop()
+            self._update_timer.timeout.disconnect(self.update_object)
+            self._widget.code.focus_lost.disconnect(self._flush_update_object)
+        elif not (
+            self.factory.auto_set
+            or self.readonly
+            or self.factory.max_lines > 0
+        ):
             self._widget.code.focus_lost.disconnect(self.update_object)
 
         super().dispose()
@@ -187,7 +208,11 @@ class SourceEditor(Editor):
         """Handles the user entering input data in the edit control."""
         if not self._locked:
             try:
-                value = str(self._widget.code.toPlainText())
+                code = self._widget.code
+                value = str(code.toPlainText())
+                if self.factory.incremental:
+                    self._displayed_text = value
+                    code.document().setModified(False)
                 if isinstance(self.value, SequenceTypes):
                     value = value.split()
                 self.value = value
@@ -203,7 +228,9 @@ class SourceEditor(Editor):
         if isinstance(new_value, SequenceTypes):
             new_value = "\n".join([line.rstrip() for line in new_value])
         control = self._widget
-        if control.code.toPlainText() != new_value:
+        if self.factory.incremental or self.factory.max_lines > 0:
+            self._update_document(new_value)
+        elif control.code.toPlainText() != new_value:
             control.code.setPlainText(new_value)
 
             if self.factory.selected_line:
@@ -218,6 +245,30 @@ class SourceEditor(Editor):
         """Handles an error that occurs while setting the object's trait value."""
         pass
 
+    def _update_document(self, text):
+        """Updates the document incrementally to display a text."""
+        code = self._widget.code
+        document = code.document()
+        old_text = self._displayed_text
+        if old_text is not None and document.isModified():
+            # The user has edited the text since it was last displayed:
+            old_text = code.toPlainText()
+        if old_text != text:
+            update_text(code, old_text, text, self.factory.max_lines)
+        self._displayed_text = text
+        document.setModified(False)
+
+    def _schedule_update_object(self):
+        """Restarts the delay before setting the user input."""
+        if not self._locked:
+            self._update_timer.start()
+
+    def _flush_update_object(self):
+        """Sets the user input now if it is waiting for the delay."""
+        if self._update_timer.isActive():
+            self._update_timer.stop()
+            self.update_object()
+
     # -- UI preference save/restore interface ---------------------------------
 
     def restore_prefs(self, prefs):
@@ -0,0 +1,277 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Lightweight display of read-only Items as labels, without creating an
+Editor for each of them.
+
+This is used for Items with ``lightweight`` set, which is useful for views
+displaying a large number of read-only values: the labels of a UI share a
+single trait change listener per displayed trait, the formatting of their
+values is shared between Items with the same formatting, and the labels are
+updated at most once per iteration of the event loop.
+"""
+
+from weakref import WeakValueDictionary
+
+from pyface.api import GUI
+from pyface.qt import QtGui
+from traits.api import Undefined
+
+from traitsui.editor_factory import EditorFactory
+
+from .editor import Editor
+from .editor_factory import ReadonlyEditor
+from .text_editor import ReadonlyEditor as TextReadonlyEditor
+
+#: The shared formatters, keyed by (format_func, format_str).
+_formatters = WeakValueDictionary()
+
+
+class DisplayFormatter:
+    """Formats values for display in the same way as
+    ``EditorFactory.string_value``.
+
+    Use :func:`get_formatter` to get a shared instance.
+    """
+
+    __slots__ = ("format_func", "format_str", "__weakref__")
+
+    def __init__(self, format_func=None, format_str=""):
+        self.format_func = format_func
+        self.format_str = format_str
+
+    def __call__(self, value):
+        if self.format_func is not None:
+            return self.format_func(value)
+
+        if self.format_str != "":
+            return self.format_str % value
+
+        return str(value)
+
+
+def get_formatter(format_func=None, format_str=""):
+    """Returns the formatter shared by Items with the given formatting.
+
+    Parameters
+    ----------
+    format_func : callable or None
+        The function formatting values, if any.
+    format_str : str
+        The %-style format string used if there is no format function.
+
+    Returns
+    -------
+    formatter : DisplayFormatter
+    """
+    key = (format_func, format_str)
+    try:
+        formatter = _formatters.get(key)
+    except TypeError:
+        # The format function is not hashable:
+        return DisplayFormatter(format_func, format_str)
+
+    if formatter is None:
+        formatter = _formatters[key] = DisplayFormatter(
+            format_func, format_str
+        )
+    return formatter
+
+
+def can_display(item, factory):
+    """Returns whether an Item can be displayed by a DisplayItem.
+
+    This is the case for read-only Items requesting it whose editor would be
+    a plain text label, i.e. the default editor of a scalar trait such as an
+    Int, Float or Str, and which do not request an explicit size.  Items of
+    an extended name such as ``object.link.value`` are not displayed, as
+    their object is only evaluated once.
+
+    Parameters
+    ----------
+    item : Item
+        The Item being displayed.
+    factory : EditorFactory
+        The default editor factory for the Item's trait.
+    """
+    return (
+        item.lightweight
+        and item.style == "readonly"
+        and "." not in item.object
+        and item.editor is None
+        and item.invalid == ""
+        and item.width == -1.0
+        and item.height == -1.0
+        and factory.invalid == ""
+        and not getattr(factory, "password", False)
+        and type(factory).string_value is EditorFactory.string_value
+        and factory.readonly_editor_class
+        in (ReadonlyEditor, TextReadonlyEditor)
+    )
+
+
+class DisplayItem:
+    """A read-only Item displayed as a label.
+
+    Display items support the ``visible`` and ``enabled`` states set by the
+    UI for the ``visible_when`` and ``enabled_when`` conditions of the Item.
+    """
+
+    __slots__ = (
+        "object",
+        "name",
+        "formatter",
+        "control",
+        "label_control",
+        "_visible",
+        "_enabled",
+    )
+
+    #: Display items are never scrollable.
+    scrollable = False
+
+    # Size policies are set in the same way as for editors:
+    set_size_policy = Editor.set_size_policy
+
+    def __init__(self, object, name, formatter, item, factory, desc=""):
+        self.object = object
+        self.name = name
+        self.formatter = formatter
+        self.label_control = None
+        self._visible = True
+        self._enabled = True
+
+        self.control = control = QtGui.QLabel(self.str_value)
+        if item.resizable is True:
+            control.setWordWrap(True)
+
+        alignment = None
+        for name in factory.text_alignment.split(","):
+            item_alignment = ReadonlyEditor.text_alignment_map.get(name)
+            if item_alignment:
+                if alignment:
+                    alignment = alignment | item_alignment
+                else:
+                    alignment = item_alignment
+        if alignment:
+            control.setAlignment(alignment)
+
+        tooltip = item.tooltip or desc
+        if tooltip:
+            control.setToolTip(tooltip)
+
+    @property
+    def str_value(self):
+        """The text representation of the value."""
+        return self.formatter(getattr(self.object, self.name, Undefined))
+
+    @property
+    def visible(self):
+        """Whether the item is visible."""
+        return self._visible
+
+    @visible.setter
+    def visible(self, visible):
+        self._visible = visible
+        if self.control is not None:
+            self.control.setVisible(visible)
+        if self.label_control is not None:
+            self.label_control.setVisible(visible)
+
+    @property
+    def enabled(self):
+        """Whether the item is enabled."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self._enabled = enabled
+        if self.control is not None:
+            self.control.setEnabled(enabled)
+        if self.label_control is not None:
+            self.label_control.setEnabled(enabled)
+
+    def update(self):
+        """Updates the label from the current value."""
+        if self.control is not None:
+            self.control.setText(self.str_value)
+
+
+class DisplayItemRouter:
+    """Routes the trait changes of the objects of a UI to its display items.
+
+    A single listener is added for each displayed trait of an object, which
+    is notified on the UI thread.  Changes are collected and the labels
+    affected are updated together on the next iteration of the event loop.
+
+    The router is registered as one of the UI's dispatchers, so that it is
+    removed when the UI is reset or disposed.
+    """
+
+    def __init__(self):
+        # Display items keyed by (object id, trait name):
+        self._items = {}
+        # The objects listened to, keyed by id:
+        self._objects = {}
+        # Display items waiting for an update, in the order of the changes:
+        self._pending = {}
+        self._scheduled = False
+        self._removed = False
+
+    def add(self, display_item):
+        """Adds a display item to update when its trait changes."""
+        object = display_item.object
+        key = (id(object), display_item.name)
+        display_items = self._items.get(key)
+        if display_items is None:
+            display_items = self._items[key] = []
+            self._objects[id(object)] = object
+            object.on_trait_change(
+                self._trait_changed, display_item.name, dispatch="ui"
+            )
+        display_items.append(display_item)
+
+    def remove(self):
+        """Removes the listeners of the router."""
+        self._removed = True
+        for object_id, name in self._items:
+            self._objects[object_id].on_trait_change(
+                self._trait_changed, name, remove=True
+            )
+        for display_items in self._items.values():
+            for display_item in display_items:
+                display_item.control = None
+                display_item.label_control = None
+        self._objects.clear()
+        self._items.clear()
+        self._pending.clear()
+
+    def _trait_changed(self, object, name, old, new):
+        """Queues the update of the display items of a trait."""
+        display_items = self._items.get((id(object), name))
+        if display_items is None:
+            return
+
+        for display_item in display_items:
+            self._pending[display_item] = None
+
+        if not self._scheduled:
+            self._scheduled = True
+            GUI.invoke_later(self._flush)
+
+    def _flush(self):
+        """Updates the display items with pending changes."""
+        self._scheduled = False
+        pending, self._pending = self._pending, {}
+        if self._removed:
+            return
+
+        for display_item in pending:
+            display_item.update()
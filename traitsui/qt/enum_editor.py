@@ -31,7 +31,7 @@ from pyface.qt import QtCore, QtGui, is_pyside
 
 from traits.api import Bool, Property
 
-from traitsui.helper import enum_values_changed
+from traitsui.helper import enum_values_changed, invalidate_enum_values
 from .constants import OKColor, ErrorColor
 from .editor import Editor
 
@@ -41,6 +41,118 @@ completion_mode_map = {
 }
 
 
+class EnumListModel(QtCore.QAbstractListModel):
+    """A list model presenting the names of an enumeration.
+
+    Changes to the names are applied with :meth:`set_names`, which emits
+    the minimal row insertions, removals and data changes rather than
+    resetting the model, so that views over very large enumerations stay
+    responsive when the values change.
+
+    Parameters
+    ----------
+    names : sequence of str
+        The names to display.
+    separator : str or None
+        If not None, names equal to this are displayed as separators.
+    parent : QObject or None
+        The parent of the model.
+    """
+
+    def __init__(self, names=(), separator=None, parent=None):
+        super().__init__(parent)
+        self._names = list(names)
+        self._separator = separator
+
+    def set_names(self, names):
+        """Replaces the names, emitting only the changes.
+
+        The rows shared by the start and end of the old and new names are
+        kept; the differing rows between them are updated in place and the
+        remainder inserted or removed.
+
+        Parameters
+        ----------
+        names : sequence of str
+            The new names to display.
+        """
+        old = self._names
+        new = list(names)
+        if old == new:
+            return
+
+        # Find the common prefix and suffix of the old and new names:
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and old[start] == new[start]:
+            start += 1
+        old_end = len(old)
+        new_end = len(new)
+        while (
+            old_end > start
+            and new_end > start
+            and old[old_end - 1] == new[new_end - 1]
+        ):
+            old_end -= 1
+            new_end -= 1
+
+        # Update the rows which are replaced in place:
+        n_changed = min(old_end, new_end) - start
+        if n_changed > 0:
+            old[start : start + n_changed] = new[start : start + n_changed]
+            self.dataChanged.emit(
+                self.index(start), self.index(start + n_changed - 1)
+            )
+
+        # Insert or remove the remaining rows:
+        position = start + n_changed
+        if old_end > new_end:
+            self.beginRemoveRows(QtCore.QModelIndex(), position, old_end - 1)
+            del old[position:old_end]
+            self.endRemoveRows()
+        elif new_end > old_end:
+            self.beginInsertRows(QtCore.QModelIndex(), position, new_end - 1)
+            old[position:position] = new[position:new_end]
+            self.endInsertRows()
+
+    def is_separator(self, row):
+        """Returns whether the given row is displayed as a separator."""
+        return (
+            self._separator is not None and self._names[row] == self._separator
+        )
+
+    # -- QAbstractListModel Interface ----------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if self.is_separator(row):
+            # This is how QComboBox recognizes separators:
+            if role == QtCore.Qt.ItemDataRole.AccessibleDescriptionRole:
+                return "separator"
+            return None
+
+        if role in {
+            QtCore.Qt.ItemDataRole.DisplayRole,
+            QtCore.Qt.ItemDataRole.EditRole,
+        }:
+            return self._names[row]
+
+        return None
+
+    def flags(self, index):
+        if index.isValid() and self.is_separator(index.row()):
+            return QtCore.Qt.ItemFlag.NoItemFlags
+        return super().flags(index)
+
+
 class BaseEditor(Editor):
     """Base class for enumeration editors."""
 
@@ -65,7 +177,21 @@ class BaseEditor(Editor):
             self._names,
             self._mapping,
             self._inverse_mapping,
-        ) = enum_values_changed(self._value(), self.string_value)
+        ) = enum_values_changed(
+            self._value(), self.string_value, self.string_value_key()
+        )
+
+        # Map each name to its (first) position, to avoid linear searches:
+        self._rows = {}
+        for row, name in enumerate(self._names):
+            self._rows.setdefault(name, row)
+
+    def row_for_value(self, value):
+        """Returns the position of a value in the names, or -1 if absent."""
+        try:
+            return self._rows.get(self.inverse_mapping[value], -1)
+        except Exception:
+            return -1
 
     def rebuild_editor(self):
         """Rebuilds the contents of the editor whenever the original factory
@@ -144,6 +270,13 @@ class BaseEditor(Editor):
         """Handles the underlying object model's enumeration set or factory's
         values being changed.
         """
+        # The editors notified of the same change share the added items (or
+        # the new value) of their events, which identifies the change:
+        if hasattr(event, "added"):
+            change = event.added
+        else:
+            change = event.new
+        invalidate_enum_values(self._value(), change)
         self.values_changed()
         self.rebuild_editor()
 
@@ -168,6 +301,8 @@ class SimpleEditor(BaseEditor):
 
         if self.factory.evaluate is not None:
             control.setEditable(True)
+            if self._model is not None:
+                control.setCompleter(self._create_completer())
             control.completer().setCompletionMode(
                 completion_mode_map[self.factory.completion_mode]
             )
@@ -189,11 +324,7 @@ class SimpleEditor(BaseEditor):
         if self._no_enum_update == 0:
             self._no_enum_update += 1
             if self.factory.evaluate is None:
-                try:
-                    index = self.names.index(self.inverse_mapping[self.value])
-                    self.control.setCurrentIndex(index)
-                except Exception:
-                    self.control.setCurrentIndex(-1)
+                self.control.setCurrentIndex(self.row_for_value(self.value))
             else:
                 try:
                     self.control.setEditText(self.str_value)
@@ -211,7 +342,8 @@ class SimpleEditor(BaseEditor):
         """
         self.control.blockSignals(True)
         try:
-            self.control.clear()
+            if self._model is None:
+                self.control.clear()
             self._add_items_to_combo_box()
         finally:
             self.control.blockSignals(False)
@@ -239,9 +371,50 @@ class SimpleEditor(BaseEditor):
         control.setSizePolicy(
             QtGui.QSizePolicy.Policy.Maximum, QtGui.QSizePolicy.Policy.Fixed
         )
+
+        if self.factory.use_separator:
+            separator = self.factory.separator
+        else:
+            separator = None
+        self._model = EnumListModel(separator=separator, parent=control)
+        control.setModel(self._model)
         return control
 
+    def _create_completer(self):
+        """Returns a completer which searches the names in sorted order."""
+        completer = QtGui.QCompleter(self.control)
+        completer.setCaseSensitivity(
+            QtCore.Qt.CaseSensitivity.CaseInsensitive
+        )
+        self._completion_model = EnumListModel(parent=completer)
+        self._update_completion_model()
+        completer.setModel(self._completion_model)
+        # As the model is sorted the completer can use a binary search:
+        completer.setModelSorting(
+            QtGui.QCompleter.ModelSorting.CaseInsensitivelySortedModel
+        )
+        return completer
+
+    def _update_completion_model(self):
+        """Updates the completion model to hold the sorted names."""
+        if self._completion_model is None:
+            return
+
+        separator = self._model._separator
+        self._completion_model.set_names(
+            sorted(
+                (name for name in self.names if name != separator),
+                key=str.casefold,
+            )
+        )
+
     def _add_items_to_combo_box(self):
+        if self._model is not None:
+            self._model.set_names(self.names)
+            self._update_completion_model()
+            return
+
+        # Combo boxes created by subclasses may have their own models:
         for name in self.names:
             if self.factory.use_separator and name == self.factory.separator:
                 self.control.insertSeparator(self.control.count())
@@ -432,8 +605,15 @@ class ListEditor(BaseEditor):
         """
         super().init(parent)
 
-        self.control = QtGui.QListWidget()
-        self.control.currentTextChanged.connect(self.update_object)
+        self.control = QtGui.QListView()
+        self.control.setSelectionMode(
+            QtGui.QAbstractItemView.SelectionMode.SingleSelection
+        )
+        self._model = EnumListModel(parent=self.control)
+        self.control.setModel(self._model)
+        self.control.selectionModel().currentChanged.connect(
+            self._on_current_changed
+        )
 
         self.rebuild_editor()
         self.set_tooltip()
@@ -442,30 +622,22 @@ class ListEditor(BaseEditor):
         """Updates the editor when the object trait changes externally to the
         editor.
         """
-        control = self.control
-        try:
-            value = self.inverse_mapping[self.value]
-
-            for row in range(control.count()):
-                itm = control.item(row)
-
-                if itm.text() == value:
-                    control.setCurrentItem(itm)
-                    control.scrollToItem(itm)
-                    break
-        except Exception:
-            pass
+        row = self.row_for_value(self.value)
+        if row >= 0:
+            index = self._model.index(row)
+            self.control.setCurrentIndex(index)
+            self.control.scrollTo(index)
 
     def rebuild_editor(self):
         """Rebuilds the contents of the editor whenever the original factory
         object's **values** trait changes.
         """
-
-        self.control.blockSignals(True)
-        self.control.clear()
-        for name in self.names:
-            self.control.addItem(name)
-        self.control.blockSignals(False)
+        selection_model = self.control.selectionModel()
+        selection_model.blockSignals(True)
+        try:
+            self._model.set_names(self.names)
+        finally:
+            selection_model.blockSignals(False)
 
         self.update_editor()
 
@@ -475,6 +647,11 @@ class ListEditor(BaseEditor):
 
     #  Signal handlers -------------------------------------------------------
 
+    def _on_current_changed(self, current, previous):
+        """Handles the current list box item changing."""
+        if current.isValid():
+            self.update_object(current.data())
+
     def update_object(self, text):
         """Handles the user selecting a list box item."""
         value = str(text)
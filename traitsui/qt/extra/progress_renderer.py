@@ -11,15 +11,30 @@
 """ A renderer which displays a progress bar. """
 
 # System library imports
-import sys
+from math import ceil
+
 from pyface.qt import QtCore, QtGui
 
 # ETS imports
+from traitsui.qt.helper import PixmapLRUCache
 from traitsui.qt.table_editor import TableDelegate
 
 
 class ProgressRenderer(TableDelegate):
-    """A renderer which displays a progress bar."""
+    """A renderer which displays a progress bar.
+
+    The progress bars are drawn once to pixmaps, which are cached for each
+    size and progress they are drawn at.
+    """
+
+    #: The maximum number of pixmaps cached by the renderer.
+    cache_size = 256
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+
+        # Pixmaps of progress bars, keyed by their sizes and options:
+        self._pixmaps = PixmapLRUCache(self.cache_size)
 
     # -------------------------------------------------------------------------
     #  QAbstractItemDelegate interface
@@ -27,34 +42,72 @@ class ProgressRenderer(TableDelegate):
 
     def paint(self, painter, option, index):
         """Paint the progressbar."""
+        rect = option.rect
+        if rect.isEmpty():
+            return
+
         # Get the column and object
         column = index.model()._editor.columns[index.column()]
         obj = index.data(QtCore.Qt.ItemDataRole.UserRole)
 
+        key = (
+            rect.width(),
+            rect.height(),
+            painter.device().devicePixelRatioF(),
+            column.get_minimum(obj),
+            column.get_maximum(obj),
+            int(column.get_raw_value(obj)),
+            column.get_text_visible(),
+            column.get_value(obj),
+        )
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._draw_progress_bar(*key)
+            self._pixmaps.set(key, pixmap)
+
+        painter.drawPixmap(rect.topLeft(), pixmap)
+
+    # -------------------------------------------------------------------------
+    #  Private methods
+    # -------------------------------------------------------------------------
+
+    def _draw_progress_bar(
+        self,
+        width,
+        height,
+        ratio,
+        minimum,
+        maximum,
+        progress,
+        text_visible,
+        text,
+    ):
+        """Draw a progress bar to a new pixmap."""
+        pixmap = QtGui.QPixmap(ceil(width * ratio), ceil(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+
         # set up progress bar options
         progress_bar_option = QtGui.QStyleOptionProgressBar()
-        progress_bar_option.rect = option.rect
-        progress_bar_option.minimum = column.get_minimum(obj)
-        progress_bar_option.maximum = column.get_maximum(obj)
-        progress_bar_option.progress = int(column.get_raw_value(obj))
-        progress_bar_option.textVisible = column.get_text_visible()
-        progress_bar_option.text = column.get_value(obj)
-
-        # Draw it
+        progress_bar_option.rect = QtCore.QRect(0, 0, width, height)
+        progress_bar_option.minimum = minimum
+        progress_bar_option.maximum = maximum
+        progress_bar_option.progress = progress
+        progress_bar_option.textVisible = text_visible
+        progress_bar_option.text = text
+
+        # Draw it.  As the progress bar is drawn at the origin, this also
+        # avoids the bars being drawn at the origin of the cells on Mac
+        # (enthought/traitsui#964).
         style = QtGui.QApplication.instance().style()
-        if sys.platform == "darwin":
-            # Save painter state, translate painter to cell location, and then
-            # restore painter state after drawing to solve enthought/traitsui#964
-            # This seems to be mac only.
-            # ref: https://forum.qt.io/topic/105375/qitemdelegate-for-drawing-progress-bar-working-but-won-t-move-off-origin  # noqa: E501
-            painter.save()
-            painter.translate(option.rect.left(), option.rect.top())
-            style.drawControl(
-                QtGui.QStyle.ControlElement.CE_ProgressBar, progress_bar_option, painter
-            )
-            painter.restore()
-        else:
-            # For non-mac platforms, just draw.
+        painter = QtGui.QPainter(pixmap)
+        try:
             style.drawControl(
-                QtGui.QStyle.ControlElement.CE_ProgressBar, progress_bar_option, painter
+                QtGui.QStyle.ControlElement.CE_ProgressBar,
+                progress_bar_option,
+                painter,
             )
+        finally:
+            painter.end()
+
+        return pixmap
@@ -13,21 +13,39 @@
 """
 
 # System library imports
+from math import ceil
+
 from pyface.qt import QtCore, QtGui
 
 # ETS imports
 from traits.api import Bool
+from traitsui.qt.helper import PixmapLRUCache
 from traitsui.qt.table_editor import TableDelegate
 
 
 class TableImageRenderer(TableDelegate):
     """A renderer which will display a cell-specific image in addition to some
     text displayed in the same way the default renderer would.
+
+    The pixmaps of the images are cached for each size and device pixel ratio
+    they are drawn at, so the images returned by get_image_for_obj should be shared by the cells
+    rather than created for each of them.
     """
 
     #: Should the image be scaled to the size of the cell
     scale_to_cell = Bool(True)
 
+    #: The maximum number of pixmaps cached by the renderer.
+    cache_size = 256
+
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+
+        # Pixmaps keyed by (image, width, height, device pixel ratio), and
+        # image sizes keyed by image:
+        self._pixmaps = PixmapLRUCache(self.cache_size)
+        self._image_sizes = PixmapLRUCache(self.cache_size)
+
     # -------------------------------------------------------------------------
     #  TableImageRenderer interface
     # -------------------------------------------------------------------------
@@ -38,6 +56,32 @@ class TableImageRenderer(TableDelegate):
         """
         return None
 
+    def get_image_size(self, image):
+        """Return the size of an image as a QSize.
+
+        The image is only loaded the first time its size is requested.
+        Subclasses whose image sizes are known may override this to avoid
+        loading images which are not painted.
+        """
+        size = self._image_sizes.get(image)
+        if size is None:
+            pixmap = image.create_bitmap()
+            size = pixmap.size()
+            self._image_sizes.set(image, size)
+            key = (
+                image,
+                size.width(),
+                size.height(),
+                pixmap.devicePixelRatio(),
+            )
+            self._pixmaps.set(key, pixmap)
+        return size
+
+    def clear_cache(self):
+        """Discard the cached pixmaps, eg. when the images are modified."""
+        self._pixmaps.clear()
+        self._image_sizes.clear()
+
     # -------------------------------------------------------------------------
     #  QAbstractItemDelegate interface
     # -------------------------------------------------------------------------
@@ -51,19 +95,18 @@ class TableImageRenderer(TableDelegate):
         value = index.data(QtCore.Qt.ItemDataRole.UserRole)
         image = self.get_image_for_obj(value, index.row(), index.column())
         if image:
-            image = image.create_bitmap()
+            size = self.get_image_size(image)
+            w = size.width()
+            h = size.height()
             if self.scale_to_cell:
-                w = min(image.width(), option.rect.width())
-                h = min(image.height(), option.rect.height())
-            else:
-                w = image.width()
-                h = image.height()
+                w = min(w, option.rect.width())
+                h = min(h, option.rect.height())
 
             x = option.rect.x()
-            y = option.rect.y() + (option.rect.height() - h) / 2
+            y = option.rect.y() + (option.rect.height() - h) // 2
 
-            target = QtCore.QRect(x, y, w, h)
-            painter.drawPixmap(target, image)
+            ratio = painter.device().devicePixelRatioF()
+            painter.drawPixmap(x, y, self._get_pixmap(image, w, h, ratio))
 
     def sizeHint(self, option, index):
         """Overriden to take image size into account when providing a size
@@ -74,8 +117,39 @@ class TableImageRenderer(TableDelegate):
         value = index.data(QtCore.Qt.ItemDataRole.UserRole)
         image = self.get_image_for_obj(value, index.row(), index.column())
         if image:
-            image = image.create_bitmap()
-            size.setWidth(int(max(image.width(), size.width())))
-            size.setHeight(int(max(image.height(), size.height())))
+            image_size = self.get_image_size(image)
+            size.setWidth(int(max(image_size.width(), size.width())))
+            size.setHeight(int(max(image_size.height(), size.height())))
 
         return size
+
+    # -------------------------------------------------------------------------
+    #  Private methods
+    # -------------------------------------------------------------------------
+
+    def _get_pixmap(self, image, width, height, ratio):
+        """Return the pixmap of an image scaled to a size at a device pixel
+        ratio, so that it is drawn at the resolution of the device.
+        """
+        key = (image, width, height, ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = image.create_bitmap()
+            device_width = ceil(width * ratio)
+            device_height = ceil(height * ratio)
+            if (
+                pixmap.width() != device_width
+                or pixmap.height() != device_height
+            ):
+                pixmap = pixmap.scaled(
+                    device_width,
+                    device_height,
+                    QtCore.Qt.AspectRatioMode.IgnoreAspectRatio,
+                    QtCore.Qt.TransformationMode.SmoothTransformation,
+                )
+            else:
+                # Don't modify a pixmap which may be shared:
+                pixmap = QtGui.QPixmap(pixmap)
+            pixmap.setDevicePixelRatio(ratio)
+            self._pixmaps.set(key, pixmap)
+        return pixmap
@@ -25,6 +25,7 @@
 """
 
 import os.path
+from collections import OrderedDict
 
 from pyface.api import SystemMetrics
 from pyface.qt import QtCore, QtGui, is_qt5, is_pyqt, qt_api
@@ -77,6 +78,53 @@ def pixmap_cache(name, path=None):
     return pm
 
 
+class PixmapLRUCache:
+    """A bounded cache of pixmaps, which discards the least recently used
+    pixmaps first.
+
+    Parameters
+    ----------
+    size : int
+        The maximum number of pixmaps kept.
+    """
+
+    def __init__(self, size=256):
+        self.size = size
+        self._pixmaps = OrderedDict()
+
+    def __len__(self):
+        return len(self._pixmaps)
+
+    def get(self, key):
+        """Returns the pixmap cached for a key, or None.
+
+        Keys which are not hashable are never cached.
+        """
+        try:
+            pixmap = self._pixmaps.pop(key)
+        except (KeyError, TypeError):
+            return None
+
+        self._pixmaps[key] = pixmap
+        return pixmap
+
+    def set(self, key, pixmap):
+        """Caches the pixmap of a key, discarding the least recently used
+        pixmaps in excess of the size of the cache.
+        """
+        try:
+            self._pixmaps[key] = pixmap
+        except TypeError:
+            return
+
+        while len(self._pixmaps) > self.size:
+            self._pixmaps.popitem(last=False)
+
+    def clear(self):
+        """Discards all the pixmaps."""
+        self._pixmaps.clear()
+
+
 def position_window(window, width=None, height=None, parent=None):
     """Positions a window on the screen with a specified width and height so
     that the window completely fits on the screen if possible.
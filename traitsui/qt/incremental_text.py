@@ -0,0 +1,169 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Incremental updates of the documents of QTextEdit and QPlainTextEdit
+controls.
+
+Replacing the whole text of a large document makes Qt lay it out again,
+which freezes the UI when, for example, a growing log is displayed.  The
+functions of this module instead edit the part of the document which
+changed with a QTextCursor, and can limit the document to its last lines.
+"""
+
+from pyface.qt import QtGui
+
+#: The size of the chunks compared when looking for a common prefix or suffix.
+_CHUNK_SIZE = 4096
+
+#: The largest part of the new text that is inserted with a QTextCursor
+#: (rather than by setting the whole text) when the text is not appended to.
+MAX_EDIT_FRACTION = 0.5
+
+
+def common_prefix_length(old, new):
+    """Returns the length of the common prefix of two strings."""
+    size = min(len(old), len(new))
+    start = 0
+    # Skip the equal chunks, then bisect the first differing chunk:
+    while start < size and (
+        old[start:start + _CHUNK_SIZE] == new[start:start + _CHUNK_SIZE]
+    ):
+        start += _CHUNK_SIZE
+    if start >= size:
+        return size
+
+    low, high = start, min(start + _CHUNK_SIZE, size)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[start:middle] == new[start:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def common_suffix_length(old, new, limit):
+    """Returns the length of the common suffix of two strings, which is at
+    most ``limit``.
+    """
+    old_size, new_size = len(old), len(new)
+    size = min(old_size, new_size, limit)
+    end = 0
+    while end + _CHUNK_SIZE <= size and (
+        old[old_size - end - _CHUNK_SIZE:old_size - end]
+        == new[new_size - end - _CHUNK_SIZE:new_size - end]
+    ):
+        end += _CHUNK_SIZE
+
+    low, high = end, min(end + _CHUNK_SIZE, size)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if (
+            old[old_size - middle:old_size - end]
+            == new[new_size - middle:new_size - end]
+        ):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def tail_lines(text, max_lines):
+    """Returns the last lines of a text.
+
+    Parameters
+    ----------
+    text : str
+        The text.
+    max_lines : int
+        The maximum number of lines returned.  If 0, the whole text is
+        returned.
+    """
+    if max_lines <= 0:
+        return text
+
+    index = len(text)
+    for _ in range(max_lines):
+        index = text.rfind("\n", 0, index)
+        if index == -1:
+            return text
+    return text[index + 1:]
+
+
+def update_text(control, old, new, max_lines=0):
+    """Updates the document of a control from one text to another.
+
+    Appended text is inserted at the end of the document.  Otherwise, the
+    part of the text between the common prefix and suffix of the texts is
+    replaced, if it is small enough; the whole text is set if not.
+
+    Parameters
+    ----------
+    control : QTextEdit or QPlainTextEdit
+        The control, whose document displays ``old``.
+    old : str
+        The text displayed, or None if it is not known.
+    new : str
+        The text to display.
+    max_lines : int
+        The maximum number of lines of the document, which must have been set
+        with ``setMaximumBlockCount``.  If it is not 0, the document may only
+        display the end of ``old``, and text which is not appended is set as
+        a whole.
+    """
+    if old is not None and len(new) >= len(old) and new.startswith(old):
+        if len(new) > len(old):
+            _append_text(control, new[len(old):])
+        return
+
+    if old is None or max_lines > 0:
+        control.setPlainText(tail_lines(new, max_lines))
+        return
+
+    start = common_prefix_length(old, new)
+    end = common_suffix_length(old, new, min(len(old), len(new)) - start)
+    text = new[start:len(new) - end]
+    if len(text) > MAX_EDIT_FRACTION * len(new):
+        control.setPlainText(new)
+        return
+
+    # Qt positions are in UTF-16 code units:
+    position = _utf16_length(old[:start])
+    cursor = QtGui.QTextCursor(control.document())
+    cursor.beginEditBlock()
+    cursor.setPosition(position)
+    cursor.setPosition(
+        position + _utf16_length(old[start:len(old) - end]),
+        QtGui.QTextCursor.MoveMode.KeepAnchor,
+    )
+    cursor.insertText(text)
+    cursor.endEditBlock()
+
+
+def _append_text(control, text):
+    """Appends text to the document of a control, keeping the view scrolled
+    to the end if it was.
+    """
+    scroll_bar = control.verticalScrollBar()
+    at_end = scroll_bar.value() == scroll_bar.maximum()
+
+    cursor = QtGui.QTextCursor(control.document())
+    cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+    cursor.insertText(text)
+
+    if at_end:
+        scroll_bar.setValue(scroll_bar.maximum())
+
+
+def _utf16_length(text):
+    """Returns the length of a string in UTF-16 code units."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf-16-le")) // 2
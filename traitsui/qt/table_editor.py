@@ -156,6 +156,10 @@ class TableEditor(Editor, BaseTableEditor):
     #: An image being converted:
     image = Image
 
+    #: The editors of the cells kept for reuse, keyed by column, style and
+    #: editor factory:
+    _cell_editors = Dict()
+
     def init(self, parent):
         """Finishes initializing the editor by creating the underlying toolkit
         widget."""
@@ -266,12 +270,12 @@ class TableEditor(Editor, BaseTableEditor):
         # Make sure we listen for 'items' changes as well as complete list
         # replacements
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + "_items", dispatch="ui"
+            self._items_updated, self.extended_name + "_items", dispatch="ui"
         )
 
         # Listen for changes to traits on the objects in the list
         self.context_object.on_trait_change(
-            self.refresh_editor, self.extended_name + ".-", dispatch="ui"
+            self._item_trait_updated, self.extended_name + ".-", dispatch="ui"
         )
 
         # Listen for changes on column definitions
@@ -302,6 +306,7 @@ class TableEditor(Editor, BaseTableEditor):
         """Disposes of the contents of an editor."""
         self.model.beginResetModel()
         self.model.endResetModel()
+        self._dispose_cell_editors()
 
         # Make sure that the auxiliary UIs are properly disposed
         if self.toolbar_ui is not None:
@@ -311,12 +316,12 @@ class TableEditor(Editor, BaseTableEditor):
 
         # Remove listener for 'items' changes on object trait
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + "_items", remove=True
+            self._items_updated, self.extended_name + "_items", remove=True
         )
 
         # Remove listener for changes to traits on the objects in the list
         self.context_object.on_trait_change(
-            self.refresh_editor, self.extended_name + ".-", remove=True
+            self._item_trait_updated, self.extended_name + ".-", remove=True
         )
 
         # Remove listeners for column definition changes
@@ -390,13 +395,23 @@ class TableEditor(Editor, BaseTableEditor):
     def items(self):
         """Returns the raw list of model objects."""
 
-        items = self.value
+        value = self.value
+        reverse = bool(self.factory and self.factory.reverse)
+
+        # The list is wrapped once for each value of the trait: the wrappers
+        # are views which reflect changes made to the list in place.
+        cache = self._items_cache
+        if cache is not None and cache[0] is value and cache[1] == reverse:
+            return cache[2]
+
+        items = value
         if not isinstance(items, SequenceTypes):
             items = [items]
 
-        if self.factory and self.factory.reverse:
+        if reverse:
             items = ReversedList(items)
 
+        self._items_cache = (value, reverse, items)
         return items
 
     def callx(self, func, *args, **kw):
@@ -507,6 +522,16 @@ class TableEditor(Editor, BaseTableEditor):
                 return i
         return -1
 
+    def _dispose_cell_editors(self):
+        """Disposes of the editors of the cells kept for reuse."""
+        for editor in self._cell_editors.values():
+            control = editor.control
+            editor.dispose()
+            if control is not None:
+                control._editor = None
+                control.deleteLater()
+        self._cell_editors = {}
+
     def _customize_filters(self, filter):
         """Allows the user to customize the current set of table filters."""
 
@@ -518,6 +543,22 @@ class TableEditor(Editor, BaseTableEditor):
         else:
             self.setx(filter=filter)
 
+    def _items_updated(self):
+        """Handles items being added to or removed from the edited list."""
+        if self.ui is None:
+            return
+
+        if not self.ui._defer_update(self, self.update_editor):
+            self.update_editor()
+
+    def _item_trait_updated(self):
+        """Handles a trait change on one of the items in the edited list."""
+        if self.ui is None:
+            return
+
+        if not self.ui._defer_update(self, self.refresh_editor):
+            self.refresh_editor()
+
     def _update_filtering(self):
         """Update the filter summary and the filtered indices."""
 
@@ -678,6 +719,7 @@ class TableEditor(Editor, BaseTableEditor):
     def _update_columns(self):
         """Handle the column list being changed."""
 
+        self._dispose_cell_editors()
         self.table_view.setItemDelegate(TableDelegate(self.table_view))
         for i, column in enumerate(self.columns):
             if column.renderer:
@@ -866,6 +908,12 @@ class TableDelegate(QtGui.QStyledItemDelegate):
             return None
 
         target, name = column.target_name(obj)
+        key = (column, style, factory)
+        if table_editor.factory.reuse_cell_editors:
+            editor = table_editor._cell_editors.pop(key, None)
+            if editor is not None:
+                return self._rebind_editor(editor, key, target, name, parent)
+
         handler = default_handler()
         if table_editor.ui.context is None:
             ui = UI(handler=handler)
@@ -892,6 +940,30 @@ class TableDelegate(QtGui.QStyledItemDelegate):
         # Make sure that editors are disposed of correctly
         # will be disposed in closeEditor of the TableView
         control._editor = editor
+        control._cell_editor_key = key
+        return control
+
+    def destroyEditor(self, control, index):
+        """Reimplemented to keep the controls of editors kept for reuse."""
+        if getattr(control, "_editor", None) is None:
+            super().destroyEditor(control, index)
+
+    def _rebind_editor(self, editor, key, target, name, parent):
+        """Binds an editor kept for reuse to the trait of a cell and returns
+        its control.
+        """
+        # The context object of the editor is cached, so the editor is still
+        # unhooked from the previous object after the context is updated.
+        # Rebinding also updates the tooltip from the trait of the cell:
+        context = editor.ui.context
+        if "object" in context:
+            context["object"] = target
+        editor.rebind(target, name)
+
+        control = editor.control
+        control.setParent(parent)
+        control._editor = editor
+        control._cell_editor_key = key
         return control
 
     def updateEditorGeometry(self, editor, option, index):
@@ -1200,12 +1272,35 @@ class TableView(QtGui.QTableView):
             width = max(base_width, int(percent * available_space))
             hheader.resizeSection(column_index, width)
 
+    def paintEvent(self, event):
+        """Reimplemented to let the columns keep the values they fetch while
+        the table is painted.
+        """
+        columns = self._editor.columns
+        for column in columns:
+            column.begin_paint()
+        try:
+            super().paintEvent(event)
+        finally:
+            for column in columns:
+                column.end_paint()
+
     def closeEditor(self, control, hint):
         # dispose traits editor associated with control if any
         editor = getattr(control, "_editor", None)
         if editor is not None:
-            editor.dispose()
-            delattr(control, "_editor")
+            table_editor = self._editor
+            key = control._cell_editor_key
+            if (
+                table_editor.factory.reuse_cell_editors
+                and key not in table_editor._cell_editors
+            ):
+                # Keep the editor (and its control) to edit the next cell
+                # of the column:
+                table_editor._cell_editors[key] = editor
+            else:
+                editor.dispose()
+                control._editor = None
 
         return super().closeEditor(control, hint)
 
@@ -29,7 +29,12 @@ from pyface.qt import QtCore, QtGui
 
 from traitsui.ui_traits import SequenceTypes
 
-from .clipboard import PyMimeData
+from .clipboard import (
+    instance_from_mime_data,
+    LOCAL_MIME_TYPE,
+    LocalPyMimeData,
+    PyMimeData,
+)
 
 
 # set up logging for the module
@@ -270,7 +275,12 @@ class TableModel(QtCore.QAbstractTableModel):
         """Reimplemented to expose our internal MIME type for drag and drop
         operations."""
 
-        return [mime_type, PyMimeData.MIME_TYPE, PyMimeData.NOPICKLE_MIME_TYPE]
+        return [
+            mime_type,
+            LOCAL_MIME_TYPE,
+            PyMimeData.MIME_TYPE,
+            PyMimeData.NOPICKLE_MIME_TYPE,
+        ]
 
     def mimeData(self, indexes):
         """Reimplemented to generate MIME data containing the rows of the
@@ -291,7 +301,7 @@ class TableModel(QtCore.QAbstractTableModel):
             rows = sorted(set(index.row() for index in indexes))
             data = self._get_rows_drag_value(rows)
 
-        mime_data = PyMimeData.coerce(data)
+        mime_data = LocalPyMimeData.coerce(data)
 
         # handle re-ordering via internal drags
         if editor.factory.reorderable:
@@ -326,7 +336,7 @@ class TableModel(QtCore.QAbstractTableModel):
                 self.moveRows(current_rows, row)
                 return True
 
-        data = PyMimeData.coerce(mime_data).instance()
+        data = instance_from_mime_data(mime_data)
         if data is not None:
             editor = self._editor
 
@@ -796,8 +796,7 @@ class _TableView(QtGui.QTableView):
             event.accept()
 
             if factory.multi_select:
-                for row in reversed(sorted(editor.multi_selected_rows)):
-                    editor.model.removeRow(row)
+                editor.model.deleteRows(editor.multi_selected_rows)
             elif editor.selected_row != -1:
                 editor.model.removeRow(editor.selected_row)
 
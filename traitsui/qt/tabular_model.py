@@ -17,7 +17,12 @@ import logging
 from pyface.qt import QtCore, QtGui
 
 from traitsui.ui_traits import SequenceTypes
-from .clipboard import PyMimeData
+from .clipboard import (
+    instance_from_mime_data,
+    LOCAL_MIME_TYPE,
+    LocalPyMimeData,
+    PyMimeData,
+)
 
 
 # Mapping for trait alignment values to qt alignment values:
@@ -200,12 +205,14 @@ class TabularModel(QtCore.QAbstractTableModel):
         editor = self._editor
         adapter = editor.adapter
 
+        values = [
+            adapter.get_default_value(editor.object, editor.name)
+            for i in range(count)
+        ]
         self.beginInsertRows(parent, row, row + count - 1)
-        for i in range(count):
-            value = adapter.get_default_value(editor.object, editor.name)
-            editor.callx(
-                adapter.insert, editor.object, editor.name, row, value
-            )
+        editor.callx(
+            adapter.insert_rows, editor.object, editor.name, row, values
+        )
         self.endInsertRows()
         return True
 
@@ -216,8 +223,12 @@ class TabularModel(QtCore.QAbstractTableModel):
         editor = self._editor
         adapter = editor.adapter
         self.beginRemoveRows(parent, row, row + count - 1)
-        for i in range(count):
-            editor.callx(adapter.delete, editor.object, editor.name, row)
+        editor.callx(
+            adapter.delete_rows,
+            editor.object,
+            editor.name,
+            list(range(row, row + count)),
+        )
         self.endRemoveRows()
         n = self.rowCount(None)
         if not editor.factory.multi_select:
@@ -233,6 +244,7 @@ class TabularModel(QtCore.QAbstractTableModel):
         """
         return [
             tabular_mime_type,
+            LOCAL_MIME_TYPE,
             PyMimeData.MIME_TYPE,
             PyMimeData.NOPICKLE_MIME_TYPE,
         ]
@@ -248,7 +260,7 @@ class TabularModel(QtCore.QAbstractTableModel):
             )
             for row in rows
         ]
-        mime_data = PyMimeData.coerce(items)
+        mime_data = LocalPyMimeData.coerce(items)
         data = QtCore.QByteArray(str(id(self)).encode("utf8"))
         for row in rows:
             data.append((" %i" % row).encode("utf8"))
@@ -283,7 +295,7 @@ class TabularModel(QtCore.QAbstractTableModel):
                 return True
 
         # this is an external drag
-        data = PyMimeData.coerce(mime_data).instance()
+        data = instance_from_mime_data(mime_data)
         if data is not None:
             if not isinstance(data, list):
                 data = [data]
@@ -294,8 +306,7 @@ class TabularModel(QtCore.QAbstractTableModel):
             if all(
                 adapter.get_can_drop(object, name, row, item) for item in data
             ):
-                for item in reversed(data):
-                    self.dropItem(item, row)
+                self.dropItems(data, row)
                 return True
         return False
 
@@ -320,6 +331,49 @@ class TabularModel(QtCore.QAbstractTableModel):
 
         adapter.insert(object, name, row, item)
 
+    def dropItems(self, items, row):
+        """Handle a list of Python objects being dropped onto a row.
+
+        The items are inserted in order, before or after the row as given by
+        the adapter's ``get_dropped``, with a single insertion for each.
+        """
+        editor = self._editor
+        object = editor.object
+        name = editor.name
+        adapter = editor.adapter
+
+        before = []
+        after = []
+        for item in items:
+            if adapter.get_dropped(object, name, row, item) == "after":
+                after.append(item)
+            else:
+                before.append(item)
+
+        adapter.insert_rows(object, name, row + 1, after)
+        adapter.insert_rows(object, name, row, before)
+
+    def deleteRows(self, rows):
+        """Deletes a sequence of rows (provided as a list of row indexes) with
+        a single update of the model.
+        """
+        editor = self._editor
+        rows = sorted(set(rows))
+        if len(rows) == 0:
+            return
+
+        self.beginResetModel()
+        editor.callx(
+            editor.adapter.delete_rows, editor.object, editor.name, rows
+        )
+        self.endResetModel()
+        n = self.rowCount(None)
+        if not editor.factory.multi_select:
+            row = rows[0]
+            editor.selected_row = row if row < n else n - 1
+        else:
+            editor.multi_selected_rows = []
+
     def moveRow(self, old_row, new_row):
         """Convenience method to move a single row."""
         return self.moveRows([old_row], new_row)
@@ -339,28 +393,33 @@ class TabularModel(QtCore.QAbstractTableModel):
             )
             new_row = max(0, self.rowCount(None) - 1)
 
-        # Sort rows in descending order so they can be removed without
-        # invalidating the indices.
-        current_rows.sort()
-        current_rows.reverse()
+        current_rows = sorted(set(current_rows))
 
-        # If the the highest selected row is lower than the destination, do an
+        # If the the lowest selected row is lower than the destination, do an
         # insertion before rather than after the destination.
-        if current_rows[-1] < new_row:
+        if current_rows[0] < new_row:
             new_row += 1
 
-        # Remove selected rows...
-        objects = []
-        for row in current_rows:
+        # Adjust the destination for the removal of the rows:
+        for row in reversed(current_rows):
             if row <= new_row:
                 new_row -= 1
-            obj = editor.adapter.get_item(editor.object, editor.name, row)
-            objects.insert(0, obj)
-            self.removeRow(row)
 
-        # ...and add them at the new location.
-        for i, obj in enumerate(objects):
-            self.insertRow(new_row + i, obj=obj)
+        objects = [
+            editor.adapter.get_item(editor.object, editor.name, row)
+            for row in current_rows
+        ]
+
+        # Move the rows with a single change of the list and of the model:
+        self.beginResetModel()
+        editor.callx(
+            editor.adapter.move_rows,
+            editor.object,
+            editor.name,
+            current_rows,
+            new_row,
+        )
+        self.endResetModel()
 
         # Update the selection for the new location.
         if editor.factory.multi_select:
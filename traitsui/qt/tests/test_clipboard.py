@@ -0,0 +1,102 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import io
+import pickle
+import threading
+import unittest
+from unittest import mock
+
+from traitsui.tests._tools import is_qt, requires_toolkit, ToolkitName
+
+try:
+    from pyface.qt import QtCore
+    from traitsui.qt.clipboard import (
+        instance_from_mime_data,
+        LOCAL_MIME_TYPE,
+        LocalPyMimeData,
+        PyMimeData,
+    )
+except ImportError:
+    if is_qt():
+        raise
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestLocalPyMimeData(unittest.TestCase):
+
+    def test_not_pickled_when_created(self):
+        with mock.patch("traitsui.qt.clipboard.dumps") as dumps:
+            mime_data = LocalPyMimeData.coerce([1, 2, 3])
+
+        dumps.assert_not_called()
+        self.assertEqual(mime_data.instance(), [1, 2, 3])
+        self.assertIs(PyMimeData.coerce(mime_data), mime_data)
+
+    def test_unpicklable_instance(self):
+        lock = threading.Lock()
+        mime_data = LocalPyMimeData.coerce([lock])
+
+        self.assertEqual(mime_data.instance(), [lock])
+        self.assertEqual(instance_from_mime_data(mime_data), [lock])
+        self.assertIn(PyMimeData.MIME_TYPE, mime_data.formats())
+
+        # As read by another process:
+        with self.assertWarns(RuntimeWarning):
+            data = bytes(mime_data.data(PyMimeData.MIME_TYPE))
+        copy = QtCore.QMimeData()
+        copy.setData(PyMimeData.MIME_TYPE, data)
+        self.assertIsNone(PyMimeData.coerce(copy).instance())
+
+        formats = mime_data.formats()
+        self.assertNotIn(PyMimeData.MIME_TYPE, formats)
+        self.assertIn(PyMimeData.NOPICKLE_MIME_TYPE, formats)
+        self.assertFalse(mime_data.hasFormat(PyMimeData.MIME_TYPE))
+
+    def test_not_pickled_by_local_drag(self):
+        data = [1, 2, 3]
+        with mock.patch("traitsui.qt.clipboard.dumps") as dumps:
+            mime_data = LocalPyMimeData(data)
+
+            # As queried when a drag starts and the drop is handled:
+            self.assertIn(PyMimeData.MIME_TYPE, mime_data.formats())
+            self.assertTrue(mime_data.hasFormat(PyMimeData.MIME_TYPE))
+            self.assertTrue(mime_data.hasFormat(LOCAL_MIME_TYPE))
+            self.assertIs(instance_from_mime_data(mime_data), data)
+
+        dumps.assert_not_called()
+
+    def test_pickled_on_request(self):
+        mime_data = LocalPyMimeData.coerce([1, 2, 3])
+        self.assertTrue(mime_data.hasFormat(PyMimeData.MIME_TYPE))
+        self.assertIn(PyMimeData.MIME_TYPE, mime_data.formats())
+
+        # As read by another process:
+        stream = io.BytesIO(bytes(mime_data.data(PyMimeData.MIME_TYPE)))
+        self.assertIs(pickle.load(stream), list)
+        self.assertEqual(pickle.load(stream), [1, 2, 3])
+
+    def test_not_pickled(self):
+        mime_data = LocalPyMimeData([1, 2, 3], pickle=False)
+        self.assertFalse(mime_data.hasFormat(PyMimeData.MIME_TYPE))
+        self.assertTrue(mime_data.hasFormat(PyMimeData.NOPICKLE_MIME_TYPE))
+
+    def test_instance_from_token(self):
+        data = object()
+        mime_data = LocalPyMimeData.coerce(data)
+
+        # MIME data copied by the toolkit only carries the token:
+        copy = QtCore.QMimeData()
+        copy.setData(LOCAL_MIME_TYPE, mime_data.data(LOCAL_MIME_TYPE))
+        self.assertIs(instance_from_mime_data(copy), data)
+
+        # Tokens of MIME data which no longer exists are ignored:
+        del mime_data
+        self.assertIsNone(instance_from_mime_data(copy))
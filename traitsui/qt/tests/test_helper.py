@@ -13,7 +13,11 @@ import unittest
 
 from pyface.qt import is_pyqt, qt_api, QtCore, QtGui
 from traitsui.tests._tools import is_mac_os, requires_toolkit, ToolkitName
-from traitsui.qt.helper import qobject_is_valid, wrap_text_with_elision
+from traitsui.qt.helper import (
+    PixmapLRUCache,
+    qobject_is_valid,
+    wrap_text_with_elision,
+)
 from traitsui.qt.font_trait import create_traitsfont
 
 
@@ -152,3 +156,41 @@ class TestWrapText(unittest.TestCase):
         result = qobject_is_valid(qobject)
 
         self.assertFalse(result)
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestPixmapLRUCache(unittest.TestCase):
+
+    def test_get_set(self):
+        cache = PixmapLRUCache(2)
+        pixmap = QtGui.QPixmap(4, 4)
+
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", pixmap)
+        self.assertIs(cache.get("a"), pixmap)
+
+    def test_least_recently_used_discarded(self):
+        cache = PixmapLRUCache(2)
+        cache.set("a", QtGui.QPixmap(1, 1))
+        cache.set("b", QtGui.QPixmap(2, 2))
+        cache.get("a")
+        cache.set("c", QtGui.QPixmap(3, 3))
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_unhashable_key(self):
+        cache = PixmapLRUCache()
+        cache.set(["a"], QtGui.QPixmap(1, 1))
+
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get(["a"]))
+
+    def test_clear(self):
+        cache = PixmapLRUCache()
+        cache.set("a", QtGui.QPixmap(1, 1))
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
@@ -0,0 +1,93 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+from unittest import mock
+
+from pyface.qt import QtGui
+from traitsui.tests._tools import requires_toolkit, ToolkitName
+from traitsui.qt.incremental_text import (
+    common_prefix_length,
+    common_suffix_length,
+    tail_lines,
+    update_text,
+)
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestIncrementalText(unittest.TestCase):
+
+    def test_common_prefix_length(self):
+        self.assertEqual(common_prefix_length("", "abc"), 0)
+        self.assertEqual(common_prefix_length("abc", "abc"), 3)
+        self.assertEqual(common_prefix_length("abc", "abd"), 2)
+        self.assertEqual(common_prefix_length("abc", "abcdef"), 3)
+
+        # Across chunks:
+        old = "a" * 10000 + "b" + "c" * 100
+        new = "a" * 10000 + "d" + "c" * 100
+        self.assertEqual(common_prefix_length(old, new), 10000)
+
+    def test_common_suffix_length(self):
+        self.assertEqual(common_suffix_length("abc", "xbc", 3), 2)
+        self.assertEqual(common_suffix_length("abc", "abc", 3), 3)
+        self.assertEqual(common_suffix_length("abc", "abc", 1), 1)
+        self.assertEqual(common_suffix_length("", "abc", 3), 0)
+
+        old = "c" * 100 + "b" + "a" * 10000
+        new = "c" * 100 + "d" + "a" * 10000
+        self.assertEqual(common_suffix_length(old, new, 10101), 10000)
+
+    def test_tail_lines(self):
+        self.assertEqual(tail_lines("a\nb\nc", 0), "a\nb\nc")
+        self.assertEqual(tail_lines("a\nb\nc", 2), "b\nc")
+        self.assertEqual(tail_lines("a\nb\nc", 5), "a\nb\nc")
+        self.assertEqual(tail_lines("a\nb\nc\n", 2), "c\n")
+
+    def test_update_text_append(self):
+        control = QtGui.QPlainTextEdit()
+        control.setPlainText("line 1\n")
+        with mock.patch.object(control, "setPlainText") as set_plain_text:
+            update_text(control, "line 1\n", "line 1\nline 2\n")
+
+        set_plain_text.assert_not_called()
+        self.assertEqual(control.toPlainText(), "line 1\nline 2\n")
+
+    def test_update_text_edit(self):
+        control = QtGui.QTextEdit()
+        old = "\N{GRINNING FACE} first line\nsecond line\nthird line"
+        new = "\N{GRINNING FACE} first line\nsecond row\nthird line"
+        control.setPlainText(old)
+        with mock.patch.object(control, "setPlainText") as set_plain_text:
+            update_text(control, old, new)
+
+        set_plain_text.assert_not_called()
+        self.assertEqual(control.toPlainText(), new)
+
+    def test_update_text_replace(self):
+        control = QtGui.QPlainTextEdit()
+        control.setPlainText("old text")
+        update_text(control, "old text", "something completely different")
+
+        self.assertEqual(
+            control.toPlainText(), "something completely different"
+        )
+
+    def test_update_text_max_lines(self):
+        control = QtGui.QPlainTextEdit()
+        control.setMaximumBlockCount(2)
+        update_text(control, None, "a\nb\nc", max_lines=2)
+        self.assertEqual(control.toPlainText(), "b\nc")
+
+        update_text(control, "a\nb\nc", "a\nb\nc\nd", max_lines=2)
+        self.assertEqual(control.toPlainText(), "c\nd")
+
+        update_text(control, "a\nb\nc\nd", "x\ny\nz", max_lines=2)
+        self.assertEqual(control.toPlainText(), "y\nz")
@@ -14,6 +14,7 @@
 import unittest
 
 from traits.api import HasTraits, List, Str
+from traits.testing.api import UnittestTools
 from traitsui.api import Item, TabularEditor, View
 from traitsui.tabular_adapter import TabularAdapter
 
@@ -51,7 +52,7 @@ def get_view(adapter):
 
 
 @requires_toolkit([ToolkitName.qt])
-class TestTabularModel(BaseTestMixin, unittest.TestCase):
+class TestTabularModel(BaseTestMixin, UnittestTools, unittest.TestCase):
     def setUp(self):
         BaseTestMixin.setUp(self)
 
@@ -193,3 +194,69 @@ class TestTabularModel(BaseTestMixin, unittest.TestCase):
             content = mime_data.instance()
             self.assertEqual(content, ["A", "C", "B"])
             self.assertEqual(obj.names, content)
+
+    def test_move_rows_single_list_change(self):
+        obj = DummyHasTraits(names=[str(i) for i in range(5000)])
+        view = View(
+            Item(
+                "names",
+                editor=TabularEditor(
+                    adapter=TabularAdapter(columns=["Name"]),
+                    multi_select=True,
+                ),
+            )
+        )
+
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            (editor,) = ui.get_editors("names")
+            model = editor.model
+            rows = list(range(0, 5000, 2))
+            resets = []
+            model.modelReset.connect(lambda: resets.append(True))
+
+            with self.assertTraitChanges(obj, "names_items", count=1):
+                model.moveRows(rows, 4999)
+
+            self.assertEqual(len(resets), 1)
+            self.assertEqual(
+                obj.names,
+                [str(i) for i in range(1, 5000, 2)]
+                + [str(i) for i in range(0, 5000, 2)],
+            )
+            self.assertEqual(
+                editor.multi_selected_rows, list(range(2500, 5000))
+            )
+
+    def test_drop_items_single_list_change(self):
+        obj = DummyHasTraits(names=["A", "B", "C"])
+        view = get_view(TabularAdapter(columns=["Name"], can_drop=True))
+
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            (editor,) = ui.get_editors("names")
+            model = editor.model
+            mime_data = model.mimeData(
+                [model.createIndex(0, 0), model.createIndex(1, 0)]
+            )
+
+            parent = model.createIndex(2, 0)
+            with self.assertTraitChanges(obj, "names_items", count=1):
+                model.dropMimeData(
+                    mime_data, QtCore.Qt.DropAction.CopyAction, -1, -1, parent
+                )
+
+            self.assertEqual(obj.names, ["A", "B", "C", "A", "B"])
+
+    def test_delete_rows(self):
+        obj = DummyHasTraits(names=["A", "B", "C", "D"])
+        view = get_view(TabularAdapter(columns=["Name"]))
+
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            (editor,) = ui.get_editors("names")
+            model = editor.model
+
+            with self.assertTraitChanges(obj, "names_items", count=1):
+                model.deleteRows([3, 0, 1])
+
+            self.assertEqual(obj.names, ["C"])
+            self.assertEqual(model.rowCount(None), 1)
+            self.assertEqual(editor.selected_row, 0)
@@ -35,6 +35,8 @@ from .editor_factory import ReadonlyEditor as BaseReadonlyEditor
 
 from .constants import OKColor
 
+from .incremental_text import update_text
+
 
 class SimpleEditor(Editor):
     """Simple style text editor, which displays a text field."""
@@ -74,11 +76,23 @@ class SimpleEditor(Editor):
         if multi_line:
             self.scrollable = True
 
-        control = wtype(self.str_value)
+        self._incremental = multi_line and (
+            factory.incremental or factory.max_lines > 0
+        )
+        if self._incremental:
+            # The text is set by update_editor:
+            control = wtype()
+        else:
+            control = wtype(self.str_value)
 
         if factory.read_only:
             control.setReadOnly(True)
 
+        if multi_line and factory.max_lines > 0:
+            control.document().setMaximumBlockCount(factory.max_lines)
+            control.setUndoRedoEnabled(False)
+            control.setReadOnly(True)
+
         if factory.password:
             control.setEchoMode(QtGui.QLineEdit.EchoMode.Password)
 
@@ -146,23 +160,44 @@ class SimpleEditor(Editor):
         """Updates the editor when the object trait changes externally to the
         editor.
         """
-        user_value = self._get_user_value()
-        try:
-            unequal = bool(user_value != self.value)
-        except ValueError:
-            # This might be a numpy array.
-            unequal = True
+        if self._incremental:
+            self._update_document()
+        else:
+            user_value = self._get_user_value()
+            try:
+                unequal = bool(user_value != self.value)
+            except ValueError:
+                # This might be a numpy array.
+                unequal = True
 
-        if unequal:
-            self._no_update = True
-            self.control.setText(self.str_value)
-            self._no_update = False
+            if unequal:
+                self._no_update = True
+                self.control.setText(self.str_value)
+                self._no_update = False
 
         if self._error is not None:
             self._error = None
             self.ui.errors -= 1
             self.set_error_state(False)
 
+    def _update_document(self):
+        """Updates the document of a multi-line control incrementally."""
+        text = self.str_value
+        control = self.control
+        document = control.document()
+        old_text = self._displayed_text
+        if old_text is not None and document.isModified():
+            # The user has edited the text since it was last displayed:
+            old_text = control.toPlainText()
+        if old_text != text:
+            self._no_update = True
+            try:
+                update_text(control, old_text, text, self.factory.max_lines)
+            finally:
+                self._no_update = False
+        self._displayed_text = text
+        document.setModified(False)
+
     def _get_user_value(self):
         """Gets the actual value corresponding to what the user typed."""
         try:
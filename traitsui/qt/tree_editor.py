@@ -24,6 +24,7 @@
 """
 
 
+from collections import OrderedDict
 import copy
 import collections.abc
 from functools import partial
@@ -32,9 +33,9 @@ import logging
 
 from pyface.qt import QtCore, QtGui, is_qt5
 
-from pyface.api import ImageResource
+from pyface.api import GUI, ImageResource
 from pyface.ui_traits import convert_image
-from pyface.timer.api import do_later
+from pyface.timer.api import do_after, do_later
 from traits.api import Any, Event, Int
 from traitsui.editors.tree_editor import (
     CopyAction,
@@ -50,11 +51,16 @@ from traitsui.tree_node import (
     ObjectTreeNode,
     TreeNode,
 )
+from traitsui.helper import IdentityMap
 from traitsui.menu import Menu, Action, Separator
 from traitsui.ui_traits import SequenceTypes
 from traitsui.undo import ListUndoItem
 
-from .clipboard import clipboard, PyMimeData
+from .clipboard import (
+    clipboard,
+    instance_from_mime_data,
+    LocalPyMimeData,
+)
 from .editor import Editor
 from .helper import pixmap_cache, qobject_is_valid
 from .tree_node_renderers import WordWrapRenderer
@@ -66,6 +72,10 @@ logger = logging.getLogger(__name__)
 # The renderer to use when word_wrap is True.
 DEFAULT_WRAP_RENDERER = WordWrapRenderer()
 
+#: The number of children loaded in the background which are inserted in the
+#: tree in each iteration of the event loop.
+CHILDREN_BATCH_SIZE = 100
+
 
 class SimpleEditor(Editor):
     """Simple style of tree editor."""
@@ -99,6 +109,10 @@ class SimpleEditor(Editor):
     #: The vent fired when the application wants to refresh the viewport.
     refresh = Event()
 
+    #: The number of nodes in the tree (not counting the children which have
+    #: not been created yet, or have been released):
+    node_count = Int()
+
     def init(self, parent):
         """Finishes initializing the editor by creating the underlying toolkit
         widget.
@@ -107,6 +121,11 @@ class SimpleEditor(Editor):
 
         self._editor = None
 
+        # The objects whose labels and column labels changed since the items
+        # were last updated, keyed by id:
+        self._pending_labels = {}
+        self._pending_column_labels = {}
+
         if factory.editable:
 
             # Check to see if the tree view is based on a shared trait editor:
@@ -191,7 +210,14 @@ class SimpleEditor(Editor):
         self._item_delegate = delegate
 
         # Set up the mapping between objects and tree id's:
-        self._map = {}
+        self._map = IdentityMap()
+
+        # The populated collapsed nodes whose children may be released, in
+        # the order they were collapsed, keyed by id:
+        self._collapsed = OrderedDict()
+
+        # Set up the cache of icons for the tree's nodes:
+        self._icon_cache = {}
 
         # Initialize the 'undo state' stack:
         self._undoable = []
@@ -203,6 +229,7 @@ class SimpleEditor(Editor):
         self.sync_value(factory.click, "click", "to")
         self.sync_value(factory.dclick, "dclick", "to")
         self.sync_value(factory.veto, "veto", "from")
+        self.sync_value(factory.node_count, "node_count", "to")
 
     def _selection_changed(self, selection):
         """Handles the **selection** event."""
@@ -251,6 +278,8 @@ class SimpleEditor(Editor):
 
             self._tree = None
 
+        self._icon_cache = {}
+
         super().dispose()
 
     def expand_levels(self, nid, levels, expand=True):
@@ -265,6 +294,12 @@ class SimpleEditor(Editor):
                 self._expand_node(nid)
                 if expand:
                     nid.setExpanded(True)
+                if getattr(nid, "_loading", None) is not None:
+                    # Expand the children once they have been loaded:
+                    nid._expand_levels = max(
+                        getattr(nid, "_expand_levels", 0), levels - 1
+                    )
+                    return
                 for cnid in self._nodes_for(nid):
                     self.expand_levels(cnid, levels - 1)
 
@@ -282,11 +317,16 @@ class SimpleEditor(Editor):
             try:
                 expanded, node, object = self._get_node_data(item)
             except Exception:
-                # node is either not ready or has been deleted
+                # node is either not ready (eg. the placeholder of children
+                # being loaded) or has been deleted
+                iterator += 1
                 continue
             if self._has_children(node, object):
                 self._expand_node(item)
                 item.setExpanded(True)
+                if getattr(item, "_loading", None) is not None:
+                    # Expand all the children once they have been loaded:
+                    item._expand_levels = float("inf")
             iterator += 1
 
     def update_editor(self):
@@ -309,7 +349,9 @@ class SimpleEditor(Editor):
             self._delete_node(old_nid)
 
         tree.clear()
-        self._map = {}
+        self._map = IdentityMap()
+        self._collapsed.clear()
+        self.node_count = 0
 
         object, node = self._node_for(self.value)
         if node is not None:
@@ -318,7 +360,8 @@ class SimpleEditor(Editor):
             else:
                 nid = self._create_item(tree, node, object)
 
-            self._map[id(object)] = [(node.get_children_id(object), nid)]
+            self._map[object] = [(node.get_children_id(object), nid)]
+            self.node_count += 1
             self._add_listeners(node, object)
             self._set_node_data(nid, (False, node, object))
             if self.factory.hide_root or self._has_children(node, object):
@@ -420,9 +463,10 @@ class SimpleEditor(Editor):
 
         has_children = self._has_children(node, object)
         self._set_node_data(cnid, (False, node, object))
-        self._map.setdefault(id(object), []).append(
+        self._map.setdefault(object, []).append(
             (node.get_children_id(object), cnid)
         )
+        self.node_count += 1
         self._add_listeners(node, object)
 
         # Automatically expand the new node (if requested):
@@ -442,6 +486,8 @@ class SimpleEditor(Editor):
     def _delete_node(self, nid):
         """Deletes a specified tree node and all its children."""
 
+        self._cancel_loading(nid)
+        self._collapsed.pop(id(nid), None)
         for cnid in self._nodes_for(nid):
             self._delete_node(cnid)
 
@@ -458,17 +504,17 @@ class SimpleEditor(Editor):
             # The node has already been deleted.
             pass
         else:
-            id_object = id(object)
-            object_info = self._map[id_object]
+            object_info = self._map[object]
             for i, info in enumerate(object_info):
                 # QTreeWidgetItem does not have an equal operator, so use id()
                 if id(nid) == id(info[1]):
                     del object_info[i]
+                    self.node_count -= 1
                     break
 
             if len(object_info) == 0:
                 self._remove_listeners(node, object)
-                del self._map[id_object]
+                del self._map[object]
 
         if pnid is None:
             self._tree.takeTopLevelItem(self._tree.indexOfTopLevelItem(nid))
@@ -498,14 +544,121 @@ class SimpleEditor(Editor):
                 nid.removeChild(dummy)
                 del nid._dummy
 
-            for child in node.get_children(object):
-                child, child_node = self._node_for(child)
-                if child_node is not None:
-                    self._append_node(nid, child_node, child)
+            future = node.get_children_async(object)
+            if future is not None:
+                self._load_children(nid, future)
+            else:
+                for child in node.get_children(object):
+                    child, child_node = self._node_for(child)
+                    if child_node is not None:
+                        self._append_node(nid, child_node, child)
 
             # Indicate the item is now populated:
             self._set_node_data(nid, (True, node, object))
 
+    def _load_children(self, nid, future):
+        """Displays a placeholder child until the children of a node, which
+        are got in the background, are available.
+        """
+        placeholder = QtGui.QTreeWidgetItem(nid)
+        placeholder.setText(0, "Loading...")
+        placeholder.setFlags(QtCore.Qt.ItemFlag.NoItemFlags)
+
+        # The loading state identifies the load, so that the results of
+        # cancelled loads are ignored:
+        loading = nid._loading = (future, placeholder)
+        future.add_done_callback(
+            lambda future: GUI.invoke_later(
+                self._children_loaded, nid, loading
+            )
+        )
+
+    def _children_loaded(self, nid, loading):
+        """Inserts the children of a node once they have been got in the
+        background.
+        """
+        if not self._is_loading(nid, loading):
+            return
+
+        future, placeholder = loading
+        try:
+            children = list(future.result())
+        except Exception:
+            logger.exception("Error getting the children of a tree node")
+            nid.removeChild(placeholder)
+            del nid._loading
+            nid._expand_levels = 0
+            return
+
+        self._insert_loaded_children(nid, loading, children, 0)
+
+    def _insert_loaded_children(self, nid, loading, children, start):
+        """Inserts a batch of the children of a node got in the background,
+        and schedules the insertion of the next batch.
+        """
+        if not self._is_loading(nid, loading):
+            return
+
+        future, placeholder = loading
+        index = nid.indexOfChild(placeholder)
+        end = start + CHILDREN_BATCH_SIZE
+        for child in children[start:end]:
+            child, child_node = self._node_for(child)
+            if child_node is not None:
+                self._insert_node(nid, index, child_node, child)
+                index += 1
+
+        if end < len(children):
+            GUI.invoke_later(
+                self._insert_loaded_children, nid, loading, children, end
+            )
+        else:
+            nid.removeChild(placeholder)
+            del nid._loading
+
+            # Continue expanding the node's sub-levels, if requested while
+            # its children were being loaded:
+            levels = getattr(nid, "_expand_levels", 0)
+            if levels > 0:
+                nid._expand_levels = 0
+                for cnid in self._nodes_for(nid):
+                    self.expand_levels(cnid, levels)
+
+    def _is_loading(self, nid, loading):
+        """Returns whether the children of a node are still being loaded by
+        a load, ie. it has not been cancelled.
+        """
+        return (
+            getattr(nid, "_loading", None) is loading
+            and self._tree is not None
+            and qobject_is_valid(nid)
+        )
+
+    def _cancel_loading(self, nid):
+        """Cancels getting the children of a node in the background, if they
+        are being got, so that the node can be populated again.
+
+        Returns whether a load was cancelled.
+        """
+        loading = getattr(nid, "_loading", None)
+        if loading is None:
+            return False
+
+        future, placeholder = loading
+        future.cancel()
+        del nid._loading
+        nid._expand_levels = 0
+        return True
+
+    def _reload_children(self, nid):
+        """Discards the children of a node and populates it again."""
+        for cnid in self._nodes_for(nid):
+            self._delete_node(cnid)
+
+        expanded, node, object = self._get_node_data(nid)
+        self._set_node_data(nid, (False, node, object))
+        self._expand_node(nid)
+
     def _nodes_for(self, nid):
         """Returns all child node ids of a specified node id."""
         return [nid.child(i) for i in range(nid.childCount())]
@@ -549,6 +702,49 @@ class SimpleEditor(Editor):
             return QtGui.QIcon()
 
         icon_name = node.get_icon(object, is_expanded)
+
+        # Icons are cached by name and search path (or color and size), so
+        # that expanding nodes does not search the file system:
+        path = None
+        if isinstance(icon_name, str):
+            if not (
+                icon_name.startswith("@") or icon_name in self.STD_ICON_MAP
+            ):
+                path = node.get_icon_path(object)
+                if isinstance(path, str):
+                    path = [path, node]
+                else:
+                    path = path + [node]
+            key = (icon_name, path and tuple(path))
+        elif isinstance(icon_name, QtGui.QColor):
+            size = self._tree.iconSize()
+            key = ("color", icon_name.rgba(), size.width(), size.height())
+        elif isinstance(icon_name, tuple):
+            size = self._tree.iconSize()
+            key = ("color", icon_name, size.width(), size.height())
+        else:
+            key = icon_name
+
+        try:
+            return self._icon_cache[key]
+        except KeyError:
+            icon = self._icon_cache[key] = self._create_icon(icon_name, path)
+            return icon
+        except TypeError:
+            # The key is not hashable:
+            return self._create_icon(icon_name, path)
+
+    def _create_icon(self, icon_name, path=None):
+        """Creates the icon for an icon name returned by a tree node.
+
+        Parameters
+        ----------
+        icon_name : str, IImageResource, QColor or tuple
+            The icon name, image resource or color of the icon.
+        path : list or None
+            The search path for icon names which are not "@" image names or
+            standard icons.
+        """
         if isinstance(icon_name, str):
             if icon_name.startswith("@"):
                 image_resource = convert_image(icon_name, 4)
@@ -557,12 +753,6 @@ class SimpleEditor(Editor):
                 icon = self.STD_ICON_MAP[icon_name]
                 return self._tree.style().standardIcon(icon)
 
-            path = node.get_icon_path(object)
-            if isinstance(path, str):
-                path = [path, node]
-            else:
-                path = path + [node]
-
             image_resource = ImageResource(icon_name, path)
 
         elif isinstance(icon_name, ImageResource):
@@ -624,7 +814,7 @@ class SimpleEditor(Editor):
         """Returns the tree node data for a specified object in the form
         ( expanded, node, nid ).
         """
-        info = self._map[id(object)]
+        info = self._map[object]
         for name2, nid in info:
             if name == name2:
                 break
@@ -640,7 +830,7 @@ class SimpleEditor(Editor):
         form: [ ( expanded, node, nid ), ... ].
         """
         result = []
-        for name2, nid in self._map[id(object)]:
+        for name2, nid in self._map[object]:
             if name == name2:
                 try:
                     expanded, node, object = self._get_node_data(nid)
@@ -776,7 +966,7 @@ class SimpleEditor(Editor):
 
     def _get_object_nid(self, object, name=""):
         """Gets the ID associated with a specified object (if any)."""
-        info = self._map.get(id(object))
+        info = self._map.get(object)
         if info is None:
             return None
         for name2, nid in info:
@@ -853,6 +1043,10 @@ class SimpleEditor(Editor):
                     if snid is not nid:
                         snid.setExpanded(False)
 
+        # The children of the node must not be released while it is
+        # expanded:
+        self._collapsed.pop(id(nid), None)
+
         # Expand the node (i.e. populate its children if they are not there
         # yet):
         self._expand_node(nid)
@@ -861,8 +1055,88 @@ class SimpleEditor(Editor):
 
     def _on_item_collapsed(self, nid):
         """Handles a tree node being collapsed."""
+        # Stop getting the children in the background, unless they are being
+        # inserted already:
+        loading = getattr(nid, "_loading", None)
+        if loading is not None and not loading[0].done():
+            self._cancel_loading(nid)
+            nid.removeChild(loading[1])
+            expanded, node, object = self._get_node_data(nid)
+            self._set_node_data(nid, (False, node, object))
+            nid._dummy = QtGui.QTreeWidgetItem(nid)
+
+        self._schedule_release(nid)
         self._update_icon(nid)
 
+    def _schedule_release(self, nid):
+        """Schedules the release of the children of a node which has been
+        collapsed, if requested by the factory.
+        """
+        factory = self.factory
+        delay = factory.release_collapsed_delay
+        max_collapsed = factory.max_collapsed_nodes
+        if delay < 0 and max_collapsed <= 0:
+            return
+
+        try:
+            expanded = self._get_node_data(nid)[0]
+        except Exception:
+            # The node has already been deleted.
+            return
+        if not expanded:
+            return
+
+        # The token identifies this collapse, so that a node which has been
+        # expanded and collapsed again in the meantime is not released early:
+        token = object()
+        self._collapsed.pop(id(nid), None)
+        self._collapsed[id(nid)] = (nid, token)
+
+        if delay >= 0:
+            do_after(int(delay * 1000), self._release_collapsed, nid, token)
+
+        if max_collapsed > 0:
+            while len(self._collapsed) > max_collapsed:
+                onid, otoken = next(iter(self._collapsed.values()))
+                self._release_collapsed(onid, otoken)
+
+    def _release_collapsed(self, nid, token):
+        """Releases the children of a collapsed node, which are created
+        again when the node is next expanded.
+        """
+        entry = self._collapsed.get(id(nid))
+        if entry is None or entry[1] is not token:
+            # The node has been expanded or deleted since it was collapsed.
+            return
+        del self._collapsed[id(nid)]
+
+        if (
+            self._tree is None
+            or not qobject_is_valid(nid)
+            or nid.isExpanded()
+            or getattr(nid, "_loading", None) is not None
+            or self._has_selected_descendant(nid)
+        ):
+            return
+
+        for cnid in self._nodes_for(nid):
+            self._delete_node(cnid)
+
+        expanded, node, object = self._get_node_data(nid)
+        self._set_node_data(nid, (False, node, object))
+        if self._has_children(node, object):
+            nid._dummy = QtGui.QTreeWidgetItem(nid)
+
+    def _has_selected_descendant(self, nid):
+        """Returns whether any of the descendants of a node is selected."""
+        for snid in self._tree.selectedItems():
+            pnid = snid.parent()
+            while pnid is not None:
+                if pnid is nid:
+                    return True
+                pnid = pnid.parent()
+        return False
+
     def _on_item_clicked(self, nid, col):
         """Handles a tree item being clicked."""
         try:
@@ -1368,6 +1642,12 @@ class SimpleEditor(Editor):
         """Handles the children of a node being completely replaced."""
         tree = self._tree
         for expanded, node, nid in self._object_info_for(object, name):
+            # Get the children again if they were being got in the
+            # background:
+            if self._cancel_loading(nid):
+                self._reload_children(nid)
+                continue
+
             children = node.get_children(object)
 
             # Only add/remove the changes if the node has already been
@@ -1410,6 +1690,12 @@ class SimpleEditor(Editor):
         tree = self._tree
 
         for expanded, node, nid in self._object_info_for(object, name):
+            # Get the children again if they were being got in the
+            # background:
+            if self._cancel_loading(nid):
+                self._reload_children(nid)
+                continue
+
             children = node.get_children(object)
 
             # If the new children aren't all at the end, remove/add them all:
@@ -1453,45 +1739,61 @@ class SimpleEditor(Editor):
 
     def _label_updated(self, object, name, label):
         """Handles the label of an object being changed."""
-        # Prevent the itemChanged() signal from being emitted.
-        blk = self._tree.blockSignals(True)
-        try:
-            # Have to use a list rather than a set because nids for PyQt
-            # on Python 3 (QTreeWidgetItem instances) aren't hashable.
-            # This means potentially quadratic behaviour, but the number of
-            # nodes for a particular object shouldn't be high
-            nids = []
-            for name2, nid in self._map[id(object)]:
-                if nid not in nids:
-                    try:
-                        node = self._get_node_data(nid)[1]
-                    except Exception:
-                        # node is either not ready or has been deleted
-                        continue
-                    nids.append(nid)
-                    self._set_label(nid, 0)
-                    self._update_icon(nid)
-        finally:
-            self._tree.blockSignals(blk)
+        self._schedule_label_update(self._pending_labels, object)
 
     def _column_labels_updated(self, object, name, new):
         """Handles the column labels of an object being changed."""
+        self._schedule_label_update(self._pending_column_labels, object)
+
+    def _schedule_label_update(self, pending, object):
+        """Schedules the update of the items of an object, so that repeated
+        label changes update the items once per iteration of the event loop.
+        """
+        if not (self._pending_labels or self._pending_column_labels):
+            GUI.invoke_later(self._update_labels)
+        pending[id(object)] = object
+
+    def _update_labels(self):
+        """Updates the items of the objects whose labels have changed."""
+        labels, self._pending_labels = self._pending_labels, {}
+        column_labels = self._pending_column_labels
+        self._pending_column_labels = {}
+        if self._tree is None:
+            return
+
         # Prevent the itemChanged() signal from being emitted.
         blk = self._tree.blockSignals(True)
         try:
-            nids = []
-            for name2, nid in self._map[id(object)]:
-                if nid not in nids:
-                    try:
-                        node = self._get_node_data(nid)[1]
-                    except Exception:
-                        # node is either not ready or has been deleted
-                        continue
-                    nids.append(nid)
+            for object in labels.values():
+                for node, nid in self._nodes_of_object(object):
+                    self._set_label(nid, 0)
+                    self._update_icon(nid)
+
+            for object in column_labels.values():
+                for node, nid in self._nodes_of_object(object):
                     self._set_column_labels(nid, node, object)
         finally:
             self._tree.blockSignals(blk)
 
+    def _nodes_of_object(self, object):
+        """Returns the nodes and items of the items displaying an object."""
+        # Have to use a list rather than a set because nids for PyQt
+        # on Python 3 (QTreeWidgetItem instances) aren't hashable.
+        # This means potentially quadratic behaviour, but the number of
+        # nodes for a particular object shouldn't be high
+        nids = []
+        nodes = []
+        for name2, nid in self._map.get(object, ()):
+            if nid not in nids:
+                try:
+                    node = self._get_node_data(nid)[1]
+                except Exception:
+                    # node is either not ready or has been deleted
+                    continue
+                nids.append(nid)
+                nodes.append((node, nid))
+        return nodes
+
     # -- UI preference save/restore interface ---------------------------------
 
     def restore_prefs(self, prefs):
@@ -1607,7 +1909,7 @@ class _TreeWidget(QtGui.QTreeWidget):
 
         # Convert the item being dragged to MIME data.
         drag_object = node.get_drag_object(object)
-        md = PyMimeData.coerce(drag_object)
+        md = LocalPyMimeData.coerce(drag_object)
 
         # Render the item being dragged as a pixmap.
         rect = nid_rect.intersected(self.viewport().rect())
@@ -1643,7 +1945,7 @@ class _TreeWidget(QtGui.QTreeWidget):
         e.ignore()
 
         # Check if we have a python object instance, we might be interested
-        data = PyMimeData.coerce(e.mimeData()).instance()
+        data = instance_from_mime_data(e.mimeData())
         if data is None:
             return
 
@@ -1753,7 +2055,7 @@ class _TreeWidget(QtGui.QTreeWidget):
 
                 pnid = pnid.parent()
 
-        data = PyMimeData.coerce(event.mimeData()).instance()
+        data = instance_from_mime_data(event.mimeData())
         _, node, object = editor._get_node_data(nid)
 
         if (
@@ -1800,6 +2102,9 @@ class TreeItemDelegate(QtGui.QStyledItemDelegate):
         """returns area taken by the text."""
         column = index.column()
         item = self.editor._tree.itemFromIndex(index)
+        if not hasattr(item, "_py_data"):
+            # A placeholder for children being loaded.
+            return super().sizeHint(option, index)
         expanded, node, instance = self.editor._get_node_data(item)
         column = index.column()
 
@@ -1821,6 +2126,10 @@ class TreeItemDelegate(QtGui.QStyledItemDelegate):
     def paint(self, painter, option, index):
         """Render the contents of the item."""
         item = self.editor._tree.itemFromIndex(index)
+        if not hasattr(item, "_py_data"):
+            # A placeholder for children being loaded.
+            super().paint(painter, option, index)
+            return
         expanded, node, instance = self.editor._get_node_data(item)
         column = index.column()
 
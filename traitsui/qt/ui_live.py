@@ -27,7 +27,7 @@
 
 from pyface.qt import QtCore, QtGui
 
-from traitsui.undo import UndoHistory
+from traitsui.undo import view_undo_history
 
 from traitsui.menu import (
     UndoButton,
@@ -120,7 +120,7 @@ class _LiveWindow(BaseDialog):
 
         if has_buttons or (view.menubar is not None):
             if history is None:
-                history = UndoHistory()
+                history = view_undo_history(view)
         else:
             history = None
 
@@ -25,6 +25,7 @@
 
 from html import escape
 import re
+from time import perf_counter
 
 from pyface.qt import QtCore, QtGui
 
@@ -33,17 +34,26 @@ from traits.observation.api import match
 
 from traitsui.api import Group
 
-from traitsui.undo import UndoHistory
+from traitsui.undo import view_undo_history
 
 from traitsui.help_template import help_template
 
 from traitsui.menu import UndoButton, RevertButton, HelpButton
 
+from traitsui.profiling import active_profile, recorded
+
 from .helper import position_window
 
 from .ui_base import BasePanel
 
+from .display_item import (
+    can_display,
+    DisplayItem,
+    DisplayItemRouter,
+    get_formatter,
+)
 from .editor import Editor
+from .virtual_group import can_virtualise, VirtualItemsArea
 
 
 #: Characters that are considered punctuation symbols at the end of a label.
@@ -135,7 +145,7 @@ class _Panel(BasePanel):
                 if self.is_button(button, "Undo") or self.is_button(
                     button, "Revert"
                 ):
-                    history = ui.history = UndoHistory()
+                    history = ui.history = view_undo_history(view)
                     break
 
         # Create the panel.
@@ -252,6 +262,7 @@ class _Panel(BasePanel):
         return self.ui.eval_when(action.defined_when)
 
 
+@recorded("panel")
 def panel(ui):
     """Creates a panel-based PyQt user interface for a specified UI object.
     This function does not modify the UI object passed to it.  The object
@@ -340,6 +351,21 @@ def _fill_panel(panel, content, ui, item_handler=None):
     panel.setCurrentIndex(active)
 
 
+def _count_widgets(control):
+    """Returns the number of widgets in a control (including itself)."""
+    if isinstance(control, QtGui.QWidget):
+        return 1 + len(control.findChildren(QtGui.QWidget))
+    elif isinstance(control, QtGui.QLayout):
+        count = 0
+        for i in range(control.count()):
+            layout_item = control.itemAt(i)
+            count += _count_widgets(
+                layout_item.widget() or layout_item.layout()
+            )
+        return count
+    return 0
+
+
 def _size_hint_wrapper(f, ui):
     """Wrap an existing sizeHint method with sizes from a UI object."""
 
@@ -615,7 +641,9 @@ class _GroupPanel(object):
                 # Create an editor.
                 self._setup_editor(group, GroupEditor(control=outer))
 
-            if isinstance(content[0], Group):
+            if can_virtualise(group, content):
+                layout = self._add_virtual_items(content, inner)
+            elif isinstance(content[0], Group):
                 layout = self._add_groups(content, inner)
             else:
                 layout = self._add_items(content, inner)
@@ -816,60 +844,42 @@ class _GroupPanel(object):
 
             else:
                 # Otherwise, it must be a trait Item:
+                profile = active_profile()
+                if profile is not None:
+                    start = perf_counter()
+
                 object = eval(item.object_, globals(), ui.context)
                 trait = object.base_trait(name)
-                desc = trait.tooltip
-                if desc is None:
-                    desc = "Specifies " + trait.desc if trait.desc else ""
+                desc = self._get_description(trait)
 
                 # Get the editor factory associated with the Item:
-                editor_factory = item.editor
-                if editor_factory is None:
-                    editor_factory = trait.get_editor().trait_set(
-                        **item.editor_args
+                editor_factory = self._get_editor_factory(item, trait)
+                if can_display(item, editor_factory):
+                    self._add_display_item(
+                        item,
+                        object,
+                        name,
+                        editor_factory,
+                        desc,
+                        inner,
+                        row,
+                        col,
+                        show_labels,
+                        label_alignment,
                     )
-
-                    # If still no editor factory found, use a default text editor:
-                    if editor_factory is None:
-                        from .text_editor import ToolkitEditorFactory
-
-                        editor_factory = ToolkitEditorFactory()
-
-                    # If the item has formatting traits set them in the editor
-                    # factory:
-                    if item.format_func is not None:
-                        editor_factory.format_func = item.format_func
-
-                    if item.format_str != "":
-                        editor_factory.format_str = item.format_str
-
-                    # If the item has an invalid state extended trait name, set it
-                    # in the editor factory:
-                    if item.invalid != "":
-                        editor_factory.invalid = item.invalid
-
-                # Create the requested type of editor from the editor factory:
-                factory_method = getattr(
-                    editor_factory, item.style + "_editor"
+                    continue
+
+                # Create the requested type of editor from the editor factory.
+                # Note that "inner" is a layout.  This shouldn't matter as
+                # individual editors shouldn't be using it as a parent anyway.
+                # The important thing is that it is not None (otherwise the
+                # main TraitsUI code can change the "kind" of the created UI
+                # object).
+                editor = self._create_editor(
+                    item, object, name, editor_factory, inner
                 )
-                editor = factory_method(
-                    ui, object, name, item.tooltip, None
-                ).trait_set(item=item, object_name=item.object)
-
-                # Tell the editor to actually build the editing widget.  Note that
-                # "inner" is a layout.  This shouldn't matter as individual editors
-                # shouldn't be using it as a parent anyway.  The important thing is
-                # that it is not None (otherwise the main TraitsUI code can change
-                # the "kind" of the created UI object).
-                editor.prepare(inner)
                 control = editor.control
 
-                if item.style_sheet:
-                    control.setStyleSheet(item.style_sheet)
-
-                # Set the initial 'enabled' state of the editor from the factory:
-                editor.enabled = editor_factory.enabled
-
                 # Handle any label.
                 if item.show_label:
                     label = self._create_label(item, ui, desc)
@@ -972,6 +982,18 @@ class _GroupPanel(object):
                 if item.enabled_when != "":
                     ui.add_enabled(item.enabled_when, editor)
 
+                if profile is not None:
+                    profile.add_event(
+                        id,
+                        "item",
+                        start,
+                        perf_counter(),
+                        {
+                            "editor": editor.__class__.__name__,
+                            "widgets": _count_widgets(control),
+                        },
+                    )
+
         if (
             len(self._label_enabled_whens) + len(self._label_visible_whens)
         ) > 0:
@@ -983,6 +1005,120 @@ class _GroupPanel(object):
 
         return outer
 
+    def _add_virtual_items(self, content, outer=None):
+        """Adds a list of Item objects to a scroll area which only creates
+        editors for the visible items.  Returns the outermost layout.
+        """
+        if outer is None:
+            outer = QtGui.QBoxLayout(self.direction)
+
+        area = VirtualItemsArea(self, content)
+        self.ui._dispatchers.append(area)
+        outer.addWidget(area)
+        self.ui._scrollable = True
+
+        return outer
+
+    def _get_editor_factory(self, item, trait):
+        """Returns the editor factory to use for an Item editing a trait."""
+        editor_factory = item.editor
+        if editor_factory is None:
+            editor_factory = trait.get_editor().trait_set(**item.editor_args)
+
+            # If still no editor factory found, use a default text editor:
+            if editor_factory is None:
+                from .text_editor import ToolkitEditorFactory
+
+                editor_factory = ToolkitEditorFactory()
+
+            # If the item has formatting traits set them in the editor
+            # factory:
+            if item.format_func is not None:
+                editor_factory.format_func = item.format_func
+
+            if item.format_str != "":
+                editor_factory.format_str = item.format_str
+
+            # If the item has an invalid state extended trait name, set it
+            # in the editor factory:
+            if item.invalid != "":
+                editor_factory.invalid = item.invalid
+
+        return editor_factory
+
+    def _create_editor(self, item, object, name, editor_factory, parent):
+        """Creates and prepares the editor for an Item."""
+        # Create the requested type of editor from the editor factory:
+        factory_method = getattr(editor_factory, item.style + "_editor")
+        editor = factory_method(
+            self.ui, object, name, item.tooltip, None
+        ).trait_set(item=item, object_name=item.object)
+
+        # Tell the editor to actually build the editing widget:
+        editor.prepare(parent)
+
+        if item.style_sheet:
+            editor.control.setStyleSheet(item.style_sheet)
+
+        # Set the initial 'enabled' state of the editor from the factory:
+        editor.enabled = editor_factory.enabled
+
+        return editor
+
+    def _add_display_item(
+        self,
+        item,
+        object,
+        name,
+        editor_factory,
+        desc,
+        inner,
+        row,
+        col,
+        show_labels,
+        label_alignment,
+    ):
+        """Adds a read-only Item displayed as a label, without an editor."""
+        ui = self.ui
+        router = ui._display_router
+        if router is None:
+            router = ui._display_router = DisplayItemRouter()
+            ui._dispatchers.append(router)
+
+        formatter = get_formatter(
+            editor_factory.format_func, editor_factory.format_str
+        )
+        display_item = DisplayItem(
+            object, name, formatter, item, editor_factory, desc
+        )
+        router.add(display_item)
+        control = display_item.control
+
+        if item.style_sheet:
+            control.setStyleSheet(item.style_sheet)
+
+        if item.show_label:
+            label = self._create_label(item, ui, desc)
+            self._add_widget(
+                inner, label, row, col, show_labels, label_alignment
+            )
+        else:
+            label = None
+
+        display_item.label_control = label
+
+        if item.emphasized:
+            self._add_emphasis(control)
+
+        self._set_item_size_policy(display_item, item, label, 0)
+        self._add_widget(inner, control, row, col, show_labels)
+
+        if item.visible_when != "":
+            ui.add_visible(item.visible_when, display_item)
+
+        if item.enabled_when != "":
+            ui.add_enabled(item.enabled_when, display_item)
+
     def _add_label_item(self, item, inner, row, col, show_labels):
         label = item.label
         # Create the label widget.
@@ -1202,16 +1338,7 @@ class _GroupPanel(object):
 
         """
 
-        label = item.get_label(ui)
-
-        # append a suffix if the label is on the left and it does
-        # not already end with a punctuation character
-        if (
-            label != ""
-            and label[-1] not in LABEL_PUNCTUATION_CHARS
-            and self.group.show_left
-        ):
-            label = label + suffix
+        label = self._get_label_text(item, suffix)
 
         # create label controller
         label_control = QtGui.QLabel(label)
@@ -1229,6 +1356,31 @@ class _GroupPanel(object):
 
         return label_control
 
+    def _get_description(self, trait):
+        """Returns the description of a trait, used as the tooltip of the
+        label of its Item.
+        """
+        desc = trait.tooltip
+        if desc is None:
+            desc = "Specifies " + trait.desc if trait.desc else ""
+        return desc
+
+    def _get_label_text(self, item, suffix=":"):
+        """Returns the text of the label of an Item.
+
+        A suffix is appended if the label is on the left and it does not
+        already end with a punctuation character.
+        """
+        label = item.get_label(self.ui)
+        if (
+            label != ""
+            and label[-1] not in LABEL_PUNCTUATION_CHARS
+            and self.group.show_left
+        ):
+            label = label + suffix
+
+        return label
+
     def _add_emphasis(self, control):
         """Adds emphasis to a specified control's font."""
         # Set the foreground colour.
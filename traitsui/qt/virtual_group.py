@@ -0,0 +1,329 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" A scroll area for groups with ``virtual`` set, which only creates the
+editors of the items in or near its viewport.
+
+Each item is displayed as a row of uniform height.  As the area is scrolled,
+the rows leaving the viewport are released and their editors are rebound to
+the items entering it whenever their editor factories are equivalent, so
+that the number of editors only depends on the size of the viewport.
+"""
+
+from pyface.qt import QtCore, QtGui
+
+#: The number of rows realised above and below the viewport.
+OVERSCAN = 5
+
+
+def can_virtualise(group, content):
+    """Returns whether the content of a group can be displayed virtually.
+
+    Parameters
+    ----------
+    group : ShadowGroup
+        The group being displayed.
+    content : list of Item
+        The content of the group.
+    """
+    if not (
+        group.virtual
+        and group.scrollable
+        and group.orientation == "vertical"
+        and group.columns == 1
+    ):
+        return False
+
+    for item in content:
+        name = getattr(item, "name", "")
+        if (
+            name in ("", " ", "_")
+            or name.isdigit()
+            or item.visible_when != ""
+            or item.enabled_when != ""
+        ):
+            return False
+    return True
+
+
+class _Row:
+    """The widgets and editor displaying one item."""
+
+    __slots__ = ("widget", "label", "editor", "key", "index")
+
+    def __init__(self, widget, label, editor, key):
+        self.widget = widget
+        self.label = label
+        self.editor = editor
+        self.key = key
+        self.index = -1
+
+
+class VirtualItemsArea(QtGui.QAbstractScrollArea):
+    """A scroll area displaying one row per item, with editors only created
+    for the rows in or near the viewport.
+
+    Parameters
+    ----------
+    panel : _GroupPanel
+        The panel of the group, used to create labels and editors.
+    items : list of Item
+        The items of the group.
+    """
+
+    def __init__(self, panel, items):
+        super().__init__()
+        self.panel = panel
+        self.items = items
+
+        # Realised rows keyed by item index:
+        self._rows = {}
+        # Released rows available for reuse, keyed by (style, factory class):
+        self._free = {}
+        # The trait values of the editor factories compared for reuse, keyed
+        # by factory id (with the factory, to keep the ids valid):
+        self._factory_traits = {}
+        self._row_height = 0
+        self._label_width = None
+        self._laying_out = False
+
+        self.setVerticalScrollBarPolicy(
+            QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded
+        )
+        self.setHorizontalScrollBarPolicy(
+            QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )
+        self.verticalScrollBar().valueChanged.connect(self._layout_rows)
+        policy = self.sizePolicy()
+        policy.setVerticalStretch(50)
+        policy.setHorizontalStretch(50)
+        self.setSizePolicy(policy)
+
+    # -- QAbstractScrollArea interface ----------------------------------------
+
+    def sizeHint(self):
+        """Returns a size showing a few rows."""
+        hint = super().sizeHint()
+        if self.panel is not None:
+            self._ensure_row_height()
+        rows = min(len(self.items), 10)
+        return QtCore.QSize(hint.width(), rows * self._row_height + 2)
+
+    def resizeEvent(self, event):
+        """Relayouts the rows when the viewport is resized."""
+        super().resizeEvent(event)
+        self._layout_rows()
+
+    def showEvent(self, event):
+        """Realises the visible rows when the area is first shown."""
+        super().showEvent(event)
+        self._layout_rows()
+
+    # -- Public methods -------------------------------------------------------
+
+    def remove(self):
+        """Stops realising rows.
+
+        The area is registered as one of the UI's dispatchers so that this is
+        called when the UI is reset or disposed, after its editors (including
+        those of the area) have been disposed.
+        """
+        self.panel = None
+        self._rows = {}
+        self._free = {}
+        self._factory_traits = {}
+
+    # -- Private methods ------------------------------------------------------
+
+    def _ensure_row_height(self):
+        """Computes the row height from the first item, if not known."""
+        if self._row_height == 0 and len(self.items) > 0:
+            row = self._acquire(0)
+            self._release(row)
+
+    def _layout_rows(self, *args):
+        """Realises the rows in or near the viewport and positions them."""
+        if self.panel is None or self._laying_out:
+            return
+
+        self._laying_out = True
+        try:
+            self._do_layout_rows()
+        finally:
+            self._laying_out = False
+
+    def _do_layout_rows(self):
+        """Does the work of _layout_rows, which guards against re-entrance
+        when the scroll bar's range changes.
+        """
+        self._ensure_row_height()
+        height = self._row_height
+        if height == 0:
+            return
+
+        viewport = self.viewport()
+        scrollbar = self.verticalScrollBar()
+        count = len(self.items)
+        scrollbar.setRange(0, max(0, count * height - viewport.height()))
+        scrollbar.setPageStep(viewport.height())
+        scrollbar.setSingleStep(height)
+        offset = scrollbar.value()
+
+        first = max(0, offset // height - OVERSCAN)
+        last = min(count, (offset + viewport.height()) // height + OVERSCAN)
+
+        for index in list(self._rows):
+            if not first <= index < last:
+                self._release(self._rows.pop(index))
+
+        for index in range(first, last):
+            row = self._rows.get(index)
+            if row is None:
+                row = self._rows[index] = self._acquire(index)
+            row.widget.setGeometry(
+                0, index * height - offset, viewport.width(), height
+            )
+            row.widget.show()
+
+        # Rows may have grown the row height: lay out again if so.
+        if self._row_height != height:
+            self._do_layout_rows()
+            return
+
+        self._trim_free(last - first)
+
+    def _acquire(self, index):
+        """Returns a row displaying the item at an index, reusing a released
+        row if possible.
+        """
+        panel = self.panel
+        ui = panel.ui
+        item = self.items[index]
+        name = item.name
+        object = eval(item.object_, globals(), ui.context)
+        trait = object.base_trait(name)
+        factory = panel._get_editor_factory(item, trait)
+        key = (item.style, type(factory))
+
+        row = self._reusable_row(key, factory)
+        if row is not None:
+            row.editor.rebind(
+                object,
+                name,
+                item=item,
+                object_name=item.object,
+                description=item.tooltip,
+            )
+            if row.label is not None:
+                row.label.setText(self._label_text(item))
+                row.label.setToolTip(panel._get_description(trait))
+        else:
+            row = self._create_row(item, object, name, factory, key, trait)
+
+        row.index = index
+        hint = row.widget.sizeHint().height()
+        if hint > self._row_height:
+            self._row_height = hint
+        return row
+
+    def _release(self, row):
+        """Releases a row so that its editor can be reused."""
+        row.widget.hide()
+        row.index = -1
+        self._free.setdefault(row.key, []).append(row)
+
+    def _reusable_row(self, key, factory):
+        """Returns a released row whose editor factory is equivalent to a
+        factory, or None.
+        """
+        free = self._free.get(key)
+        if not free:
+            return None
+
+        traits = self._traits_of(factory)
+        for i, row in enumerate(free):
+            other = row.editor.factory
+            if other is factory or self._traits_of(other) == traits:
+                return free.pop(i)
+        return None
+
+    def _traits_of(self, factory):
+        """Returns the trait values of an editor factory, for comparison."""
+        try:
+            return self._factory_traits[id(factory)][1]
+        except KeyError:
+            traits = factory.trait_get()
+            self._factory_traits[id(factory)] = (factory, traits)
+            return traits
+
+    def _create_row(self, item, object, name, factory, key, trait):
+        """Creates a row and the editor of an item."""
+        panel = self.panel
+        ui = panel.ui
+        widget = QtGui.QWidget(self.viewport())
+        layout = QtGui.QHBoxLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        editor = panel._create_editor(item, object, name, factory, layout)
+        ui._editors.append(editor)
+
+        label = None
+        if item.show_label:
+            label = panel._create_label(
+                item, ui, panel._get_description(trait)
+            )
+            label.setFixedWidth(self._get_label_width())
+            editor.label_control = label
+            if panel.group.show_left:
+                layout.addWidget(label)
+                layout.addWidget(editor.control, 1)
+            else:
+                layout.addWidget(editor.control, 1)
+                layout.addWidget(label)
+        else:
+            layout.addWidget(editor.control, 1)
+
+        return _Row(widget, label, editor, key)
+
+    def _dispose_row(self, row):
+        """Disposes of the editor and widgets of a row."""
+        editor = row.editor
+        ui = self.panel.ui
+        if editor in ui._editors:
+            ui._editors.remove(editor)
+            editor.dispose()
+            editor.control = None
+        row.widget.deleteLater()
+
+    def _trim_free(self, visible):
+        """Disposes of the released rows in excess of the visible rows."""
+        excess = sum(len(free) for free in self._free.values()) - visible
+        for free in self._free.values():
+            while excess > 0 and free:
+                self._dispose_row(free.pop())
+                excess -= 1
+
+    def _label_text(self, item):
+        """Returns the text of the label of an item."""
+        return self.panel._get_label_text(item)
+
+    def _get_label_width(self):
+        """Returns the width of the widest label of the items."""
+        if self._label_width is None:
+            metrics = self.fontMetrics()
+            self._label_width = 4 + max(
+                (
+                    metrics.horizontalAdvance(self._label_text(item))
+                    for item in self.items
+                    if item.show_label
+                ),
+                default=0,
+            )
+        return self._label_width
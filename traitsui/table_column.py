@@ -31,9 +31,10 @@ from traits.api import (
     Union,
 )
 
-from traits.trait_base import user_name_for, xgetattr
+from traits.trait_base import user_name_for
 
 from .editor_factory import EditorFactory
+from .helper import extended_getter
 from .menu import Menu
 from .ui_traits import Image, AView, EditorStyle
 from .toolkit_traits import Color, Font
@@ -255,6 +256,14 @@ class TableColumn(HasPrivateTraits):
         """Returns the maximum value a numeric column can have."""
         return self.maximum
 
+    def begin_paint(self):
+        """Called before a table displaying the column is painted."""
+        pass
+
+    def end_paint(self):
+        """Called after a table displaying the column is painted."""
+        pass
+
     def on_click(self, object):
         """Called when the user clicks on the column."""
         pass
@@ -302,6 +311,11 @@ class ObjectColumn(TableColumn):
     #: Format function to apply to column values:
     format_func = Callable()
 
+    #: Should the raw values of the column be kept while a table displaying
+    #: it is painted, so that they are fetched once for all the data (text,
+    #: check state, colors...) of a cell?
+    cache_raw_values = Bool(False)
+
     # -------------------------------------------------------------------------
     #  Trait view definitions:
     # -------------------------------------------------------------------------
@@ -342,10 +356,36 @@ class ObjectColumn(TableColumn):
         if old != label:
             self.trait_property_changed("label", old, label)
 
+    def begin_paint(self):
+        """Called before a table displaying the column is painted."""
+        if self.cache_raw_values and self._raw_values is None:
+            self._raw_values = {}
+
+    def end_paint(self):
+        """Called after a table displaying the column is painted."""
+        self._raw_values = None
+
     def get_raw_value(self, object):
         """Gets the unformatted value of the column for a specified object."""
+        raw_values = self._raw_values
+        if raw_values is None:
+            return self._fetch_raw_value(object)
+
+        # The object is kept with its value so that its id stays valid:
         try:
-            return xgetattr(self.get_object(object), self.name)
+            return raw_values[id(object)][1]
+        except KeyError:
+            value = self._fetch_raw_value(object)
+            raw_values[id(object)] = (object, value)
+            return value
+
+    def _fetch_raw_value(self, object):
+        """Fetches the unformatted value of the column for an object."""
+        try:
+            getter = self._getter
+            if getter is None:
+                getter = self._getter = extended_getter(self.name)
+            return getter(self.get_object(object))
         except Exception as e:
             from traitsui.api import raise_to_debug
 
@@ -409,12 +449,22 @@ class ObjectColumn(TableColumn):
     def target_name(self, object):
         """Returns the target object and name for the column."""
         object = self.get_object(object)
-        name = self.name
-        col = name.rfind(".")
-        if col < 0:
+        target = self._target
+        if target is None:
+            path, __, name = self.name.rpartition(".")
+            getter = extended_getter(path) if path else None
+            target = self._target = (getter, name)
+
+        getter, name = target
+        if getter is None:
             return (object, name)
 
-        return (xgetattr(object, name[:col]), name[col + 1 :])
+        return (getter(object), name)
+
+    def _name_changed(self):
+        """Discards the getters compiled for the previous name."""
+        self._getter = None
+        self._target = None
 
 
 class ExpressionColumn(ObjectColumn):
@@ -525,6 +525,86 @@ class TabularAdapter(HasPrivateTraits):
         """
         getattr(object, trait)[row:row] = [value]
 
+    def delete_rows(self, object, trait, rows):
+        """Deletes the specified row items.
+
+        This is used to delete several rows at once, for example when a
+        multiple selection is deleted or moved by drag and drop.
+
+        The default implementation deletes the items with a single slice
+        assignment, so that a single list event is fired.  If the adapter
+        overrides :py:meth:`delete`, the items are deleted one by one with it
+        instead (from the highest row to the lowest).
+        """
+        rows = sorted(set(rows))
+        if len(rows) == 0:
+            return
+
+        if self._overrides("delete"):
+            for row in reversed(rows):
+                self.delete(object, trait, row)
+            return
+
+        items = getattr(object, trait)
+        start, end = rows[0], rows[-1] + 1
+        if end - start == len(rows):
+            del items[start:end]
+        else:
+            deleted = set(rows)
+            items[start:end] = [
+                items[row] for row in range(start, end) if row not in deleted
+            ]
+
+    def insert_rows(self, object, trait, row, values):
+        """Inserts the list ``values`` at the specified ``object.trait[row]``
+        index.
+
+        This is used to insert several values at once, for example when
+        several items are dropped on the table.
+
+        The default implementation inserts the values with a single slice
+        assignment, so that a single list event is fired.  If the adapter
+        overrides :py:meth:`insert`, the values are inserted one by one with
+        it instead.
+        """
+        if len(values) == 0:
+            return
+
+        if self._overrides("insert"):
+            for i, value in enumerate(values):
+                self.insert(object, trait, row + i, value)
+            return
+
+        getattr(object, trait)[row:row] = list(values)
+
+    def move_rows(self, object, trait, rows, row):
+        """Moves the specified row items so that they are consecutive, with
+        the first one at index ``row`` once they have been moved.
+
+        The default implementation reorders the items with a single slice
+        assignment, so that a single list event is fired.  If the adapter
+        overrides the methods deleting or inserting items, the items are
+        deleted with :py:meth:`delete_rows` and then inserted with
+        :py:meth:`insert_rows` instead.
+        """
+        rows = sorted(set(rows))
+        if len(rows) == 0:
+            return
+
+        if self._overrides("delete", "insert", "delete_rows", "insert_rows"):
+            values = [self.get_item(object, trait, i) for i in rows]
+            self.delete_rows(object, trait, rows)
+            self.insert_rows(object, trait, row, values)
+            return
+
+        items = getattr(object, trait)
+        moved = set(rows)
+        start = min(rows[0], row)
+        end = max(rows[-1] + 1, row + len(rows))
+        span = [items[i] for i in range(start, end) if i not in moved]
+        span[row - start:row - start] = [items[i] for i in rows]
+        items[start:end] = span
+
     def get_column(self, object, trait, index):
         """Returns the column id corresponding to a specified column index."""
         self.object, self.name = object, trait
@@ -730,6 +810,14 @@ class TabularAdapter(HasPrivateTraits):
         self.cache[key] = handler
         return handler()
 
+    def _overrides(self, *names):
+        """Returns whether the adapter overrides any of the given methods."""
+        cls = type(self)
+        return any(
+            getattr(cls, name) is not getattr(TabularAdapter, name)
+            for name in names
+        )
+
     def _get_handler_for(self, name, prefix):
         """Returns the handler for a specified trait name (or None if not
         found).
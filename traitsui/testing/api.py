@@ -50,6 +50,21 @@ Advanced usage
 
 - :class:`~.TargetRegistry`
 
+Profiling
+---------
+
+- :func:`~.profile_ui`
+- :class:`~.UIProfile`
+
+Performance assertions
+----------------------
+
+- :class:`~.PerformanceTestTools`
+- :func:`~.count_calls`
+- :func:`~.count_editor_updates`
+- :func:`~.count_model_data_calls`
+- :func:`~.time_create_ui`
+
 Exceptions
 ----------
 
@@ -97,6 +112,18 @@ from .tester.locator import (
 # Advanced usage
 from .tester.target_registry import TargetRegistry
 
+# Profiling
+from ..profiling import profile_ui, UIProfile
+
+# Performance assertions
+from .tester.performance import (
+    PerformanceTestTools,
+    count_calls,
+    count_editor_updates,
+    count_model_data_calls,
+    time_create_ui,
+)
+
 # Exceptions
 from .tester.exceptions import (
     Disabled,
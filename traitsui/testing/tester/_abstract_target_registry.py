@@ -22,6 +22,12 @@ class AbstractTargetRegistry(abc.ABC):
     by :class:`~traitsui.testing.tester.ui_wrapper.UIWrapper`.
     """
 
+    #: Whether the results of the lookups depend only on the class of the
+    #: target, so that the UIWrapper can memoise them.  Registries setting
+    #: this should increment a ``_generation`` count whenever new handlers
+    #: or solvers are registered.
+    _lookup_by_class = False
+
     @abc.abstractmethod
     def _get_handler(self, target, interaction):
         """Return a callable for handling an interaction for a given target.
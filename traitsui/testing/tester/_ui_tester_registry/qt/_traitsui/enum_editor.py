@@ -199,5 +199,7 @@ def register(registry):
     registry.register_interaction(
         target_class=ListEditor,
         interaction_class=SelectedText,
-        handler=lambda wrapper, _: wrapper._target.control.currentItem().text(),
+        handler=lambda wrapper, _: (
+            wrapper._target.control.currentIndex().data()
+        ),
     )
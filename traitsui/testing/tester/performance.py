@@ -0,0 +1,398 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Utilities for guarding against performance regressions of user
+interfaces in tests.
+
+The measurements include the processing of the GUI events (see
+:func:`~traitsui.testing._gui.process_cascade_events`) posted by the
+operations measured, so that deferred updates and repaints are accounted for.
+Counts are deterministic and are the preferred way of writing assertions that
+are stable on continuous integration machines; timings should be used with a
+generous bound.
+"""
+
+from contextlib import contextmanager
+import threading
+from time import perf_counter
+
+from traitsui.testing._exception_handling import reraise_exceptions
+from traitsui.testing._gui import process_cascade_events
+
+
+class UITimings:
+    """The time taken to create and dispose a user interface.
+
+    Attributes
+    ----------
+    create : float
+        The time taken to create the UI and process the resulting GUI events,
+        in seconds.
+    dispose : float
+        The time taken to dispose the UI and process the resulting GUI events,
+        in seconds.
+    """
+
+    def __init__(self, create, dispose):
+        self.create = create
+        self.dispose = dispose
+
+    @property
+    def total(self):
+        """The total time taken, in seconds."""
+        return self.create + self.dispose
+
+    def __repr__(self):
+        return "{}(create={:.6f}, dispose={:.6f})".format(
+            self.__class__.__name__, self.create, self.dispose
+        )
+
+
+class EditorUpdateCounts:
+    """The number of editor updates and conditions evaluations made.
+
+    Attributes
+    ----------
+    update_editor : int
+        The number of calls to ``Editor.update_editor``.
+    editors : dict of str: int
+        The number of calls to ``Editor.update_editor`` keyed by the name of
+        the class of the editor.
+    evaluate_when : int
+        The number of evaluations of the ``visible_when``, ``enabled_when``
+        and ``checked_when`` conditions of a UI.
+    """
+
+    def __init__(self):
+        self.update_editor = 0
+        self.editors = {}
+        self.evaluate_when = 0
+
+    def __repr__(self):
+        return "{}(update_editor={}, evaluate_when={}, editors={!r})".format(
+            self.__class__.__name__,
+            self.update_editor,
+            self.evaluate_when,
+            self.editors,
+        )
+
+
+class CallCount:
+    """The number of calls made to a method of an object.
+
+    Attributes
+    ----------
+    count : int
+        The number of calls made.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __repr__(self):
+        return "{}(count={})".format(self.__class__.__name__, self.count)
+
+
+def time_create_ui(object, ui_kwargs=None, tester=None, repeat=1):
+    """Measure the time to create and dispose a UI with ``UITester``.
+
+    Parameters
+    ----------
+    object : HasTraits
+        The object for which a UI is created.
+    ui_kwargs : dict or None, optional
+        Keyword arguments to be provided to ``HasTraits.edit_traits``.
+    tester : UITester or None, optional
+        The tester used to create the UI.  Default is a new ``UITester``.
+    repeat : int, optional
+        The number of times the UI is created.  The fastest creation and
+        disposal times are returned, which reduces the noise of the
+        measurement.  Default is 1.
+
+    Returns
+    -------
+    timings : UITimings
+    """
+    if tester is None:
+        from traitsui.testing.tester.ui_tester import UITester
+
+        tester = UITester()
+
+    create = dispose = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        with tester.create_ui(object, ui_kwargs):
+            if tester.auto_process_events:
+                with reraise_exceptions():
+                    process_cascade_events()
+            created = perf_counter()
+        end = perf_counter()
+        create = min(create, created - start)
+        dispose = min(dispose, end - created)
+    return UITimings(create=create, dispose=dispose)
+
+
+@contextmanager
+def count_editor_updates():
+    """Context manager counting the editor updates and evaluations of
+    conditions made within it.
+
+    GUI events are processed before exiting the context so that deferred
+    updates are counted.  Only the editor classes defined when entering the
+    context are counted.
+
+    Yields
+    ------
+    counts : EditorUpdateCounts
+        The counts, which are complete once the context has exited.
+    """
+    from traitsui.editor import Editor
+    from traitsui.ui import UI
+
+    counts = EditorUpdateCounts()
+    # Editors whose update is in progress, so that overrides calling the
+    # super class' method are counted once.
+    updating = threading.local()
+
+    def wrap_update_editor(method):
+        def update_editor(self, *args, **kwargs):
+            active = updating.__dict__.setdefault("editors", set())
+            if id(self) in active:
+                return method(self, *args, **kwargs)
+
+            counts.update_editor += 1
+            name = self.__class__.__name__
+            counts.editors[name] = counts.editors.get(name, 0) + 1
+            active.add(id(self))
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                active.discard(id(self))
+
+        return update_editor
+
+    def wrap_evaluate_when(method):
+        def _do_evaluate_when(self, *args, **kwargs):
+            counts.evaluate_when += 1
+            return method(self, *args, **kwargs)
+
+        return _do_evaluate_when
+
+    patches = [(UI, "_do_evaluate_when", wrap_evaluate_when)]
+    patches.extend(
+        (cls, "update_editor", wrap_update_editor)
+        for cls in _subclasses(Editor)
+        if "update_editor" in cls.__dict__
+    )
+    with _patched_methods(patches):
+        yield counts
+        with reraise_exceptions():
+            process_cascade_events()
+
+
+@contextmanager
+def count_calls(object, method_name):
+    """Context manager counting the calls made to a method of an object.
+
+    The method is patched on the class of the object, so that calls made by
+    the toolkit to overridden virtual methods (eg. ``data`` of a Qt item
+    model) are counted.  GUI events are processed before exiting the context
+    so that the calls made while repainting are counted.
+
+    Parameters
+    ----------
+    object : any
+        The object whose method calls are counted.
+    method_name : str
+        The name of the method.
+
+    Yields
+    ------
+    count : CallCount
+        The count, which is complete once the context has exited.
+    """
+    count = CallCount()
+
+    def wrap(method):
+        def wrapper(self, *args, **kwargs):
+            if self is object:
+                count.count += 1
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    with _patched_methods([(type(object), method_name, wrap)]):
+        yield count
+        with reraise_exceptions():
+            process_cascade_events()
+
+
+def count_model_data_calls(model):
+    """Context manager counting the requests for data made to a table model.
+
+    This counts the calls to ``data`` of a Qt item model, or ``GetValue`` of
+    a wx grid table.
+
+    Parameters
+    ----------
+    model : QAbstractItemModel or wx.grid.GridTableBase
+        The model, eg. the ``model`` of a ``TableEditor`` or
+        ``TabularEditor``.
+
+    Yields
+    ------
+    count : CallCount
+        The count, which is complete once the context has exited.
+    """
+    if hasattr(model, "GetValue"):
+        return count_calls(model, "GetValue")
+    return count_calls(model, "data")
+
+
+class PerformanceTestTools:
+    """Mixin for ``unittest.TestCase`` providing assertions on the
+    performance of user interfaces.
+    """
+
+    def assertCreateUIWithin(
+        self, seconds, object, ui_kwargs=None, tester=None, repeat=1
+    ):
+        """Assert that a UI is created and disposed within a given time.
+
+        Parameters
+        ----------
+        seconds : float
+            The maximum time allowed to create and dispose the UI.
+        object : HasTraits
+            The object for which a UI is created.
+        ui_kwargs : dict or None, optional
+            Keyword arguments to be provided to ``HasTraits.edit_traits``.
+        tester : UITester or None, optional
+            The tester used to create the UI.
+        repeat : int, optional
+            The number of times the UI is created; the fastest time is
+            compared.  Default is 1.
+
+        Returns
+        -------
+        timings : UITimings
+        """
+        timings = time_create_ui(
+            object, ui_kwargs=ui_kwargs, tester=tester, repeat=repeat
+        )
+        if timings.total > seconds:
+            self.fail(
+                "Creating and disposing the UI took {:.3f}s "
+                "(create {:.3f}s, dispose {:.3f}s), which is more than "
+                "{:.3f}s".format(
+                    timings.total, timings.create, timings.dispose, seconds
+                )
+            )
+        return timings
+
+    @contextmanager
+    def assertEditorUpdatesAtMost(self, count, evaluate_when=None):
+        """Context manager asserting that at most ``count`` editor updates
+        are made within it.
+
+        Parameters
+        ----------
+        count : int
+            The maximum number of calls to ``Editor.update_editor``.
+        evaluate_when : int or None, optional
+            If given, the maximum number of evaluations of the conditions of
+            the UIs.
+
+        Yields
+        ------
+        counts : EditorUpdateCounts
+        """
+        with count_editor_updates() as counts:
+            yield counts
+
+        if counts.update_editor > count:
+            self.fail(
+                "Expected at most {} editor updates, got {}: {!r}".format(
+                    count, counts.update_editor, counts.editors
+                )
+            )
+        if evaluate_when is not None and counts.evaluate_when > evaluate_when:
+            self.fail(
+                "Expected at most {} evaluations of the 'when' conditions, "
+                "got {}".format(evaluate_when, counts.evaluate_when)
+            )
+
+    @contextmanager
+    def assertDataCallsAtMost(self, model, count):
+        """Context manager asserting that a table model receives at most
+        ``count`` requests for data within it.
+
+        Parameters
+        ----------
+        model : QAbstractItemModel or wx.grid.GridTableBase
+            The model, eg. the ``model`` of a ``TableEditor``.
+        count : int
+            The maximum number of requests.
+
+        Yields
+        ------
+        count : CallCount
+        """
+        with count_model_data_calls(model) as calls:
+            yield calls
+
+        if calls.count > count:
+            self.fail(
+                "Expected at most {} requests for data, got {}".format(
+                    count, calls.count
+                )
+            )
+
+
+def _subclasses(cls):
+    """Return the class and all its subclasses."""
+    classes = [cls]
+    seen = {cls}
+    for klass in classes:
+        for subclass in klass.__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                classes.append(subclass)
+    return classes
+
+
+@contextmanager
+def _patched_methods(patches):
+    """Context manager replacing methods of classes with wrappers.
+
+    Parameters
+    ----------
+    patches : list of (class, str, callable)
+        The classes, the names of the methods and callables returning a
+        wrapper given the original method.
+    """
+    originals = []
+    try:
+        for cls, name, wrap in patches:
+            original = cls.__dict__.get(name, _MISSING)
+            method = getattr(cls, name)
+            setattr(cls, name, wrap(method))
+            originals.append((cls, name, original))
+        yield
+    finally:
+        for cls, name, original in reversed(originals):
+            if original is _MISSING:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+
+#: Marker for methods not defined in the patched class itself.
+_MISSING = object()
@@ -93,7 +93,14 @@ class TargetRegistry(AbstractTargetRegistry):
     details.
     """
 
+    # Lookups only depend on the class of the target.
+    _lookup_by_class = True
+
     def __init__(self):
+        # The number of registrations made, used to invalidate lookups
+        # memoised by UIWrapper.
+        self._generation = 0
+
         self._interaction_registry = _TargetToKeyRegistry(
             exception_maker=(
                 lambda target_class, key, available_keys: (
@@ -139,6 +146,7 @@ class TargetRegistry(AbstractTargetRegistry):
             key=interaction_class,
             value=handler,
         )
+        self._generation += 1
 
     def _get_handler(self, target, interaction):
         """Return a callable for handling an interaction for a given target.
@@ -235,6 +243,7 @@ class TargetRegistry(AbstractTargetRegistry):
             key=locator_class,
             value=solver,
         )
+        self._generation += 1
 
     def _get_solver(self, target, location):
         """Return a callable registered for resolving a location for the
@@ -0,0 +1,150 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from traits.api import HasTraits, Int, List, Str
+
+from traitsui.api import Item, TabularEditor, View
+from traitsui.editor import Editor
+from traitsui.tabular_adapter import TabularAdapter
+from traitsui.testing.tester.performance import (
+    count_editor_updates,
+    count_model_data_calls,
+    PerformanceTestTools,
+    time_create_ui,
+)
+from traitsui.testing.tester.ui_tester import UITester
+from traitsui.tests._tools import (
+    BaseTestMixin,
+    process_cascade_events,
+    requires_toolkit,
+    ToolkitName,
+)
+from traitsui.ui import UI
+
+
+class Model(HasTraits):
+
+    count = Int()
+
+    name = Str()
+
+    rows = List()
+
+    traits_view = View(
+        Item("count"),
+        Item("name", enabled_when="count > 0"),
+    )
+
+
+@requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+class TestPerformance(BaseTestMixin, PerformanceTestTools, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def test_time_create_ui(self):
+        timings = time_create_ui(Model(), repeat=2)
+
+        self.assertGreater(timings.create, 0)
+        self.assertGreater(timings.dispose, 0)
+        self.assertEqual(timings.total, timings.create + timings.dispose)
+
+    def test_assert_create_ui_within(self):
+        self.assertCreateUIWithin(60.0, Model())
+
+        with self.assertRaises(AssertionError):
+            self.assertCreateUIWithin(0.0, Model())
+
+    def test_count_editor_updates(self):
+        model = Model()
+        tester = UITester()
+        with tester.create_ui(model):
+            with count_editor_updates() as counts:
+                model.count = 1
+
+        self.assertEqual(counts.update_editor, 1)
+        self.assertEqual(sum(counts.editors.values()), 1)
+        self.assertEqual(counts.evaluate_when, 1)
+
+    def test_count_editor_updates_restores_methods(self):
+        update_editor = Editor.__dict__["update_editor"]
+        do_evaluate_when = UI.__dict__["_do_evaluate_when"]
+
+        with count_editor_updates():
+            self.assertIsNot(Editor.__dict__["update_editor"], update_editor)
+
+        self.assertIs(Editor.__dict__["update_editor"], update_editor)
+        self.assertIs(UI.__dict__["_do_evaluate_when"], do_evaluate_when)
+
+    def test_assert_editor_updates_at_most(self):
+        model = Model()
+        tester = UITester()
+        with tester.create_ui(model):
+            with self.assertEditorUpdatesAtMost(1, evaluate_when=1):
+                model.count = 1
+
+            with self.assertRaises(AssertionError):
+                with self.assertEditorUpdatesAtMost(0):
+                    model.count = 2
+
+            with self.assertRaises(AssertionError):
+                with self.assertEditorUpdatesAtMost(1, evaluate_when=0):
+                    model.count = 3
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_assert_data_calls_at_most(self):
+        model = Model(rows=[str(i) for i in range(1000)])
+        view = View(
+            Item(
+                "rows",
+                editor=TabularEditor(
+                    adapter=TabularAdapter(columns=[("Value", 0)])
+                ),
+            )
+        )
+        tester = UITester()
+        with tester.create_ui(model, dict(view=view)) as ui:
+            (editor,) = ui.get_editors("rows")
+            editor.control.show()
+            with self.assertDataCallsAtMost(editor.model, 100000) as calls:
+                editor.control.scrollToBottom()
+                editor.control.viewport().repaint()
+
+            self.assertGreater(calls.count, 0)
+
+            with self.assertRaises(AssertionError):
+                with self.assertDataCallsAtMost(editor.model, 0):
+                    editor.control.scrollToTop()
+                    editor.control.viewport().repaint()
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_count_model_data_calls_only_counts_model(self):
+        from pyface.qt import QtCore
+
+        model = Model(rows=["a", "b"])
+        adapter = TabularAdapter(columns=[("Value", 0)])
+        view = View(
+            Item("rows", id="first", editor=TabularEditor(adapter=adapter)),
+            Item("rows", id="second", editor=TabularEditor(adapter=adapter)),
+        )
+        tester = UITester()
+        with tester.create_ui(model, dict(view=view)) as ui:
+            first, second = ui.get_editors("rows")
+            process_cascade_events()
+
+            with count_model_data_calls(first.model) as calls:
+                index = second.model.index(0, 0)
+                second.model.data(index, QtCore.Qt.ItemDataRole.DisplayRole)
+
+        self.assertEqual(calls.count, 0)
@@ -175,6 +175,97 @@ class TestUIWrapperInteractionRegistries(unittest.TestCase):
         )
 
 
+# Use of perform/inspect requires the GUI event loop
+@requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+class TestUIWrapperLookupCache(unittest.TestCase):
+    """Test the memoisation of handlers and solvers."""
+
+    def test_handler_memoised(self):
+        registry = TargetRegistry()
+        registry.register_interaction(
+            target_class=int,
+            interaction_class=str,
+            handler=lambda wrapper, interaction: 1,
+        )
+        wrapper = example_ui_wrapper(target=1, registries=[registry])
+        wrapper.inspect("a")
+
+        with mock.patch.object(
+            registry, "_get_handler", wraps=registry._get_handler
+        ) as get_handler:
+            value = wrapper.inspect("b")
+
+        self.assertEqual(value, 1)
+        self.assertEqual(get_handler.call_count, 0)
+
+    def test_handler_memoised_shared_with_located_wrapper(self):
+        registry = TargetRegistry()
+        registry.register_interaction(
+            target_class=int,
+            interaction_class=str,
+            handler=lambda wrapper, interaction: 1,
+        )
+        registry.register_location(
+            target_class=int,
+            locator_class=float,
+            solver=lambda wrapper, location: 2,
+        )
+        wrapper = example_ui_wrapper(target=1, registries=[registry])
+        wrapper.inspect("a")
+        new_wrapper = wrapper.locate(1.0)
+
+        with mock.patch.object(
+            registry, "_get_handler", wraps=registry._get_handler
+        ) as get_handler:
+            new_wrapper.inspect("b")
+            new_wrapper.locate(2.0)
+
+        self.assertEqual(get_handler.call_count, 0)
+
+    def test_new_registration_invalidates(self):
+        registry1 = TargetRegistry()
+        registry2 = TargetRegistry()
+        registry2.register_interaction(
+            target_class=int,
+            interaction_class=str,
+            handler=lambda wrapper, interaction: 2,
+        )
+        wrapper = example_ui_wrapper(
+            target=1, registries=[registry1, registry2]
+        )
+        self.assertEqual(wrapper.inspect("a"), 2)
+
+        registry1.register_interaction(
+            target_class=int,
+            interaction_class=str,
+            handler=lambda wrapper, interaction: 1,
+        )
+
+        self.assertEqual(wrapper.inspect("a"), 1)
+
+    def test_dynamic_registry_not_memoised(self):
+        # Registries which do not resolve lookups by the class of the target
+        # are always queried.
+        registry1 = StubRegistry(
+            handler=lambda wrapper, interaction: 1,
+            supported_interaction_classes=[str],
+        )
+        registry2 = TargetRegistry()
+        registry2.register_interaction(
+            target_class=int,
+            interaction_class=str,
+            handler=lambda wrapper, interaction: 2,
+        )
+        wrapper = example_ui_wrapper(
+            target=1, registries=[registry1, registry2]
+        )
+        self.assertEqual(wrapper.inspect("a"), 1)
+
+        registry1.supported_interaction_classes = []
+
+        self.assertEqual(wrapper.inspect("a"), 2)
+
+
 # Use of locate requires the GUI event loop
 @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
 class TestUIWrapperLocationRegistry(unittest.TestCase):
@@ -528,3 +619,47 @@ class TestUIWrapperEventProcessed(unittest.TestCase, UnittestTools):
 
         self.assertEqual(side_effect.call_count, 0)
         self.assertFalse(new_wrapper._auto_process_events)
+
+    def test_batch_processes_events_once(self):
+        gui = GUI()
+        side_effect = mock.Mock()
+
+        def handler(wrapper, action):
+            gui.invoke_later(side_effect)
+
+        wrapper = example_ui_wrapper(
+            registries=[
+                StubRegistry(
+                    handler=handler,
+                    supported_interaction_classes=[float],
+                ),
+            ],
+        )
+
+        with wrapper.batch():
+            wrapper.perform(1.0)
+            wrapper.perform(2.0)
+            self.assertEqual(side_effect.call_count, 0)
+
+        self.assertEqual(side_effect.call_count, 2)
+
+    def test_batch_shared_with_located_wrapper(self):
+        gui = GUI()
+        side_effect = mock.Mock()
+
+        def handler(wrapper, action):
+            gui.invoke_later(side_effect)
+
+        registry = StubRegistry(
+            handler=handler,
+            solver=lambda wrapper, location: 1,
+            supported_interaction_classes=[float],
+            supported_locator_classes=[str],
+        )
+        wrapper = example_ui_wrapper(registries=[registry])
+
+        with wrapper.batch():
+            wrapper.locate("child").perform(1.0)
+            self.assertEqual(side_effect.call_count, 0)
+
+        self.assertEqual(side_effect.call_count, 1)
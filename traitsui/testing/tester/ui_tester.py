@@ -18,7 +18,7 @@ from traitsui.testing._exception_handling import reraise_exceptions
 from traitsui.testing.tester._ui_tester_registry.default_registry import (
     get_default_registries,
 )
-from traitsui.testing.tester.ui_wrapper import UIWrapper
+from traitsui.testing.tester.ui_wrapper import UIWrapper, _WrapperState
 
 
 class UITester:
@@ -65,6 +65,8 @@ class UITester:
         self._registries.extend(get_default_registries())
         self.delay = delay
         self._auto_process_events = auto_process_events
+        # Lookups and batching state shared by the wrappers created.
+        self._wrapper_state = _WrapperState()
 
     @property
     def auto_process_events(self):
@@ -176,9 +178,11 @@ class UITester:
         -------
         wrapper : UIWrapper
         """
-        return UIWrapper(
+        wrapper = UIWrapper(
             target=ui,
             registries=self._registries,
             delay=self.delay,
             auto_process_events=self._auto_process_events,
         )
+        wrapper._state = self._wrapper_state
+        return wrapper
@@ -89,6 +89,9 @@ class UIWrapper:
         self._registries = registries
         self._auto_process_events = auto_process_events
         self.delay = delay
+        # Lookups and batching state shared with the wrappers created from
+        # this one.
+        self._state = _WrapperState()
 
     def help(self):
         """Print help messages.
@@ -166,12 +169,14 @@ class UIWrapper:
         --------
         UIWrapper.help
         """
-        return UIWrapper(
+        wrapper = UIWrapper(
             target=self._get_next_target(location),
             registries=self._registries,
             delay=self.delay,
             auto_process_events=self._auto_process_events,
         )
+        wrapper._state = self._state
+        return wrapper
 
     def find_by_name(self, name):
         """Find a target inside the current target using a name.
@@ -273,6 +278,37 @@ class UIWrapper:
         """
         return self._perform_or_inspect(interaction)
 
+    @contextmanager
+    def batch(self):
+        """Context manager to perform several interactions with a single
+        round of GUI event processing.
+
+        GUI events are processed when entering and exiting the context, but
+        not before and after each interaction, location or inspection made
+        within it, either with this wrapper or with any wrapper sharing its
+        origin (eg. created by the same ``UITester``).  This speeds up tests
+        performing many interactions whose intermediate states do not depend
+        on the events posted by the previous ones.
+
+        If ``auto_process_events`` is false no events are processed.
+
+        Yields
+        ------
+        wrapper : UIWrapper
+            This wrapper.
+        """
+        state = self._state
+        if self._auto_process_events and state.batch_depth == 0:
+            context = _event_processed
+        else:
+            context = _nullcontext
+        with context():
+            state.batch_depth += 1
+            try:
+                yield self
+            finally:
+                state.batch_depth -= 1
+
     # Private methods #########################################################
 
     def _perform_or_inspect(self, interaction):
@@ -293,6 +329,17 @@ class UIWrapper:
             If the given interaction does not have a corresponding
             implementation for the wrapped UI target.
         """
+        handler = self._state.lookup(
+            self._registries,
+            self._state.handlers,
+            "_get_handler",
+            self._target,
+            interaction,
+        )
+        if handler is not None:
+            with self._event_context():
+                return handler(self, interaction)
+
         supported = []
         for registry in self._registries:
             try:
@@ -304,12 +351,7 @@ class UIWrapper:
                 supported.extend(e.supported)
                 continue
             else:
-                context = (
-                    _event_processed
-                    if self._auto_process_events
-                    else _nullcontext
-                )
-                with context():
+                with self._event_context():
                     return handler(self, interaction)
 
         raise InteractionNotSupported(
@@ -336,6 +378,17 @@ class UIWrapper:
             If no solver are provided for resolving the given location in the
             wrapped UI target.
         """
+        solver = self._state.lookup(
+            self._registries,
+            self._state.solvers,
+            "_get_solver",
+            self._target,
+            location,
+        )
+        if solver is not None:
+            self._process_events()
+            return solver(self, location)
+
         supported = set()
         for registry in self._registries:
             try:
@@ -346,9 +399,7 @@ class UIWrapper:
             except LocationNotSupported as e:
                 supported |= set(e.supported)
             else:
-                if self._auto_process_events:
-                    with _reraise_exceptions():
-                        _process_cascade_events()
+                self._process_events()
                 return handler(self, location)
 
         raise LocationNotSupported(
@@ -357,6 +408,96 @@ class UIWrapper:
             supported=list(supported),
         )
 
+    def _event_context(self):
+        """Return a context manager processing GUI events around an
+        interaction, unless disabled or batched.
+        """
+        if self._auto_process_events and self._state.batch_depth == 0:
+            return _event_processed()
+        return _nullcontext()
+
+    def _process_events(self):
+        """Process GUI events before resolving a location, unless disabled
+        or batched.
+        """
+        if self._auto_process_events and self._state.batch_depth == 0:
+            with _reraise_exceptions():
+                _process_cascade_events()
+
+
+class _WrapperState:
+    """State shared between a UIWrapper and the wrappers created from it.
+
+    Attributes
+    ----------
+    handlers : dict
+        Memoised handlers, keyed by (target class, interaction class).
+    solvers : dict
+        Memoised solvers, keyed by (target class, locator class).
+    batch_depth : int
+        The number of nested ``UIWrapper.batch`` contexts active.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.solvers = {}
+        self.batch_depth = 0
+        # The identities and generations of the registries the memoised
+        # lookups were made with.
+        self._signature = None
+
+    def lookup(self, registries, cache, method_name, target, key_object):
+        """Return a handler or solver, memoising it where possible.
+
+        Lookups are memoised if the registries preceding the one providing
+        the handler or solver all resolve lookups by the class of the
+        target only.
+
+        Parameters
+        ----------
+        registries : list of AbstractTargetRegistry
+            The registries, in the order of decreasing priority.
+        cache : dict
+            Either ``handlers`` or ``solvers``.
+        method_name : str
+            Either "_get_handler" or "_get_solver".
+        target : any
+            The UI target.
+        key_object : any
+            The interaction or location.
+
+        Returns
+        -------
+        value : callable or None
+            The handler or solver, or None if it could not be found or
+            memoised, in which case the caller should search the registries.
+        """
+        signature = tuple(
+            (id(registry), getattr(registry, "_generation", None))
+            for registry in registries
+        )
+        if signature != self._signature:
+            self.handlers.clear()
+            self.solvers.clear()
+            self._signature = signature
+
+        key = (target.__class__, key_object.__class__)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        for registry in registries:
+            if not registry._lookup_by_class:
+                return None
+            try:
+                value = getattr(registry, method_name)(target, key_object)
+            except (InteractionNotSupported, LocationNotSupported):
+                continue
+            cache[key] = value
+            return value
+        return None
+
 
 @contextmanager
 def _event_processed():
@@ -45,6 +45,18 @@ class TestApi(unittest.TestCase):
     def test_advanced_usage_imports(self):
         from traitsui.testing.api import TargetRegistry  # noqa: F401
 
+    def test_profiling_imports(self):
+        from traitsui.testing.api import profile_ui, UIProfile  # noqa: F401
+
+    def test_performance_imports(self):
+        from traitsui.testing.api import (  # noqa: F401
+            PerformanceTestTools,
+            count_calls,
+            count_editor_updates,
+            count_model_data_calls,
+            time_create_ui,
+        )
+
     def test_exceptions_imports(self):
         from traitsui.testing.api import (  # noqa: F401
             Disabled,
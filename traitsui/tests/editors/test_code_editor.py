@@ -9,6 +9,7 @@
 # Thanks for using Enthought open source!
 
 import unittest
+from unittest import mock
 
 from traits.has_traits import HasTraits
 from traits.trait_types import Bool, Enum, Instance, Str
@@ -21,6 +22,7 @@ from traitsui.editors.code_editor import CodeEditor
 from traitsui.tests._tools import (
     BaseTestMixin,
     create_ui,
+    process_cascade_events,
     requires_toolkit,
     reraise_exceptions,
     ToolkitName,
@@ -99,3 +101,69 @@ class TestCodeEditor(BaseTestMixin, unittest.TestCase):
             self.assertEqual(txt_ctrl.toPlainText(), code_model.code)
 
             ui.control.close()
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_code_editor_incremental(self):
+        code_model = CodeModel(code="line 1\n")
+        view = View(Item("code", editor=CodeEditor(incremental=True)))
+        with reraise_exceptions(), create_ui(
+            code_model, dict(view=view)
+        ) as ui:
+            (editor,) = ui.get_editors("code")
+            code = editor._widget.code
+            self.assertEqual(code.toPlainText(), "line 1\n")
+
+            with mock.patch.object(code, "setPlainText") as set_plain_text:
+                code_model.code += "line 2\n"
+                code_model.code = code_model.code.replace("1", "one")
+
+            set_plain_text.assert_not_called()
+            self.assertEqual(code.toPlainText(), "line one\nline 2\n")
+
+            # User edits are taken into account:
+            code.appendPlainText("line 3")
+            self.assertEqual(code_model.code, "line one\nline 2\n\nline 3")
+            code_model.code += "\nline 4"
+            self.assertEqual(code.toPlainText(), code_model.code)
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_code_editor_max_lines(self):
+        code_model = CodeModel(code="\n".join(map(str, range(10))))
+        view = View(Item("code", editor=CodeEditor(max_lines=3)))
+        with reraise_exceptions(), create_ui(
+            code_model, dict(view=view)
+        ) as ui:
+            (editor,) = ui.get_editors("code")
+            code = editor._widget.code
+            self.assertTrue(code.isReadOnly())
+            self.assertEqual(code.toPlainText(), "7\n8\n9")
+
+            code_model.code += "\n10"
+            self.assertEqual(code.toPlainText(), "8\n9\n10")
+
+            code_model.code = "a"
+            self.assertEqual(code.toPlainText(), "a")
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_code_editor_auto_set_delay(self):
+        code_model = CodeModel(code="")
+        view = View(Item("code", editor=CodeEditor(auto_set_delay=10)))
+        with reraise_exceptions(), create_ui(
+            code_model, dict(view=view)
+        ) as ui:
+            (editor,) = ui.get_editors("code")
+            code = editor._widget.code
+
+            code.insertPlainText("a")
+            code.insertPlainText("b")
+            self.assertEqual(code_model.code, "")
+            self.assertTrue(editor._update_timer.isActive())
+
+            # Leaving the editor sets the pending input:
+            code.focus_lost.emit()
+            self.assertEqual(code_model.code, "ab")
+
+            code.insertPlainText("c")
+            editor._update_timer.timeout.emit()
+            process_cascade_events()
+            self.assertEqual(code_model.code, "abc")
@@ -11,7 +11,7 @@
 import contextlib
 import unittest
 
-from traits.api import Enum, HasTraits, Int, List
+from traits.api import Any, Enum, HasTraits, Int, List, Str
 from traitsui.api import EnumEditor, UItem, View
 from traitsui.tests._tools import (
     BaseTestMixin,
@@ -476,3 +476,168 @@ class TestListEnumEditor(BaseTestMixin, unittest.TestCase):
             # As a result the displayed text is actually the string 'None'
             displayed = list_editor.inspect(SelectedText())
             self.assertEqual(displayed, 'None')
+
+
+class EnumValuesModel(HasTraits):
+
+    values = List()
+
+    value = Int()
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestQtEnumListModel(BaseTestMixin, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def check_set_names(self, old, new):
+        from traitsui.qt.enum_editor import EnumListModel
+
+        model = EnumListModel(old)
+        changes = []
+        model.rowsInserted.connect(
+            lambda parent, first, last: changes.append(("insert", first, last))
+        )
+        model.rowsRemoved.connect(
+            lambda parent, first, last: changes.append(("remove", first, last))
+        )
+        model.dataChanged.connect(
+            lambda top_left, bottom_right, roles=(): changes.append(
+                ("change", top_left.row(), bottom_right.row())
+            )
+        )
+        model.modelReset.connect(lambda: changes.append(("reset",)))
+
+        model.set_names(new)
+
+        self.assertEqual(
+            [model.index(row).data() for row in range(model.rowCount())],
+            new,
+        )
+        return changes
+
+    def test_set_names_insert(self):
+        changes = self.check_set_names(
+            ["a", "b", "e"], ["a", "b", "c", "d", "e"]
+        )
+        self.assertEqual(changes, [("insert", 2, 3)])
+
+    def test_set_names_remove(self):
+        changes = self.check_set_names(["a", "b", "c", "d"], ["a", "d"])
+        self.assertEqual(changes, [("remove", 1, 2)])
+
+    def test_set_names_replace(self):
+        changes = self.check_set_names(["a", "b", "c"], ["a", "x", "y", "c"])
+        self.assertEqual(changes, [("change", 1, 1), ("insert", 2, 2)])
+
+    def test_set_names_unchanged(self):
+        changes = self.check_set_names(["a", "b"], ["a", "b"])
+        self.assertEqual(changes, [])
+
+    def test_separator(self):
+        from traitsui.qt.enum_editor import EnumListModel
+
+        model = EnumListModel(["a", "--", "b"], separator="--")
+
+        self.assertIsNone(model.index(1).data())
+        self.assertFalse(model.flags(model.index(1)))
+        self.assertTrue(model.flags(model.index(2)))
+
+    def test_large_values_change(self):
+        model = EnumValuesModel(values=list(range(10000)), value=5000)
+        view = View(
+            UItem("value", editor=EnumEditor(name="values", evaluate=int))
+        )
+        tester = UITester()
+        with tester.create_ui(model, dict(view=view)) as ui:
+            combobox = tester.find_by_name(ui, "value")
+            editor = combobox._target
+            self.assertEqual(combobox.inspect(SelectedText()), "5000")
+
+            changes = []
+            editor.control.model().modelReset.connect(
+                lambda: changes.append("reset")
+            )
+            model.values.append(10000)
+            model.value = 10000
+
+            self.assertEqual(changes, [])
+            self.assertEqual(editor.control.count(), 10001)
+            self.assertEqual(combobox.inspect(SelectedText()), "10000")
+
+
+class Person(HasTraits):
+
+    name = Str()
+
+    def __str__(self):
+        return self.name
+
+
+class PersonModel(HasTraits):
+
+    people = List()
+
+    person = Any()
+
+
+@requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+class TestEnumEditorSharedMappings(BaseTestMixin, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def test_editors_share_mappings(self):
+        model = EnumValuesModel(values=list(range(100)))
+        view = View(
+            UItem("value", editor=EnumEditor(name="values"), id="first"),
+            UItem(
+                "value",
+                editor=EnumEditor(name="values"),
+                style="custom",
+                id="second",
+            ),
+        )
+        tester = UITester()
+        with tester.create_ui(model, dict(view=view)) as ui:
+            first = tester.find_by_id(ui, "first")._target
+            second = tester.find_by_id(ui, "second")._target
+            self.assertIs(first.names, second.names)
+            self.assertIs(first.mapping, second.mapping)
+
+            model.values.append(100)
+
+            self.assertIs(first.names, second.names)
+            self.assertEqual(first.names[-1], "100")
+
+    def test_values_modified_in_place(self):
+        values = ["a", "b"]
+        model = EnumModel()
+        view = View(UItem("value", editor=EnumEditor(values=values)))
+        with reraise_exceptions(), create_ui(model, dict(view=view)) as ui:
+            editor = ui.get_editors("value")[0]
+            self.assertEqual(editor.names, ["a", "b"])
+
+        values.append("c")
+        view = View(UItem("value", editor=EnumEditor(values=values)))
+        with reraise_exceptions(), create_ui(model, dict(view=view)) as ui:
+            editor = ui.get_editors("value")[0]
+            self.assertEqual(editor.names, ["a", "b", "c"])
+
+    def test_values_formatted_again_when_modified(self):
+        alice = Person(name="alice")
+        model = PersonModel(people=[alice, Person(name="bob")], person=alice)
+        view = View(UItem("person", editor=EnumEditor(name="people")))
+        with reraise_exceptions(), create_ui(model, dict(view=view)) as ui:
+            editor = ui.get_editors("person")[0]
+            self.assertEqual(editor.names, ["alice", "bob"])
+
+            alice.name = "carol"
+            model.people[0] = alice
+
+            self.assertEqual(editor.names, ["carol", "bob"])
@@ -19,6 +19,7 @@ from traitsui.api import (
     Item,
     ObjectColumn,
     TableEditor,
+    TextEditor,
     View,
 )
 from traitsui.tests._tools import (
@@ -47,6 +48,12 @@ class ListItem(HasTraits):
     other_value = Int()
 
 
+class DescribedListItem(ListItem):
+    """Items with a description of their value"""
+
+    value = Str(desc="a described value")
+
+
 class ObjectListWithSelection(HasTraits):
     values = List(Instance(ListItem))
     selected = Instance(ListItem)
@@ -95,6 +102,37 @@ filtered_view = View(
     buttons=["OK"],
 )
 
+sorted_filtered_view = View(
+    Item(
+        "values",
+        show_label=False,
+        editor=TableEditor(
+            columns=[
+                ObjectColumn(name="value"),
+                ObjectColumn(name="other_value"),
+            ],
+            filter=EvalTableFilter(expression="other_value % 3 != 0"),
+        ),
+    ),
+    buttons=["OK"],
+)
+
+sort_model_view = View(
+    Item(
+        "values",
+        show_label=False,
+        editor=TableEditor(
+            columns=[
+                ObjectColumn(name="value"),
+                ObjectColumn(name="other_value"),
+            ],
+            filter=EvalTableFilter(expression="other_value % 3 != 0"),
+            sort_model=True,
+        ),
+    ),
+    buttons=["OK"],
+)
+
 select_row_view = View(
     Item(
         "values",
@@ -314,6 +352,25 @@ edit_on_first_click_false_view = View(
     buttons=["OK"],
 )
 
+reuse_cell_editors_view = View(
+    Item(
+        "values",
+        show_label=False,
+        editor=TableEditor(
+            sortable=False,
+            columns=[
+                # The same editor for all items, so that it is reused:
+                ObjectColumn(name="value", editor=TextEditor()),
+                ObjectColumn(name="other_value"),
+            ],
+            selection_mode="row",
+            selected="selected",
+            reuse_cell_editors=True,
+        ),
+    ),
+    buttons=["OK"],
+)
+
 
 @requires_toolkit([ToolkitName.qt])
 class TestTableEditor(BaseTestMixin, unittest.TestCase):
@@ -610,8 +667,56 @@ class TestTableEditor(BaseTestMixin, unittest.TestCase):
             values=[ListItem(value=str(i ** 2)) for i in range(10)]
         )
         tester = UITester()
-        with tester.create_ui(object_list, dict(view=progress_view)):
-            pass
+        with tester.create_ui(object_list, dict(view=progress_view)) as ui:
+            editor = tester.find_by_name(ui, "values")._target
+            editor.table_view.grab()
+            editor.table_view.grab()
+
+            # The progress bars of equal values are drawn once:
+            renderer = editor.columns[1].renderer
+            self.assertEqual(len(renderer._pixmaps), 1)
+
+    def test_image_renderer(self):
+        from pyface.qt import QtGui
+        from traitsui.qt.extra.table_image_renderer import (
+            TableImageRenderer,
+        )
+
+        image = Mock()
+        image.create_bitmap.side_effect = lambda: QtGui.QPixmap(8, 8)
+
+        class ImageRenderer(TableImageRenderer):
+            def get_image_for_obj(self, value, row, col):
+                return image
+
+        image_view = View(
+            Item(
+                "values",
+                show_label=False,
+                editor=TableEditor(
+                    columns=[
+                        ObjectColumn(name="value", renderer=ImageRenderer()),
+                    ]
+                ),
+            ),
+            buttons=["OK"],
+        )
+        object_list = ObjectList(
+            values=[ListItem(value=str(i ** 2)) for i in range(10)]
+        )
+        tester = UITester()
+        with tester.create_ui(object_list, dict(view=image_view)) as ui:
+            editor = tester.find_by_name(ui, "values")._target
+            editor.table_view.grab()
+            editor.table_view.grab()
+
+        # The image is loaded once for all the cells, paints and size hints:
+        self.assertEqual(image.create_bitmap.call_count, 1)
+
+        # Images are scaled to the resolution of high DPI devices:
+        pixmap = ImageRenderer()._get_pixmap(image, 8, 4, 2.0)
+        self.assertEqual((pixmap.width(), pixmap.height()), (16, 8))
+        self.assertEqual(pixmap.devicePixelRatio(), 2.0)
 
     def test_on_perform_action(self):
         # A test for issue #741, where actions with an on_perform function set
@@ -648,3 +753,150 @@ class TestTableEditor(BaseTestMixin, unittest.TestCase):
             wrapper.perform(MouseDClick())
             wrapper.perform(KeySequence("abc"))
             self.assertEqual(object_list.values[5].value, "abc")
+
+    def test_items_view_cached(self):
+        object_list = ObjectList(
+            values=[ListItem(value=str(i)) for i in range(5)]
+        )
+        tester = UITester()
+        with tester.create_ui(object_list, dict(view=simple_view)) as ui:
+            editor = tester.find_by_name(ui, "values")._target
+            items = editor.items()
+            self.assertIs(editor.items(), items)
+
+            # Changes made in place are reflected by the view:
+            object_list.values.append(ListItem(value="5"))
+            self.assertIs(editor.items(), items)
+            self.assertEqual(len(items), 6)
+            self.assertEqual(editor.source_model.rowCount(None), 6)
+
+            object_list.values = [ListItem(value="a")]
+            self.assertEqual(list(editor.items()), object_list.values)
+            self.assertEqual(editor.source_model.rowCount(None), 1)
+
+            editor.factory.reverse = True
+            self.assertEqual(list(editor.items()), object_list.values)
+            object_list.values.append(ListItem(value="b"))
+            self.assertEqual(
+                list(editor.items()), object_list.values[::-1]
+            )
+
+    def test_reuse_cell_editors(self):
+        object_list = ObjectListWithSelection(
+            values=[ListItem(value=str(i ** 2)) for i in range(10)]
+        )
+        object_list.values[6] = DescribedListItem(value="36")
+        tester = UITester()
+        with tester.create_ui(
+            object_list, dict(view=reuse_cell_editors_view)
+        ) as ui:
+            values = tester.find_by_name(ui, "values")
+            editor = values._target
+
+            values.locate(Cell(5, 0)).perform(MouseClick())
+            values.locate(Cell(5, 0)).perform(KeySequence("abc"))
+            values.locate(Cell(5, 1)).perform(MouseClick())
+            values.locate(Cell(5, 1)).perform(KeySequence("5"))
+            self.assertEqual(len(editor._cell_editors), 1)
+            (cell_editor,) = editor._cell_editors.values()
+            self.assertIs(cell_editor.object, object_list.values[5])
+            self.assertEqual(cell_editor.control.toolTip(), "")
+
+            # The editor of the first column is reused for another row:
+            values.locate(Cell(6, 0)).perform(MouseClick())
+            self.assertEqual(len(editor._cell_editors), 1)
+            self.assertIs(cell_editor.object, object_list.values[6])
+            self.assertEqual(
+                cell_editor.control.toolTip(), "Specifies a described value"
+            )
+            values.locate(Cell(6, 0)).perform(KeySequence("def"))
+
+            self.assertEqual(object_list.values[5].value, "abc")
+            self.assertEqual(object_list.values[5].other_value, 5)
+            self.assertEqual(object_list.values[6].value, "def")
+
+            # Editing the previous object no longer updates the editor:
+            object_list.values[5].value = "ghi"
+            self.assertEqual(cell_editor.value, "def")
+
+        self.assertEqual(editor._cell_editors, {})
+
+
+@requires_toolkit([ToolkitName.wx])
+class TestWxTableModel(BaseTestMixin, unittest.TestCase):
+    def check_filtered_items(self, model, editor):
+        filtered_items = model.get_filtered_items()[:]
+        filtered_indices = editor.filtered_indices[:]
+
+        # Compare with the items computed from scratch:
+        model._filtered_cache = None
+        self.assertEqual(model.get_filtered_items(), filtered_items)
+        self.assertEqual(editor.filtered_indices, filtered_indices)
+
+    def test_insert_and_delete_sorted_filtered(self):
+        object_list = ObjectList(
+            values=[ListItem(other_value=(i * 7) % 11) for i in range(20)]
+        )
+        tester = UITester()
+        with tester.create_ui(
+            object_list, dict(view=sorted_filtered_view)
+        ) as ui:
+            editor = tester.find_by_name(ui, "values")._target
+            model = editor.model
+            model.sort_by_column(1)
+            self.check_filtered_items(model, editor)
+
+            for i in range(10):
+                model.insert_filtered_item_after(
+                    i % 3, ListItem(other_value=(i * 5) % 13)
+                )
+                self.check_filtered_items(model, editor)
+
+            model.delete_filtered_item_at(2)
+            self.check_filtered_items(model, editor)
+
+            model.sort_by_column(1, reverse=True)
+            self.check_filtered_items(model, editor)
+
+    def test_insert_and_delete_sort_model(self):
+        object_list = ObjectList(
+            values=[ListItem(other_value=(i * 7) % 11) for i in range(20)]
+        )
+        tester = UITester()
+        with tester.create_ui(object_list, dict(view=sort_model_view)) as ui:
+            editor = tester.find_by_name(ui, "values")._target
+            model = editor.model
+            model.sort_by_column(1)
+
+            for i in range(10):
+                model.insert_filtered_item_after(
+                    i % 3, ListItem(other_value=(i * 5) % 13)
+                )
+                self.check_filtered_items(model, editor)
+
+            values = [item.other_value for item in object_list.values]
+            self.assertEqual(len(values), 30)
+            self.assertEqual(values, sorted(values))
+            self.assertEqual(
+                [item.other_value for item in model.get_filtered_items()],
+                [value for value in values if value % 3 != 0],
+            )
+
+            model.delete_filtered_item_at(2)
+            self.check_filtered_items(model, editor)
+
+            values = [item.other_value for item in object_list.values]
+            self.assertEqual(len(values), 29)
+            self.assertEqual(values, sorted(values))
+
+            model.sort_by_column(1, reverse=True)
+            model.insert_filtered_item_after(0, ListItem(other_value=5))
+            self.check_filtered_items(model, editor)
+
+            values = [item.other_value for item in object_list.values]
+            self.assertEqual(len(values), 30)
+            self.assertEqual(values, sorted(values, reverse=True))
+            self.assertEqual(
+                [item.other_value for item in model.get_filtered_items()],
+                [value for value in values if value % 3 != 0],
+            )
@@ -152,6 +152,43 @@ class TestTextEditorQt(
             if hasattr(name_editor.control, 'isClearButtonEnabled'):
                 self.assertTrue(name_editor.control.isClearButtonEnabled())
 
+    def test_custom_editor_incremental(self):
+        foo = Foo(name="line 1\n")
+        view = View(
+            Item("name", style="custom", editor=TextEditor(incremental=True))
+        )
+        tester = UITester()
+        with tester.create_ui(foo, dict(view=view)) as ui:
+            (name_editor,) = ui.get_editors("name")
+            control = name_editor.control
+            self.assertEqual(control.toPlainText(), "line 1\n")
+
+            # The editor does not set the text back:
+            with self.assertTraitChanges(foo, "name", count=1):
+                foo.name += "line 2\n"
+            self.assertEqual(control.toPlainText(), "line 1\nline 2\n")
+
+            # Typed text is taken into account:
+            tester.find_by_name(ui, "name").perform(KeySequence("3"))
+            self.assertEqual(foo.name, "3line 1\nline 2\n")
+            foo.name = "line 0\n" + foo.name
+            self.assertEqual(control.toPlainText(), foo.name)
+
+    def test_custom_editor_max_lines(self):
+        foo = Foo(name="a\nb\nc")
+        view = View(
+            Item("name", style="custom", editor=TextEditor(max_lines=2))
+        )
+        tester = UITester()
+        with tester.create_ui(foo, dict(view=view)) as ui:
+            (name_editor,) = ui.get_editors("name")
+            control = name_editor.control
+            self.assertTrue(control.isReadOnly())
+            self.assertEqual(control.toPlainText(), "b\nc")
+
+            foo.name += "\nd"
+            self.assertEqual(control.toPlainText(), "c\nd")
+
 
 # We should be able to run this test case against wx.
 # Not running them now to avoid test interaction. See enthought/traitsui#752
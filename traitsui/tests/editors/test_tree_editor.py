@@ -8,7 +8,9 @@
 #
 # Thanks for using Enthought open source!
 
+from concurrent.futures import Future
 import unittest
+from unittest import mock
 
 from pyface.api import GUI
 from traits.api import Bool, Button, HasTraits, Instance, List, Str
@@ -22,6 +24,7 @@ from traitsui.api import (
     View,
 )
 from traitsui.testing.api import MouseClick, UITester
+from traitsui.testing._gui import process_cascade_events
 
 from traitsui.tests._tools import (
     BaseTestMixin,
@@ -94,6 +97,24 @@ class BogusTreeView(HasTraits):
         return traits_view
 
 
+class ManualExecutor:
+    """An executor whose functions are run when requested."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, function, *args):
+        future = Future()
+        self.submitted.append((future, function, args))
+        return future
+
+    def run(self):
+        for future, function, args in self.submitted:
+            if future.set_running_or_notify_cancel():
+                future.set_result(function(*args))
+        self.submitted = []
+
+
 class BogusTreeNodeObject(TreeNodeObject):
     """A bogus tree node."""
 
@@ -239,6 +260,35 @@ class TestTreeView(BaseTestMixin, unittest.TestCase):
             hide_root=False, nodes=nodes, trait="name"
         )
 
+    @requires_toolkit([ToolkitName.qt])
+    def test_tree_editor_label_updates_coalesced(self):
+        from traitsui.qt.tree_editor import SimpleEditor
+
+        node = TreeNode(node_for=[Bogus], children="bogus_list", label="name")
+        bogus = Bogus(bogus_list=[Bogus(name=str(i)) for i in range(3)])
+        tree_editor_view = BogusTreeView(bogus=bogus, nodes=[node])
+        with reraise_exceptions(), create_ui(tree_editor_view) as ui:
+            editor = ui.get_editors("bogus")[0]
+            child = editor._tree.topLevelItem(0).child(1)
+
+            # The label listeners are shared by the objects:
+            self.assertEqual(node._listener_cache, {})
+
+            with mock.patch.object(
+                SimpleEditor,
+                "_set_label",
+                autospec=True,
+                side_effect=SimpleEditor._set_label,
+            ) as set_label:
+                for name in ["a", "b", "c"]:
+                    bogus.bogus_list[1].name = name
+                self.assertEqual(child.text(0), "1")
+
+                process_cascade_events()
+
+            self.assertEqual(set_label.call_count, 1)
+            self.assertEqual(child.text(0), "c")
+
     @requires_toolkit([ToolkitName.qt])
     def test_tree_editor_xgetattr_label_listener(self):
         nodes = [
@@ -318,3 +368,212 @@ class TestTreeView(BaseTestMixin, unittest.TestCase):
         with tester.create_ui(tree_editor_view) as ui:
             expand_all_button = tester.find_by_name(ui, "expand_all")
             expand_all_button.perform(MouseClick())
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_icons_cached(self):
+        from traitsui.qt.tree_editor import SimpleEditor
+
+        nodes = [
+            TreeNode(
+                node_for=[Bogus],
+                auto_open=True,
+                children="bogus_list",
+                label="name",
+            ),
+        ]
+        bogus = Bogus(bogus_list=[Bogus() for _ in range(5)])
+        tree_editor_view = BogusTreeView(bogus=bogus, nodes=nodes)
+        with mock.patch.object(
+            SimpleEditor,
+            "_create_icon",
+            autospec=True,
+            side_effect=SimpleEditor._create_icon,
+        ) as create_icon:
+            with reraise_exceptions(), create_ui(tree_editor_view) as ui:
+                editor = ui.get_editors("bogus")[0]
+                bogus.bogus_list.append(Bogus())
+                GUI.process_events()
+
+                # One icon for the open root and one for its closed children:
+                self.assertEqual(create_icon.call_count, 2)
+                self.assertEqual(len(editor._icon_cache), 2)
+
+        self.assertEqual(editor._icon_cache, {})
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestTreeViewAsyncChildren(BaseTestMixin, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+        self.executor = ManualExecutor()
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def create_view(self, n_children):
+        nodes = [
+            TreeNode(
+                node_for=[Bogus],
+                children="bogus_list",
+                label="name",
+                children_executor=self.executor,
+            ),
+        ]
+        self.bogus = Bogus(
+            bogus_list=[Bogus(name=str(i)) for i in range(n_children)]
+        )
+        return BogusTreeView(bogus=self.bogus, nodes=nodes)
+
+    def test_children_loaded_in_background(self):
+        with reraise_exceptions(), create_ui(self.create_view(250)) as ui:
+            editor = ui.get_editors("bogus")[0]
+            root = editor._tree.topLevelItem(0)
+            self.assertEqual(root.childCount(), 1)
+            self.assertEqual(root.child(0).text(0), "Loading...")
+            self.assertEqual(len(self.executor.submitted), 1)
+
+            self.executor.run()
+            process_cascade_events()
+
+            self.assertEqual(root.childCount(), 250)
+            self.assertEqual(
+                [root.child(i).text(0) for i in range(250)],
+                [str(i) for i in range(250)],
+            )
+            self.assertEqual(
+                editor._get_node_data(root.child(0))[2],
+                self.bogus.bogus_list[0],
+            )
+
+    def test_expand_all_continues_after_loading(self):
+        with reraise_exceptions(), create_ui(self.create_view(3)) as ui:
+            editor = ui.get_editors("bogus")[0]
+            for child in self.bogus.bogus_list:
+                child.bogus_list = [Bogus(name=child.name + ".0")]
+
+            editor.expand_all()
+            while self.executor.submitted:
+                self.executor.run()
+                process_cascade_events()
+
+            root = editor._tree.topLevelItem(0)
+            self.assertEqual(root.childCount(), 3)
+            for i in range(3):
+                child = root.child(i)
+                self.assertTrue(child.isExpanded())
+                self.assertEqual(child.childCount(), 1)
+                self.assertEqual(child.child(0).text(0), "{}.0".format(i))
+
+    def test_collapse_cancels_loading(self):
+        with reraise_exceptions(), create_ui(self.create_view(3)) as ui:
+            editor = ui.get_editors("bogus")[0]
+            root = editor._tree.topLevelItem(0)
+            ((future, _, _),) = self.executor.submitted
+
+            root.setExpanded(False)
+            self.assertTrue(future.cancelled())
+            self.assertFalse(editor._get_node_data(root)[0])
+
+            self.executor.run()
+            process_cascade_events()
+            root.setExpanded(True)
+            self.executor.run()
+            process_cascade_events()
+
+            self.assertEqual(root.childCount(), 3)
+
+    def test_children_changed_while_loading(self):
+        with reraise_exceptions(), create_ui(self.create_view(3)) as ui:
+            editor = ui.get_editors("bogus")[0]
+            root = editor._tree.topLevelItem(0)
+            ((future, _, _),) = self.executor.submitted
+
+            self.bogus.bogus_list.append(Bogus(name="3"))
+            self.assertTrue(future.cancelled())
+
+            self.executor.run()
+            process_cascade_events()
+
+            self.assertEqual(
+                [root.child(i).text(0) for i in range(root.childCount())],
+                ["0", "1", "2", "3"],
+            )
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestTreeViewReleaseCollapsed(BaseTestMixin, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def create_view(self, **traits):
+        tree_editor = TreeEditor(
+            nodes=[
+                TreeNode(
+                    node_for=[Bogus], children="bogus_list", label="name"
+                ),
+            ],
+            editable=False,
+            **traits,
+        )
+        self.bogus = Bogus(
+            bogus_list=[
+                Bogus(name=str(i), bogus_list=[Bogus(), Bogus()])
+                for i in range(3)
+            ]
+        )
+        view = View(Item("bogus", editor=tree_editor))
+        return BogusTreeView(bogus=self.bogus), view
+
+    def test_node_count(self):
+        tree_view, view = self.create_view()
+        with reraise_exceptions(), create_ui(tree_view, dict(view=view)) as ui:
+            editor = ui.get_editors("bogus")[0]
+            self.assertEqual(editor.node_count, 4)
+
+            editor._tree.topLevelItem(0).child(0).setExpanded(True)
+            self.assertEqual(editor.node_count, 6)
+
+            self.bogus.bogus_list.pop(0)
+            self.assertEqual(editor.node_count, 3)
+
+        self.assertEqual(editor.node_count, 0)
+
+    def test_release_collapsed_after_count(self):
+        tree_view, view = self.create_view(max_collapsed_nodes=1)
+        with reraise_exceptions(), create_ui(tree_view, dict(view=view)) as ui:
+            editor = ui.get_editors("bogus")[0]
+            root = editor._tree.topLevelItem(0)
+            first, second = root.child(0), root.child(1)
+            for nid in (first, second):
+                nid.setExpanded(True)
+                nid.setExpanded(False)
+            self.assertEqual(editor.node_count, 6)
+
+            # The children of the least recently collapsed node are released:
+            self.assertFalse(editor._get_node_data(first)[0])
+            self.assertTrue(editor._get_node_data(second)[0])
+            self.assertIsNotNone(first._dummy)
+
+            first.setExpanded(True)
+            self.assertEqual(first.childCount(), 2)
+            self.assertEqual(editor.node_count, 8)
+
+    def test_release_collapsed_after_delay(self):
+        tree_view, view = self.create_view(release_collapsed_delay=0.0)
+        with reraise_exceptions(), create_ui(tree_view, dict(view=view)) as ui:
+            editor = ui.get_editors("bogus")[0]
+            nid = editor._tree.topLevelItem(0).child(0)
+            nid.setExpanded(True)
+            nid.setExpanded(False)
+            self.assertEqual(editor.node_count, 6)
+
+            process_cascade_events()
+
+            self.assertEqual(editor.node_count, 4)
+            self.assertFalse(editor._get_node_data(nid)[0])
+
+            nid.setExpanded(True)
+            self.assertEqual(editor.node_count, 6)
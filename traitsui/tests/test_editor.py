@@ -20,6 +20,7 @@ from traits.api import (
     Int,
     List,
     Range,
+    TraitError,
     Undefined,
 )
 from traits.trait_base import xgetattr
@@ -382,6 +383,80 @@ class TestEditor(BaseTestMixin, GuiTestAssistant, unittest.TestCase):
 
         editor.dispose()
 
+    def test_rebind(self):
+        new_object = UserObject(user_desc="other_test")
+        context = {"object": UserObject(), "other_object": new_object}
+        editor = create_editor(context=context)
+        old_object = editor.object
+        editor.prepare(None)
+
+        self.assertIsNone(editor.control.tooltip)
+
+        editor.rebind(new_object, "user_desc", object_name="other_object")
+
+        self.assertIs(editor.object, new_object)
+        self.assertIs(editor.context_object, new_object)
+        self.assertEqual(editor.name, "user_desc")
+        self.assertEqual(editor.extended_name, "user_desc")
+        self.assertEqual(editor.old_value, "other_test")
+        self.assertEqual(editor.control.control_value, "other_test")
+        self.assertEqual(
+            editor.control.tooltip, "Specifies a trait with desc metadata"
+        )
+
+        editor.rebind(
+            new_object,
+            "user_value",
+            object_name="other_object",
+            description="a description",
+        )
+        self.assertEqual(editor.description, "a description")
+        self.assertEqual(editor.control.tooltip, "a description")
+
+        editor.rebind(new_object, "user_desc", object_name="other_object")
+
+        self.change_user_value(editor, new_object, "user_desc", "new test")
+        self.assertEqual(editor.control.control_value, "new test")
+
+        # changes to the previous trait are no longer displayed
+        with self.assertTraitDoesNotChange(editor.control, "control_value"):
+            old_object.user_value = "old test"
+            self.event_loop_helper.event_loop_with_timeout(repeat=6)
+
+        self.change_control_value(
+            editor, new_object, "user_desc", "even newer test"
+        )
+        self.assertEqual(old_object.user_value, "old test")
+
+        editor.dispose()
+
+    def test_rebind_moves_synced_values(self):
+        new_object = UserObject(user_auxiliary=20)
+        context = {"object": UserObject(), "other_object": new_object}
+        factory = StubEditorFactory(
+            auxiliary_cv_int=ContextValue("user_auxiliary")
+        )
+        editor = create_editor(context=context, factory=factory)
+        old_object = editor.object
+        editor.prepare(None)
+        self.assertEqual(editor.auxiliary_cv_int, 10)
+
+        editor.rebind(new_object, "user_value", object_name="other_object")
+
+        self.assertEqual(editor.auxiliary_cv_int, 20)
+        new_object.user_auxiliary = 30
+        self.assertEqual(editor.auxiliary_cv_int, 30)
+        old_object.user_auxiliary = 40
+        self.assertEqual(editor.auxiliary_cv_int, 30)
+
+        editor.dispose()
+
+    def test_name_read_only(self):
+        editor = create_editor()
+
+        with self.assertRaises(TraitError):
+            editor.name = "user_auxiliary"
+
     def test_factory_sync_simple(self):
         factory = StubEditorFactory(auxiliary_value="test")
         editor = create_editor(factory=factory)
@@ -11,18 +11,26 @@
 from unittest import TestCase, skipIf
 
 from pyface.action.api import ActionEvent
-from traits.api import Any, HasTraits, Bool, TraitError
+from traits.api import Any, Event, HasTraits, Bool, Int, List, TraitError
 from traitsui.api import (
     Action,
     CloseAction,
     Handler,
     HelpAction,
+    Item,
     RedoAction,
     RevertAction,
     UI,
     UndoAction,
+    View,
+)
+from traitsui.handler import changed_methods
+from traitsui.tests._tools import (
+    BaseTestMixin,
+    create_ui,
+    is_null,
+    reraise_exceptions,
 )
-from traitsui.tests._tools import BaseTestMixin, is_null
 
 
 class PyfaceAction(Action):
@@ -307,3 +315,101 @@ class TestHandler(BaseTestMixin, TestCase):
 
         with self.assertRaises(ValueError):
             object.edit_traits(handler=handler)
+
+
+class CountModel(HasTraits):
+
+    count = Int()
+
+    reset = Event()
+
+    view = View(Item("count"))
+
+
+class ChangedHandler(Handler):
+
+    calls = List()
+
+    def object_count_changed(self, info):
+        self.calls.append(("count", info.object.count))
+
+    def object_reset_changed(self, info):
+        self.calls.append(("reset", info.object.count))
+
+    def other_count_changed(self, info):
+        self.calls.append(("other", None))
+
+    def not_a_changed_method(self, info):
+        pass
+
+
+class TestChangedMethods(BaseTestMixin, TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def test_changed_methods(self):
+        methods = changed_methods(ChangedHandler())
+
+        self.assertLessEqual(
+            {
+                ("object", "count", "object_count_changed"),
+                ("object", "reset", "object_reset_changed"),
+                ("other", "count", "other_count_changed"),
+            },
+            set(methods),
+        )
+        self.assertNotIn("not_a_changed_method", [m[2] for m in methods])
+
+    def test_changed_methods_cached_per_class(self):
+        first = changed_methods(ChangedHandler())
+        second = changed_methods(ChangedHandler())
+
+        self.assertIs(first, second)
+
+    @skipIf(is_null(), "Null toolkit can't create UI")
+    def test_changed_methods_dispatched(self):
+        model = CountModel()
+        handler = ChangedHandler()
+
+        with reraise_exceptions(), create_ui(model, dict(handler=handler)):
+            # called immediately, except for events
+            self.assertEqual(handler.calls, [("count", 0)])
+
+            model.count = 3
+            model.reset = True
+
+        self.assertEqual(
+            handler.calls, [("count", 0), ("count", 3), ("reset", 3)]
+        )
+
+        # dispatchers are removed when the UI is disposed
+        model.count = 4
+        self.assertEqual(len(handler.calls), 3)
+
+    @skipIf(is_null(), "Null toolkit can't create UI")
+    def test_changed_methods_only_listen_to_their_traits(self):
+        from traitsui.ui import ObjectDispatcher
+
+        model = CountModel()
+        handler = ChangedHandler()
+
+        with reraise_exceptions(), create_ui(
+            model, dict(handler=handler)
+        ) as ui:
+            (dispatcher,) = [
+                dispatcher
+                for dispatcher in ui._dispatchers
+                if isinstance(dispatcher, ObjectDispatcher)
+            ]
+
+            # No listener for any trait of the object:
+            self.assertFalse(
+                any(
+                    notifier.equals(dispatcher.dispatch)
+                    for notifier in model._notifiers(True)
+                )
+            )
+            self.assertEqual(sorted(dispatcher.methods), ["count", "reset"])
@@ -8,12 +8,31 @@
 #
 # Thanks for using Enthought open source!
 
+from operator import attrgetter
 from unittest import TestCase
+import weakref
 
-from traitsui.helper import compute_column_widths
+from traits.api import Enum, HasTraits, Instance
+
+from traitsui.helper import (
+    IdentityMap,
+    compute_column_widths,
+    enum_values_changed,
+    extended_getter,
+    invalidate_enum_values,
+)
 from traitsui.tests._tools import BaseTestMixin
 
 
+class EnumModel(HasTraits):
+
+    value = Enum("b", "a", "c")
+
+
+class LinkedModel(HasTraits):
+    link = Instance(EnumModel)
+
+
 class TestComputeColumnWidths(BaseTestMixin, TestCase):
     def setUp(self):
         BaseTestMixin.setUp(self)
@@ -110,3 +129,201 @@ class TestComputeColumnWidths(BaseTestMixin, TestCase):
         )
 
         self.assertEqual(widths, [50, 75, 25, 50])
+
+
+class TestEnumValuesChanged(BaseTestMixin, TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def test_sequence(self):
+        names, mapping, inverse_mapping = enum_values_changed([1, 2], repr)
+
+        self.assertEqual(names, ["1", "2"])
+        self.assertEqual(mapping, {"1": 1, "2": 2})
+        self.assertEqual(inverse_mapping, {1: "1", 2: "2"})
+
+    def test_dict(self):
+        values = {"x": "2:Second", "y": "1:First"}
+
+        names, mapping, inverse_mapping = enum_values_changed(values)
+
+        self.assertEqual(names, ["First", "Second"])
+        self.assertEqual(mapping, {"First": "y", "Second": "x"})
+
+    def test_trait_handler(self):
+        trait = EnumModel.class_traits()["value"]
+
+        names, mapping, inverse_mapping = enum_values_changed(trait)
+
+        self.assertEqual(names, ["b", "a", "c"])
+
+    def test_memoised_for_same_values(self):
+        values = ["one", "two"]
+        first = enum_values_changed(values, str, "key")
+        second = enum_values_changed(values, lambda x: x, "key")
+
+        self.assertIs(first, second)
+
+    def test_not_memoised_for_equal_values(self):
+        first = enum_values_changed(["one", "two"], str, "key")
+        second = enum_values_changed(["one", "two"], str, "key")
+
+        self.assertIsNot(first, second)
+
+    def test_memoised_on_strfunc_key(self):
+        values = ["one", "two"]
+        first = enum_values_changed(values, str, "str")
+        second = enum_values_changed(values, str.upper, "upper")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second[0], ["ONE", "TWO"])
+
+    def test_not_memoised_without_key(self):
+        values = ["one", "two"]
+        first = enum_values_changed(values)
+        second = enum_values_changed(values)
+
+        self.assertIsNot(first, second)
+
+    def test_values_modified_in_place(self):
+        values = [1, 2]
+        enum_values_changed(values)
+        enum_values_changed(values, str, "key")
+
+        values.append(3)
+
+        self.assertEqual(enum_values_changed(values)[0], ["1", "2", "3"])
+        self.assertEqual(
+            enum_values_changed(values, str, "key")[0], ["1", "2", "3"]
+        )
+
+        values[0] = 4
+
+        self.assertEqual(
+            enum_values_changed(values, str, "key")[0], ["4", "2", "3"]
+        )
+
+    def test_values_renamed(self):
+        class Named:
+            def __init__(self, name):
+                self.name = name
+
+        values = [Named("one"), Named("two")]
+        enum_values_changed(values, attrgetter("name"), "name")
+
+        values[0].name = "three"
+        invalidate_enum_values(values)
+        names, _, _ = enum_values_changed(values, attrgetter("name"), "name")
+
+        self.assertEqual(names, ["three", "two"])
+
+    def test_invalidated_once_per_change(self):
+        values = ["one", "two"]
+        enum_values_changed(values, str, "key")
+
+        values.append("three")
+        change = object()
+        invalidate_enum_values(values, change)
+        first = enum_values_changed(values, str, "key")
+        invalidate_enum_values(values, change)
+        second = enum_values_changed(values, str, "key")
+
+        self.assertIs(first, second)
+        self.assertEqual(first[0], ["one", "two", "three"])
+
+    def test_bound_method_not_kept_alive(self):
+        class Formatter:
+            def format(self, value):
+                return value.upper()
+
+        formatter = Formatter()
+        ref = weakref.ref(formatter)
+        values = ["one", "two"]
+
+        names, _, _ = enum_values_changed(values, formatter.format)
+        del formatter
+
+        self.assertEqual(names, ["ONE", "TWO"])
+        self.assertIsNone(ref())
+
+    def test_equal_values_of_different_types(self):
+        names, _, _ = enum_values_changed([0, 1])
+        bool_names, _, _ = enum_values_changed([False, True])
+
+        self.assertEqual(names, ["0", "1"])
+        self.assertEqual(bool_names, ["False", "True"])
+
+    def test_unhashable_strfunc_key(self):
+        names, _, _ = enum_values_changed(["a", "b"], str, ["unhashable"])
+
+        self.assertEqual(names, ["a", "b"])
+
+
+class TestExtendedGetter(BaseTestMixin, TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def test_extended_name(self):
+        model = LinkedModel(link=EnumModel(value="c"))
+
+        self.assertEqual(extended_getter("link.value")(model), "c")
+        self.assertIs(extended_getter("link")(model), model.link)
+
+    def test_memoised(self):
+        self.assertIs(
+            extended_getter("link.value"), extended_getter("link.value")
+        )
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            extended_getter("link.value")(LinkedModel())
+
+
+class Node(HasTraits):
+    pass
+
+
+class TestIdentityMap(BaseTestMixin, TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def test_keys_compared_by_identity(self):
+        key = tuple([1, 2])
+        mapping = IdentityMap()
+        mapping[key] = "a"
+
+        self.assertEqual(mapping[key], "a")
+        self.assertIn(key, mapping)
+        self.assertNotIn((1, 2), mapping)
+        self.assertIsNone(mapping.get((1, 2)))
+
+    def test_setdefault_and_delete(self):
+        node = Node()
+        mapping = IdentityMap()
+
+        mapping.setdefault(node, []).append(1)
+        mapping.setdefault(node, []).append(2)
+        self.assertEqual(mapping[node], [1, 2])
+        self.assertEqual(mapping.values(), [[1, 2]])
+
+        del mapping[node]
+        self.assertEqual(len(mapping), 0)
+        with self.assertRaises(KeyError):
+            mapping[node]
+
+    def test_dead_objects_discarded(self):
+        node = Node()
+        mapping = IdentityMap()
+        mapping[node] = "a"
+
+        del node
+        self.assertEqual(len(mapping), 0)
@@ -226,6 +226,78 @@ class TestKeyBindings(UnittestTools, unittest.TestCase):
         self.assertFalse(result)
         self.assertIsNone(controller.called)
 
+    def test_do_own_controllers(self):
+        controller = Controller2()
+        key_bindings = KeyBindings(
+            KeyBinding(binding1="Ctrl-S", method_name="m1"),
+            KeyBinding(binding1="Ctrl-U", method_name="2"),
+            prefix="m",
+            controllers=[controller],
+        )
+
+        result = key_bindings._do("Ctrl-U", [], ("args",), False)
+
+        self.assertTrue(result)
+        self.assertEqual(controller.called, ("m2", ("args",)))
+
+    def test_do_recursive(self):
+        parent_controller = Controller1()
+        child_controller = Controller2()
+        key_bindings = KeyBindings(
+            KeyBinding(binding1="Ctrl-S", method_name="m1"),
+            controllers=[parent_controller],
+        )
+        child = KeyBindings(
+            KeyBinding(binding1="Ctrl-U", method_name="m2"),
+            controllers=[child_controller],
+        )
+        key_bindings.children.append(child)
+
+        result = key_bindings._do("Ctrl-U", [], ("args",), False)
+        self.assertFalse(result)
+
+        result = key_bindings._do("Ctrl-U", [], ("args",), True)
+        self.assertTrue(result)
+        self.assertIsNone(parent_controller.called)
+        self.assertEqual(child_controller.called, ("m2", ("args",)))
+
+    def test_do_after_rebinding(self):
+        controller = Controller1()
+        binding = KeyBinding(binding1="Ctrl-S", method_name="m1")
+        key_bindings = KeyBindings(binding, controllers=[controller])
+        self.assertTrue(key_bindings._do("Ctrl-S", [], (), False))
+
+        binding.binding1 = "Ctrl-T"
+
+        self.assertFalse(key_bindings._do("Ctrl-S", [], (), False))
+        self.assertTrue(key_bindings._do("Ctrl-T", [], (), False))
+
+    def test_do_after_child_rebinding(self):
+        controller = Controller1()
+        binding = KeyBinding(binding1="Ctrl-S", method_name="m1")
+        key_bindings = KeyBindings()
+        child = KeyBindings(binding, controllers=[controller])
+        key_bindings.children.append(child)
+        self.assertTrue(key_bindings._do("Ctrl-S", [], (), True))
+
+        binding.binding1 = "Ctrl-T"
+
+        self.assertFalse(key_bindings._do("Ctrl-S", [], (), True))
+        self.assertTrue(key_bindings._do("Ctrl-T", [], (), True))
+
+    def test_do_after_controllers_changed(self):
+        key_bindings = KeyBindings(
+            KeyBinding(binding1="Ctrl-U", method_name="m2"),
+            controllers=[Controller1()],
+        )
+        self.assertFalse(key_bindings._do("Ctrl-U", [], (), False))
+
+        controller = Controller2()
+        key_bindings.controllers.append(controller)
+
+        self.assertTrue(key_bindings._do("Ctrl-U", [], (), False))
+        self.assertEqual(controller.called, ("m2", ()))
+
 
 class TestKeyBindingsHandler(unittest.TestCase):
 
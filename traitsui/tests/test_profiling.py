@@ -0,0 +1,174 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from traits.api import HasTraits, Int, Str
+
+from traitsui.api import Item, View
+from traitsui.profiling import (
+    PROFILE_ENV_VAR,
+    UIProfile,
+    active_profile,
+    profile_ui,
+    record,
+    recorded,
+)
+from traitsui.tests._tools import (
+    BaseTestMixin,
+    create_ui,
+    requires_toolkit,
+    reraise_exceptions,
+    ToolkitName,
+)
+
+
+class Model(HasTraits):
+
+    count = Int()
+
+    name = Str()
+
+    traits_view = View(
+        Item("count"),
+        Item("name", id="name_item", enabled_when="count > 0"),
+    )
+
+
+class TestUIProfile(unittest.TestCase):
+    def test_add_event(self):
+        profile = UIProfile()
+
+        profile.add_event("prepare_ui", "phase", 1.0, 1.5)
+        profile.add_event("prepare_ui", "phase", 2.0, 2.25)
+        profile.add_event("TextEditor", "editor", 1.0, 1.25)
+        profile.add_event(
+            "value", "item", 0.5, 1.5, {"editor": "TextEditor", "widgets": 3}
+        )
+
+        self.assertEqual(profile.phases["prepare_ui"].count, 2)
+        self.assertAlmostEqual(profile.phases["prepare_ui"].total, 0.75)
+        self.assertAlmostEqual(profile.phases["prepare_ui"].mean, 0.375)
+        self.assertEqual(profile.editors["TextEditor"].count, 1)
+        self.assertEqual(profile.editors["TextEditor"].widgets, 3)
+        self.assertEqual(profile.items["value"].widgets, 3)
+        self.assertEqual(profile.total_widgets, 3)
+        self.assertEqual(len(profile.events), 4)
+
+    def test_to_chrome_trace(self):
+        profile = UIProfile()
+        profile.add_event("prepare_ui", "phase", 1.0, 1.5, {"kind": "live"})
+
+        trace = profile.to_chrome_trace()
+
+        (event,) = trace["traceEvents"]
+        self.assertEqual(event["name"], "prepare_ui")
+        self.assertEqual(event["cat"], "phase")
+        self.assertEqual(event["ph"], "X")
+        self.assertEqual(event["ts"], 1e6)
+        self.assertEqual(event["dur"], 0.5e6)
+        self.assertEqual(event["args"], {"kind": "live"})
+
+    def test_record_inactive(self):
+        self.assertIsNone(active_profile())
+        with record("phase") as args:
+            self.assertIsNone(args)
+
+        # The same context manager is used for all inactive records:
+        self.assertIs(record("phase"), record("other_phase"))
+
+    def test_recorded(self):
+        @recorded("phase")
+        def function(value):
+            return value + 1
+
+        self.assertEqual(function(1), 2)
+        with profile_ui() as profile:
+            self.assertEqual(function(2), 3)
+            self.assertEqual(function(3), 4)
+
+        self.assertEqual(function(4), 5)
+        self.assertEqual(profile.phases["phase"].count, 2)
+
+    def test_profile_ui_nested(self):
+        with profile_ui() as outer:
+            with profile_ui() as inner:
+                with record("phase"):
+                    pass
+            self.assertIs(active_profile(), outer)
+
+        self.assertIsNone(active_profile())
+        self.assertEqual(inner.phases["phase"].count, 1)
+        self.assertEqual(outer.phases, {})
+
+
+class TestProfileUI(BaseTestMixin, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_profile_ui(self):
+        with profile_ui() as profile:
+            with reraise_exceptions(), create_ui(Model()):
+                pass
+
+        for phase in ["View.ui", "panel", "prepare_ui", "restore_prefs"]:
+            self.assertEqual(profile.phases[phase].count, 1)
+        self.assertIn("evaluate_when", profile.phases)
+        self.assertEqual(
+            sum(stats.count for stats in profile.editors.values()), 2
+        )
+
+    @requires_toolkit([ToolkitName.qt])
+    def test_profile_ui_items(self):
+        with profile_ui() as profile:
+            with reraise_exceptions(), create_ui(Model()):
+                pass
+
+        self.assertEqual(set(profile.items), {"count", "name_item"})
+        self.assertGreater(profile.items["count"].widgets, 0)
+        self.assertGreater(profile.total_widgets, 0)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_profile_ui_trace_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            with profile_ui(trace_file=path):
+                with reraise_exceptions(), create_ui(Model()):
+                    pass
+
+            with open(path, encoding="utf-8") as trace_file:
+                trace = json.load(trace_file)
+
+        names = {event["name"] for event in trace["traceEvents"]}
+        self.assertIn("View.ui", names)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_profile_environment_variable(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch.dict(os.environ, {PROFILE_ENV_VAR: directory}):
+                with reraise_exceptions(), create_ui(Model()):
+                    pass
+
+            (file_name,) = os.listdir(directory)
+            with open(
+                os.path.join(directory, file_name), encoding="utf-8"
+            ) as trace_file:
+                trace = json.load(trace_file)
+
+        names = {event["name"] for event in trace["traceEvents"]}
+        self.assertIn("prepare_ui", names)
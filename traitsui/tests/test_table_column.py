@@ -0,0 +1,90 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from traits.api import HasTraits, Instance, Int, Property
+
+from traitsui.table_column import ObjectColumn
+
+
+class CountingObject(HasTraits):
+
+    #: The number of times the value has been fetched.
+    count = Int()
+
+    value = Property(Int)
+
+    def _get_value(self):
+        self.count += 1
+        return self.count
+
+
+class LinkedObject(HasTraits):
+
+    link = Instance(CountingObject)
+
+    other = Instance(CountingObject)
+
+
+class TestObjectColumn(unittest.TestCase):
+
+    def test_extended_name(self):
+        obj = LinkedObject(link=CountingObject(count=2))
+        column = ObjectColumn(name="link.count")
+
+        self.assertEqual(column.get_raw_value(obj), 2)
+        self.assertEqual(column.target_name(obj), (obj.link, "count"))
+
+        column.set_value(obj, 5)
+        self.assertEqual(obj.link.count, 5)
+
+    def test_name_changed(self):
+        obj = LinkedObject(
+            link=CountingObject(count=2), other=CountingObject(count=3)
+        )
+        column = ObjectColumn(name="link.count")
+        self.assertEqual(column.get_raw_value(obj), 2)
+        self.assertEqual(column.target_name(obj), (obj.link, "count"))
+
+        column.name = "other.count"
+
+        self.assertEqual(column.get_raw_value(obj), 3)
+        self.assertEqual(column.target_name(obj), (obj.other, "count"))
+
+        column.name = "link"
+
+        self.assertIs(column.get_raw_value(obj), obj.link)
+        self.assertEqual(column.target_name(obj), (obj, "link"))
+
+    def test_raw_values_not_cached(self):
+        obj = CountingObject()
+        column = ObjectColumn(name="value")
+
+        column.begin_paint()
+        self.assertEqual(column.get_raw_value(obj), 1)
+        self.assertEqual(column.get_value(obj), "2")
+        column.end_paint()
+
+    def test_raw_values_cached_while_painting(self):
+        obj = CountingObject()
+        other = CountingObject()
+        column = ObjectColumn(name="value", cache_raw_values=True)
+
+        column.begin_paint()
+        self.assertEqual(column.get_raw_value(obj), 1)
+        self.assertEqual(column.get_value(obj), "1")
+        self.assertEqual(column.get_drag_value(obj), 1)
+        self.assertEqual(column.get_raw_value(other), 1)
+        column.end_paint()
+
+        self.assertEqual(obj.count, 1)
+        self.assertEqual(column.get_raw_value(obj), 2)
+        self.assertEqual(column.get_value(obj), "3")
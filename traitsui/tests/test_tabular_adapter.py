@@ -0,0 +1,88 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Tests for the bulk operations of TabularAdapter.
+"""
+
+import unittest
+
+from traits.api import HasTraits, List, Str
+from traits.testing.api import UnittestTools
+
+from traitsui.tabular_adapter import TabularAdapter
+
+
+class Names(HasTraits):
+    names = List(Str)
+
+
+class OneByOneAdapter(TabularAdapter):
+    """An adapter overriding the single item operations."""
+
+    def delete(self, object, trait, row):
+        del getattr(object, trait)[row]
+
+    def insert(self, object, trait, row, value):
+        getattr(object, trait).insert(row, value)
+
+
+class TestTabularAdapterBulkOperations(UnittestTools, unittest.TestCase):
+
+    def test_delete_rows(self):
+        obj = Names(names=list("ABCDEF"))
+        adapter = TabularAdapter()
+
+        with self.assertTraitChanges(obj, "names_items", count=1):
+            adapter.delete_rows(obj, "names", [4, 1, 2])
+        self.assertEqual(obj.names, list("ADF"))
+
+        with self.assertTraitChanges(obj, "names_items", count=1):
+            adapter.delete_rows(obj, "names", [0, 2])
+        self.assertEqual(obj.names, list("D"))
+
+        with self.assertTraitDoesNotChange(obj, "names_items"):
+            adapter.delete_rows(obj, "names", [])
+
+    def test_insert_rows(self):
+        obj = Names(names=list("AD"))
+        adapter = TabularAdapter()
+
+        with self.assertTraitChanges(obj, "names_items", count=1):
+            adapter.insert_rows(obj, "names", 1, ["B", "C"])
+        self.assertEqual(obj.names, list("ABCD"))
+
+    def test_move_rows(self):
+        obj = Names(names=list("ABCDEF"))
+        adapter = TabularAdapter()
+
+        with self.assertTraitChanges(obj, "names_items", count=1):
+            adapter.move_rows(obj, "names", [0, 2], 3)
+        self.assertEqual(obj.names, list("BDEACF"))
+
+        adapter.move_rows(obj, "names", [4, 5], 0)
+        self.assertEqual(obj.names, list("CFBDEA"))
+
+        adapter.move_rows(obj, "names", [1, 3], 1)
+        self.assertEqual(obj.names, list("CFDBEA"))
+
+    def test_overridden_single_item_operations(self):
+        obj = Names(names=list("ABCDEF"))
+        adapter = OneByOneAdapter()
+
+        with self.assertTraitChanges(obj, "names_items", count=2):
+            adapter.delete_rows(obj, "names", [1, 3])
+        self.assertEqual(obj.names, list("ACEF"))
+
+        with self.assertTraitChanges(obj, "names_items", count=2):
+            adapter.insert_rows(obj, "names", 1, ["B", "D"])
+        self.assertEqual(obj.names, list("ABDCEF"))
+
+        adapter.move_rows(obj, "names", [0, 2], 3)
+        self.assertEqual(obj.names, list("BCEADF"))
@@ -13,7 +13,9 @@ Test cases for the UI object.
 """
 
 import contextlib
+import threading
 import unittest
+from unittest import mock
 
 from pyface.api import GUI
 from traits.api import Property
@@ -22,7 +24,8 @@ from traits.trait_types import Str, Int
 
 import traitsui
 from traitsui.basic_editor_factory import BasicEditorFactory
-from traitsui.api import Group, Item, spring, View
+from traitsui.api import Group, Item, spring, TextEditor, View
+from traitsui.editor import set_coalesce_updates_default
 from traitsui.testing.api import DisplayedText, IsEnabled, MouseClick, UITester
 from traitsui.tests._tools import (
     BaseTestMixin,
@@ -242,6 +245,188 @@ class TestUI(BaseTestMixin, unittest.TestCase):
             self.assertTrue(editor.invalid)
 
 
+class ConditionalDialog(HasTraits):
+    """Test dialog with a conditionally enabled item."""
+
+    my_int = Int(2)
+    my_str = Str("hallo")
+
+    traits_view = View(
+        Item("my_int"),
+        Item("my_str", enabled_when="my_int > 5"),
+    )
+
+
+class TestUIBatchUpdates(BaseTestMixin, unittest.TestCase):
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_batch_updates_editor_once(self):
+        obj = FooDialog()
+        tester = UITester()
+        with reraise_exceptions(), tester.create_ui(obj) as ui:
+            (editor,) = ui.get_editors("my_int")
+
+            with count_update_editor(editor) as calls:
+                with ui.batch_updates():
+                    for i in range(10):
+                        obj.my_int = i
+                    self.assertEqual(len(calls), 0)
+
+                self.assertEqual(len(calls), 1)
+                displayed = tester.find_by_name(ui, "my_int").inspect(
+                    DisplayedText()
+                )
+                self.assertEqual(displayed, "9")
+
+                # Outside of a batch updates are immediate again.
+                obj.my_int = 20
+                self.assertEqual(len(calls), 2)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_batch_updates_nested(self):
+        obj = FooDialog()
+        with reraise_exceptions(), create_ui(obj) as ui:
+            (editor,) = ui.get_editors("my_int")
+
+            with count_update_editor(editor) as calls:
+                with ui.batch_updates():
+                    obj.my_int = 3
+                    with ui.batch_updates():
+                        obj.my_int = 4
+                    self.assertEqual(len(calls), 0)
+
+                self.assertEqual(len(calls), 1)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_batch_updates_evaluate_when(self):
+        obj = ConditionalDialog()
+        with reraise_exceptions(), create_ui(obj) as ui:
+            (editor,) = ui.get_editors("my_str")
+            self.assertFalse(editor.enabled)
+
+            with ui.batch_updates():
+                obj.my_int = 10
+                self.assertFalse(editor.enabled)
+                obj.my_str = "changed"
+
+            self.assertTrue(editor.enabled)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_batch_updates_from_worker_thread(self):
+        obj = FooDialog()
+        with reraise_exceptions(), create_ui(obj) as ui:
+            (editor,) = ui.get_editors("my_int")
+
+            def worker():
+                with ui.batch_updates():
+                    for i in range(10):
+                        obj.my_int = i
+
+            with count_update_editor(editor) as calls:
+                thread = threading.Thread(target=worker)
+                thread.start()
+                thread.join()
+                process_cascade_events()
+
+                self.assertEqual(len(calls), 1)
+            self.assertEqual(ui._batch_level, 0)
+
+
+class TestUICoalescedUpdates(BaseTestMixin, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_coalesced_updates_editor_once_per_iteration(self):
+        obj = FooDialog()
+        view = View(Item("my_int", editor=TextEditor(coalesce_updates=True)))
+        tester = UITester()
+        with reraise_exceptions(), tester.create_ui(
+            obj, dict(view=view)
+        ) as ui:
+            (editor,) = ui.get_editors("my_int")
+            self.assertTrue(editor.coalesce_updates)
+
+            with count_update_editor(editor) as calls:
+                for i in range(10):
+                    obj.my_int = i
+                self.assertEqual(len(calls), 0)
+
+                process_cascade_events()
+                self.assertEqual(len(calls), 1)
+
+            displayed = tester.find_by_name(ui, "my_int").inspect(
+                DisplayedText()
+            )
+            self.assertEqual(displayed, "9")
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_coalesced_updates_log_every_change(self):
+        obj = FooDialog()
+        view = View(Item("my_int", editor=TextEditor(coalesce_updates=True)))
+        tester = UITester()
+        with reraise_exceptions(), tester.create_ui(
+            obj, dict(view=view)
+        ) as ui:
+            (editor,) = ui.get_editors("my_int")
+
+            with mock.patch.object(type(editor), "log_change") as log_change:
+                with count_update_editor(editor) as calls:
+                    for i in range(3):
+                        with editor.updating_value():
+                            obj.my_int = i
+                    process_cascade_events()
+
+            self.assertEqual(log_change.call_count, 3)
+            # Changes made by the editor do not update it:
+            self.assertEqual(len(calls), 0)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_coalesce_updates_default(self):
+        obj = FooDialog()
+        previous = set_coalesce_updates_default(True)
+        try:
+            with reraise_exceptions(), create_ui(obj) as ui:
+                (editor,) = ui.get_editors("my_int")
+                self.assertTrue(editor.coalesce_updates)
+
+                # The editor can still be updated synchronously:
+                editor.coalesce_updates = False
+                with count_update_editor(editor) as calls:
+                    obj.my_int = 5
+                    self.assertEqual(len(calls), 1)
+        finally:
+            set_coalesce_updates_default(previous)
+
+        with reraise_exceptions(), create_ui(obj) as ui:
+            (editor,) = ui.get_editors("my_int")
+            self.assertFalse(editor.coalesce_updates)
+
+        # The factory setting takes precedence over the default:
+        view = View(Item("my_int", editor=TextEditor(coalesce_updates=False)))
+        previous = set_coalesce_updates_default(True)
+        try:
+            with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+                (editor,) = ui.get_editors("my_int")
+                self.assertFalse(editor.coalesce_updates)
+        finally:
+            set_coalesce_updates_default(previous)
+
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_coalesced_updates_dropped_after_dispose(self):
+        obj = FooDialog()
+        view = View(Item("my_int", editor=TextEditor(coalesce_updates=True)))
+        with reraise_exceptions():
+            with create_ui(obj, dict(view=view)) as ui:
+                (editor,) = ui.get_editors("my_int")
+                obj.my_int = 10
+            process_cascade_events()
+
+        self.assertIsNone(editor.control)
+
+
 # Regression test on an AttributeError commonly seen (enthought/traitsui#1145)
 # Code in ui_panel makes use toolkit specific attributes on the toolkit
 # specific Editor
@@ -418,6 +603,21 @@ class TestUIDispose(BaseTestMixin, unittest.TestCase):
             self.assertIsNone(ui.control)
 
 
+@contextlib.contextmanager
+def count_update_editor(editor):
+    """Record the calls to update_editor made for a particular editor."""
+    calls = []
+    original = type(editor).update_editor
+
+    def update_editor(self):
+        if self is editor:
+            calls.append(self)
+        return original(self)
+
+    with mock.patch.object(type(editor), "update_editor", update_editor):
+        yield calls
+
+
 @contextlib.contextmanager
 def ensure_destroyed(ui):
     """Ensure the widget is destroyed in the event when test fails."""
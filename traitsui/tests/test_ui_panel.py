@@ -11,7 +11,9 @@
 """ Tests to exercise logic for layouts, e.g. VGroup, HGroup.
 """
 
+import threading
 import unittest
+from unittest import mock
 
 from pyface.toolkit import toolkit_object
 from pyface.constant import OK
@@ -27,13 +29,23 @@ except ImportError:
         NO_WEBKIT_OR_WEBENGINE = False
     except ImportError:
         NO_WEBKIT_OR_WEBENGINE = True
-from traits.api import HasTraits, Int
-from traitsui.api import HelpButton, HGroup, Item, spring, VGroup, View
+from traits.api import Float, HasTraits, Instance, Int, List, Str
+from traitsui.api import (
+    Group,
+    HelpButton,
+    HGroup,
+    Item,
+    spring,
+    VGroup,
+    View,
+)
 from traitsui.testing.api import MouseClick, UITester
 from traitsui.tests._tools import (
     BaseTestMixin,
     create_ui,
+    process_cascade_events,
     requires_toolkit,
+    reraise_exceptions,
     ToolkitName,
 )
 
@@ -110,3 +122,244 @@ class TestUIPanel(BaseTestMixin, unittest.TestCase):
 
             mdtester = MyTester(click_help)
             mdtester.open_and_run(lambda x: x.click_button(OK))
+
+
+class ObjectWithValues(HasTraits):
+    number = Int(desc="a number")
+    ratio = Float()
+    name = Str()
+    values = List()
+
+
+class ObjectWithLink(HasTraits):
+    link = Instance(ObjectWithValues)
+
+
+#: A class with many Int traits, for virtual groups.
+ObjectWithManyValues = type(
+    "ObjectWithManyValues",
+    (HasTraits,),
+    {
+        "value_{}".format(i): Int(i, desc="value number {}".format(i))
+        for i in range(500)
+    },
+)
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestLightweightItems(BaseTestMixin, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def test_lightweight_items_have_no_editors(self):
+        obj = ObjectWithValues(number=2, ratio=0.5, name="a")
+        view = View(
+            Item("number", style="readonly", lightweight=True),
+            Item(
+                "ratio",
+                style="readonly",
+                lightweight=True,
+                format_str="%.2f",
+            ),
+            Item("name", style="readonly"),
+            # Not a scalar trait, so an editor is still used:
+            Item("values", style="readonly", lightweight=True),
+        )
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            self.assertEqual(ui.get_editors("number"), [])
+            self.assertEqual(ui.get_editors("ratio"), [])
+            self.assertEqual(len(ui.get_editors("name")), 1)
+            self.assertEqual(len(ui.get_editors("values")), 1)
+
+            number, ratio = [
+                items[0] for items in ui._display_router._items.values()
+            ]
+            self.assertEqual(number.control.text(), "2")
+            self.assertEqual(ratio.control.text(), "0.50")
+            self.assertEqual(
+                number.control.toolTip(), "Specifies a number"
+            )
+
+    def test_lightweight_items_extended_name_use_editor(self):
+        obj = ObjectWithLink(link=ObjectWithValues(number=2))
+        view = View(
+            Item("object.link.number", style="readonly", lightweight=True),
+        )
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            self.assertIsNone(ui._display_router)
+            (editor,) = ui.get_editors("number")
+
+            obj.link = ObjectWithValues(number=3)
+            self.assertEqual(editor.value, 3)
+
+    def test_lightweight_items_changed_from_thread(self):
+        obj = ObjectWithValues(number=2)
+        view = View(Item("number", style="readonly", lightweight=True))
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            (display_items,) = ui._display_router._items.values()
+            (display_item,) = display_items
+
+            thread = threading.Thread(target=setattr, args=(obj, "number", 3))
+            thread.start()
+            thread.join()
+            process_cascade_events()
+
+            self.assertEqual(display_item.control.text(), "3")
+
+    def test_lightweight_items_updated_in_batch(self):
+        obj = ObjectWithValues(number=2)
+        view = View(
+            Item("number", style="readonly", lightweight=True),
+            Item(
+                "number",
+                style="readonly",
+                lightweight=True,
+                format_func=lambda value: "#{}".format(value),
+            ),
+        )
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            (display_items,) = ui._display_router._items.values()
+            first, second = display_items
+
+            with mock.patch.object(
+                type(first), "update", autospec=True
+            ) as update:
+                obj.number = 3
+                obj.number = 4
+                self.assertEqual(update.call_count, 0)
+                process_cascade_events()
+
+            # Each label is updated once for both changes:
+            self.assertEqual(update.call_count, 2)
+            process_cascade_events()
+
+            obj.number = 5
+            process_cascade_events()
+            self.assertEqual(first.control.text(), "5")
+            self.assertEqual(second.control.text(), "#5")
+
+        self.assertIsNone(first.control)
+
+    def test_lightweight_items_visible_and_enabled_when(self):
+        obj = ObjectWithValues(number=0)
+        view = View(
+            Item("number"),
+            Item(
+                "name",
+                style="readonly",
+                lightweight=True,
+                visible_when="number > 0",
+                enabled_when="number > 1",
+            ),
+        )
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            (display_items,) = ui._display_router._items.values()
+            (display_item,) = display_items
+            self.assertFalse(display_item.visible)
+            self.assertFalse(display_item.enabled)
+            self.assertFalse(
+                display_item.label_control.isVisibleTo(ui.control)
+            )
+
+            obj.number = 1
+            process_cascade_events()
+            self.assertTrue(display_item.visible)
+            self.assertFalse(display_item.enabled)
+            self.assertTrue(display_item.control.isVisibleTo(ui.control))
+
+            obj.number = 2
+            process_cascade_events()
+            self.assertTrue(display_item.enabled)
+            self.assertTrue(display_item.control.isEnabled())
+
+
+@requires_toolkit([ToolkitName.qt])
+class TestVirtualGroup(BaseTestMixin, unittest.TestCase):
+    def setUp(self):
+        BaseTestMixin.setUp(self)
+
+    def tearDown(self):
+        BaseTestMixin.tearDown(self)
+
+    def create_view(self, **traits):
+        items = [Item("value_{}".format(i)) for i in range(500)]
+        return View(
+            VGroup(*items, scrollable=True, virtual=True, **traits),
+            height=300,
+            resizable=True,
+        )
+
+    def test_virtual_group_only_creates_visible_editors(self):
+        from traitsui.qt.virtual_group import VirtualItemsArea
+
+        obj = ObjectWithManyValues()
+        view = self.create_view()
+        with reraise_exceptions(), create_ui(obj, dict(view=view)) as ui:
+            process_cascade_events()
+            (area,) = [
+                dispatcher
+                for dispatcher in ui._dispatchers
+                if isinstance(dispatcher, VirtualItemsArea)
+            ]
+            visible = len(ui._editors)
+            self.assertGreater(visible, 0)
+            self.assertLess(visible, 100)
+
+            scrollbar = area.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+            process_cascade_events()
+
+            # The editors are rebound to the items scrolled to:
+            self.assertLessEqual(len(ui._editors), visible + 1)
+            row = area._rows[499]
+            self.assertIs(row.editor.object, obj)
+            self.assertEqual(row.editor.name, "value_499")
+            self.assertEqual(row.editor.control.text(), "499")
+            self.assertEqual(row.label.text(), "Value 499:")
+            self.assertEqual(
+                row.editor.control.toolTip(), "Specifies value number 499"
+            )
+            self.assertEqual(
+                row.label.toolTip(), "Specifies value number 499"
+            )
+
+            obj.value_499 = 1000
+            process_cascade_events()
+            self.assertEqual(row.editor.control.text(), "1000")
+
+            # Changes to the items scrolled away from are not displayed:
+            obj.value_0 = 1000
+            process_cascade_events()
+            self.assertNotIn(
+                "value_0", [editor.name for editor in ui._editors]
+            )
+
+        self.assertIsNone(area.panel)
+
+    def test_virtual_group_restrictions(self):
+        from traitsui.qt.virtual_group import can_virtualise
+
+        content = [Item("value_0"), Item("value_1")]
+
+        group = Group(*content, scrollable=True, virtual=True)
+        self.assertTrue(can_virtualise(group, content))
+
+        group = Group(*content, scrollable=True)
+        self.assertFalse(can_virtualise(group, content))
+
+        group = Group(*content, virtual=True)
+        self.assertFalse(can_virtualise(group, content))
+
+        group = HGroup(*content, scrollable=True, virtual=True)
+        self.assertFalse(can_virtualise(group, content))
+
+        content = [Item("value_0"), Item("value_1", visible_when="True")]
+        group = Group(*content, scrollable=True, virtual=True)
+        self.assertFalse(can_virtualise(group, content))
+
+        content = [Item("value_0"), Item("_")]
+        group = Group(*content, scrollable=True, virtual=True)
+        self.assertFalse(can_virtualise(group, content))
@@ -17,9 +17,24 @@ from pyface.undo.api import AbstractCommand
 from traits.api import Any, HasTraits, Int, List, Str, Tuple
 from traits.testing.api import UnittestTools
 
+from traitsui.api import Item, View
 from traitsui.tests.test_editor import create_editor
-from traitsui.undo import AbstractUndoItem, ListUndoItem, UndoHistory, UndoItem
-from traitsui.tests._tools import BaseTestMixin
+from traitsui.undo import (
+    AbstractUndoItem,
+    DEFAULT_MAX_DEPTH,
+    DEFAULT_MERGE_WINDOW,
+    ListUndoItem,
+    UndoHistory,
+    UndoItem,
+    view_undo_history,
+)
+from traitsui.tests._tools import (
+    BaseTestMixin,
+    create_ui,
+    requires_toolkit,
+    reraise_exceptions,
+    ToolkitName,
+)
 
 GuiTestAssistant = toolkit_object("util.gui_test_assistant:GuiTestAssistant")
 no_gui_test_assistant = GuiTestAssistant.__name__ == "Unimplemented"
@@ -1137,6 +1152,188 @@ class TestUndoHistory(UnittestTools, unittest.TestCase):
 
         self.assertEqual(command.data, "do")
 
+    def test_max_depth(self):
+        history = UndoHistory(max_depth=2)
+        self._populate_history(history)
+
+        self.assertEqual(history.depth, 2)
+        self.assertEqual(history.now, 2)
+        self.assertTrue(history.can_undo)
+
+        # the oldest change ('foo' -> 'bar') has been discarded
+        history.undo()
+        history.undo()
+        self.assertEqual(self._example.str_value, 'bar')
+        self.assertFalse(history.can_undo)
+
+    def test_max_bytes(self):
+        history = UndoHistory()
+        example = SimpleExample()
+        for i in range(5):
+            history.add(
+                UndoItem(
+                    object=example,
+                    name='any_value',
+                    old_value=b'x' * 1000 * i,
+                    new_value=b'x' * 1000 * (i + 1),
+                )
+            )
+        self.assertEqual(history.depth, 5)
+        self.assertGreater(history.retained_bytes, 20000)
+
+        history.max_bytes = 12000
+        history.add(
+            UndoItem(
+                object=example,
+                name='any_value',
+                old_value=b'x' * 5000,
+                new_value=b'x' * 6000,
+            )
+        )
+
+        self.assertLessEqual(history.retained_bytes, 12000)
+        self.assertEqual(history.depth, 1)
+        self.assertEqual(history.now, 1)
+
+    def test_max_bytes_keeps_last_entry(self):
+        history = UndoHistory(max_bytes=10)
+        self._populate_history(history)
+
+        self.assertEqual(history.depth, 1)
+        self.assertTrue(history.can_undo)
+
+    def test_retained_bytes_updated(self):
+        history = UndoHistory(max_bytes=12000)
+        example = SimpleExample()
+
+        def check_retained_bytes():
+            self.assertEqual(
+                history.retained_bytes,
+                sum(
+                    entry.command.estimated_size()
+                    for entry in history.stack._stack
+                ),
+            )
+
+        for i in range(5):
+            history.add(
+                UndoItem(
+                    object=example,
+                    name='any_value',
+                    old_value=b'x' * 1000 * i,
+                    new_value=b'x' * 1000 * (i + 1),
+                )
+            )
+            check_retained_bytes()
+
+        # merged into the last entry
+        history.extend(
+            UndoItem(
+                object=example,
+                name='str_value',
+                old_value='',
+                new_value='x' * 1000,
+            )
+        )
+        check_retained_bytes()
+
+        # the undone entry is discarded by the next change
+        history.undo()
+        history.add(
+            UndoItem(
+                object=example,
+                name='any_value',
+                old_value=b'',
+                new_value=b'x',
+            )
+        )
+        check_retained_bytes()
+
+        history.clear()
+        self.assertEqual(history.retained_bytes, 0)
+
+    def test_truncated(self):
+        history = UndoHistory(max_depth=2)
+        self.assertFalse(history.truncated)
+
+        self._populate_history(history)
+        self.assertTrue(history.truncated)
+
+        # only the retained changes are reverted
+        history.revert()
+        self.assertEqual(self._example.str_value, 'bar')
+        self.assertFalse(history.truncated)
+
+    def test_view_undo_history(self):
+        history = view_undo_history(View())
+
+        self.assertEqual(history.merge_window, DEFAULT_MERGE_WINDOW)
+        self.assertEqual(history.max_depth, DEFAULT_MAX_DEPTH)
+        self.assertEqual(history.max_bytes, 0)
+
+        history = view_undo_history(
+            View(undo_max_depth=10, undo_max_bytes=1000)
+        )
+
+        self.assertEqual(history.max_depth, 10)
+        self.assertEqual(history.max_bytes, 1000)
+
+    def test_merge_window(self):
+        history = UndoHistory(merge_window=60.0)
+        example = SimpleExample()
+        for i in range(10):
+            history.add(
+                UndoItem(
+                    object=example,
+                    name='any_value',
+                    old_value=[i],
+                    new_value=[i + 1],
+                )
+            )
+
+        self.assertEqual(history.depth, 1)
+        self.assertEqual(history.now, 1)
+
+        example.any_value = [10]
+        history.undo()
+        self.assertEqual(example.any_value, [0])
+        history.redo()
+        self.assertEqual(example.any_value, [10])
+
+    def test_merge_window_different_traits(self):
+        history = UndoHistory(merge_window=60.0)
+        self._populate_history(history)
+        history.add(
+            UndoItem(
+                object=self._example,
+                name='any_value',
+                old_value=None,
+                new_value=1,
+            )
+        )
+
+        self.assertEqual(history.depth, 2)
+
+    def test_merge_window_disabled(self):
+        history = UndoHistory()
+        self._populate_history(history)
+
+        self.assertEqual(history.depth, 3)
+
+    def test_statistics(self):
+        history = UndoHistory()
+        self._populate_history(history)
+        history.undo()
+
+        statistics = history.statistics()
+
+        self.assertEqual(statistics['depth'], 3)
+        self.assertEqual(statistics['now'], 2)
+        self.assertEqual(
+            statistics['retained_bytes'], history.retained_bytes
+        )
+        self.assertGreater(statistics['retained_bytes'], 0)
+
 
 @unittest.skipIf(no_gui_test_assistant, "No GuiTestAssistant")
 class TestEditorUndo(BaseTestMixin, GuiTestAssistant, unittest.TestCase):
@@ -1165,6 +1362,13 @@ class TestEditorUndo(BaseTestMixin, GuiTestAssistant, unittest.TestCase):
         self.gui.invoke_later(editor.ui.history.redo)
         self.event_loop_helper.event_loop_with_timeout()
 
+    @requires_toolkit([ToolkitName.qt, ToolkitName.wx])
+    def test_view_history_bounded(self):
+        example = SimpleExample()
+        view = View(Item("value"), buttons=["Undo"], undo_max_depth=2)
+        with reraise_exceptions(), create_ui(example, dict(view=view)) as ui:
+            self.assertEqual(ui.history.max_depth, 2)
+
     def test_undo(self):
         editor = create_editor()
         editor.prepare(None)
@@ -0,0 +1,218 @@
+# (C) Copyright 2004-2023 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from traits.api import Event, HasTraits, Int, List
+from traits.testing.optional_dependencies import numpy, requires_numpy
+
+from traitsui.value_tree import (
+    ArrayNode,
+    DictNode,
+    IntNode,
+    ListNode,
+    PAGE_SIZE,
+    RangeNode,
+    RootNode,
+    SetNode,
+    TraitsNode,
+)
+
+
+class Model(HasTraits):
+
+    count = Int()
+
+    names = List()
+
+    selected_items = List()
+
+    ping = Event()
+
+
+def labels(nodes):
+    return [node.tno_get_label(None) for node in nodes]
+
+
+class TestContainerNodes(unittest.TestCase):
+    def test_small_list(self):
+        node = ListNode(value=[1, 2, 3])
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(labels(children), ["[0]: 1", "[1]: 2", "[2]: 3"])
+        self.assertTrue(all(isinstance(child, IntNode) for child in children))
+
+    def test_large_list_ranges(self):
+        node = ListNode(value=list(range(PAGE_SIZE * 2 + 1)))
+
+        children = node.tno_get_children(None)
+
+        self.assertTrue(
+            all(isinstance(child, RangeNode) for child in children)
+        )
+        self.assertEqual(
+            labels(children),
+            [
+                "[0..999] (1000)",
+                "[1000..1999] (1000)",
+                "[2000..2000] (1)",
+            ],
+        )
+        last = children[-1].tno_get_children(None)
+        self.assertEqual(labels(last), ["[2000]: 2000"])
+
+    def test_huge_list_nested_ranges(self):
+        size = PAGE_SIZE ** 2 * 3 + 5
+        node = ListNode(value=range(size))
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(len(children), 4)
+        self.assertEqual(children[1].start, PAGE_SIZE ** 2)
+        self.assertEqual(children[1].stop, 2 * PAGE_SIZE ** 2)
+        grandchildren = children[1].tno_get_children(None)
+        self.assertEqual(len(grandchildren), PAGE_SIZE)
+        elements = grandchildren[-1].tno_get_children(None)
+        self.assertEqual(len(elements), PAGE_SIZE)
+        self.assertEqual(elements[-1].value, 2 * PAGE_SIZE ** 2 - 1)
+
+    def test_small_dict_sorted(self):
+        node = DictNode(value={"b": 2, "a": 1})
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(labels(children), ["['a']: 1", "['b']: 2"])
+
+    def test_large_dict_ranges(self):
+        value = {str(i): i for i in range(PAGE_SIZE + 1)}
+        node = DictNode(value=value)
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(len(children), 2)
+        self.assertEqual(
+            labels(children[1].tno_get_children(None)),
+            ["['1000']: 1000"],
+        )
+
+    def test_large_dict_modified(self):
+        value = {str(i): i for i in range(PAGE_SIZE + 1)}
+        node = DictNode(value=value)
+        node.tno_get_children(None)[1].tno_get_children(None)
+
+        del value["0"]
+        value["new"] = -1
+        children = node.tno_get_children(None)
+
+        self.assertEqual(
+            labels(children[1].tno_get_children(None)),
+            ["['new']: -1"],
+        )
+
+    def test_large_set_ranges(self):
+        node = SetNode(value=set(range(PAGE_SIZE + 1)))
+
+        children = node.tno_get_children(None)
+        elements = children[0].tno_get_children(
+            None
+        ) + children[1].tno_get_children(None)
+
+        self.assertEqual(
+            {element.value for element in elements}, set(range(PAGE_SIZE + 1))
+        )
+
+    @requires_numpy
+    def test_array_slices(self):
+        node = ArrayNode(value=numpy.zeros((PAGE_SIZE + 1, 3)))
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(
+            labels(children), ["[0..999, :] (1000)", "[1000..1000, :] (1)"]
+        )
+        (element,) = children[1].tno_get_children(None)
+        self.assertIsInstance(element, ArrayNode)
+        self.assertEqual(element.tno_get_label(None), "[1000, :]: Array(3)")
+
+    @requires_numpy
+    def test_zero_dimensional_array(self):
+        node = ArrayNode(value=numpy.array(1.0))
+
+        self.assertFalse(node.tno_has_children(None))
+        self.assertEqual(node.tno_get_children(None), [])
+
+
+class TestTraitsNode(unittest.TestCase):
+    def setUp(self):
+        self.model = Model()
+        self.node = RootNode(value=self.model).tno_get_children(None)[0]
+        self.replaced = []
+        self.changed = []
+        self.node.tno_when_children_replaced(
+            None, self.replaced.append, False
+        )
+        self.node.tno_when_children_changed(
+            None, lambda *args: self.changed.append(args), False
+        )
+
+    def tearDown(self):
+        self.node.tno_when_children_changed(None, None, True)
+        self.node.tno_when_children_replaced(None, None, True)
+
+    def test_trait_change_replaces_single_child(self):
+        self.assertIsInstance(self.node, TraitsNode)
+        children = self.node.tno_get_children(None)
+        index = labels(children).index(".count: 0")
+
+        self.model.count = 5
+
+        self.assertEqual(self.replaced, [])
+        ((object, name, event),) = self.changed
+        self.assertIs(object, self.node)
+        self.assertEqual(name, "_items")
+        self.assertEqual(event.index, index)
+        self.assertEqual(labels(event.added), [".count: 5"])
+        self.assertIs(self.node.tno_get_children(None), children)
+        self.assertEqual(children[index].tno_get_label(None), ".count: 5")
+
+    def test_list_items_change_replaces_single_child(self):
+        self.node.tno_get_children(None)
+
+        self.model.names.append("a")
+
+        self.assertEqual(self.replaced, [])
+        ((object, name, event),) = self.changed
+        self.assertEqual(labels(event.added), [".names: List(1)"])
+
+    def test_trait_named_items_replaces_single_child(self):
+        self.node.tno_get_children(None)
+
+        self.model.selected_items = [1, 2]
+
+        self.assertEqual(self.replaced, [])
+        ((object, name, event),) = self.changed
+        self.assertEqual(labels(event.added), [".selected_items: List(2)"])
+
+    def test_event_ignored(self):
+        self.node.tno_get_children(None)
+
+        self.model.ping = True
+
+        self.assertEqual(self.replaced, [])
+        self.assertEqual(self.changed, [])
+
+    def test_added_trait_replaces_children(self):
+        self.node.tno_get_children(None)
+
+        self.model.add_trait("extra", Int(3))
+
+        self.assertEqual(self.replaced, [self.node])
+        self.assertIn(".extra: 3", labels(self.node.tno_get_children(None)))
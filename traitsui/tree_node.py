@@ -181,6 +181,16 @@ class TreeNode(HasPrivateTraits):
     #: A toolkit-appropriate cell renderer (currently Qt only)
     renderer = Any()
 
+    #: An executor (eg. a ``concurrent.futures.ThreadPoolExecutor``) used to
+    #: get the children of objects in the background when they are expanded,
+    #: or None to get them when the objects are expanded (currently Qt only).
+    #: As the children are not got until then, 'has_children' returns True
+    #: and every object of the node is shown with an expander, even if it
+    #: turns out to have no children.  Expanding several levels (eg. with
+    #: the 'auto_open' of the editor) continues once the children of each
+    #: level are loaded.
+    children_executor = Any()
+
     #: A cache for listeners that need to keep state.
     _listener_cache = Dict()
 
@@ -208,13 +218,30 @@ class TreeNode(HasPrivateTraits):
         return self.children != ""
 
     def has_children(self, object):
-        """Returns whether the object has children."""
+        """Returns whether the object has children.
+
+        If the children are got in the background, they are assumed to exist
+        so that they are not got when the object is displayed.
+        """
+        if self.children_executor is not None:
+            return True
         return len(self.get_children(object)) > 0
 
     def get_children(self, object):
         """Gets the object's children."""
         return getattr(object, self.children, None)
 
+    def get_children_async(self, object):
+        """Starts getting the object's children in the background.
+
+        Returns a ``concurrent.futures.Future`` of the children, or None if
+        the children should be got with get_children instead.  By default,
+        get_children is submitted to the children_executor, if any.
+        """
+        if self.children_executor is None:
+            return None
+        return self.children_executor.submit(self.get_children, object)
+
     def get_children_id(self, object):
         """Gets the object's children identifier."""
         return self.children
@@ -289,6 +316,14 @@ class TreeNode(HasPrivateTraits):
         """
         label = self.label
         if label[:1] != "=":
+            if "." not in label:
+                # The listener is called with the object itself, so it can be
+                # shared by all the objects:
+                object.on_trait_change(
+                    listener, label, remove=remove, dispatch="ui"
+                )
+                return
+
             memo = ("label", label, object, listener)
             if not remove:
 
@@ -333,18 +368,23 @@ class TreeNode(HasPrivateTraits):
         """
         trait = self.column_labels
         if trait != "":
-            memo = ("column_label", trait, object, listener)
-            if not remove:
+            if "." not in trait:
+                # The listener is called with the object itself, so it can be
+                # shared by all the objects:
+                wrapped_listener = listener
+            else:
+                memo = ("column_label", trait, object, listener)
+                if not remove:
 
-                def wrapped_listener(target, name, new):
-                    """Ensure listener gets called with correct object."""
-                    return listener(object, name, new)
+                    def wrapped_listener(target, name, new):
+                        """Ensure listener gets called with correct object."""
+                        return listener(object, name, new)
 
-                self._listener_cache[memo] = wrapped_listener
-            else:
-                wrapped_listener = self._listener_cache.pop(memo, None)
-                if wrapped_listener is None:
-                    return
+                    self._listener_cache[memo] = wrapped_listener
+                else:
+                    wrapped_listener = self._listener_cache.pop(memo, None)
+                    if wrapped_listener is None:
+                        return
 
             object.on_trait_change(
                 wrapped_listener, trait, remove=remove, dispatch="ui"
@@ -563,6 +603,11 @@ class ITreeNode(Interface):
     def get_children(self):
         """Gets the object's children."""
 
+    def get_children_async(self):
+        """Starts getting the object's children in the background, returning
+        a future of the children, or None to get them with get_children.
+        """
+
     def get_children_id(self):
         """Gets the object's children identifier."""
 
@@ -734,6 +779,12 @@ class ITreeNodeAdapter(Adapter):
         """Gets the object's children."""
         return []
 
+    def get_children_async(self):
+        """Starts getting the object's children in the background, returning
+        a future of the children, or None to get them with get_children.
+        """
+        return None
+
     def get_children_id(self):
         """Gets the object's children identifier."""
         return ""
@@ -944,6 +995,16 @@ class ITreeNodeAdapterBridge(HasPrivateTraits):
         """Gets the object's children."""
         return self.adapter.get_children()
 
+    def get_children_async(self, object):
+        """Starts getting the object's children in the background, returning
+        a future of the children, or None to get them with get_children.
+        """
+        # Adapters written before this method was added may not define it:
+        get_children_async = getattr(self.adapter, "get_children_async", None)
+        if get_children_async is None:
+            return None
+        return get_children_async()
+
     def get_children_id(self, object):
         """Gets the object's children identifier."""
         return self.adapter.get_children_id()
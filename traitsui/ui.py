@@ -14,6 +14,7 @@
 
 import shelve
 import os
+from contextlib import contextmanager
 from warnings import warn
 
 from pyface.ui_traits import Image
@@ -34,12 +35,13 @@ from traits.api import (
 )
 
 from traits.trait_base import traits_home, is_str
+from traits.trait_notifiers import ui_dispatch
 
 from .editor import Editor
 
 from .view_elements import ViewElements
 
-from .handler import Handler, ViewHandler
+from .handler import changed_methods, Handler, ViewHandler
 
 from .toolkit import toolkit
 
@@ -49,6 +51,10 @@ from .item import Item
 
 from .group import Group, ShadowGroup
 
+from .helper import extended_getter
+
+from .profiling import record, recorded
+
 
 # List of **kind** types for views that must have a **parent** window specified
 kind_must_have_parent = ("panel", "subpanel")
@@ -150,6 +156,9 @@ class UI(HasPrivateTraits):
     #: List of editors used to build the user interface
     _editors = List()
 
+    #: Router updating the read-only items displayed without an editor
+    _display_router = Any()
+
     #: List of names bound to the **info** object
     _names = List()
 
@@ -183,6 +192,17 @@ class UI(HasPrivateTraits):
     #: Cache for key bindings.
     _key_bindings = Instance("traitsui.key_bindings.KeyBindings")
 
+    #: Nesting depth of active 'batch_updates' contexts
+    _batch_level = Int()
+
+    #: Updates deferred while batching, mapping each update method to the
+    #: Editor or UI it belongs to (so each one is applied at most once)
+    _batch_pending = Dict()
+
+    #: Updates coalesced until the next iteration of the event loop, mapping
+    #: each update method to the Editor it belongs to
+    _coalesced_pending = Dict()
+
     #: List of traits that are reset when a user interface is recycled
     #: (i.e. rebuilt).
     recyclable_traits = [
@@ -195,6 +215,7 @@ class UI(HasPrivateTraits):
         "_search",
         "_dispatchers",
         "_editors",
+        "_display_router",
         "_names",
         "_active_group",
         "_undoable",
@@ -202,6 +223,8 @@ class UI(HasPrivateTraits):
         "_groups_cache",
         "_key_bindings",
         "_focus_control",
+        "_batch_pending",
+        "_coalesced_pending",
     ]
 
     #: List of additional traits that are discarded when a user interface is
@@ -372,6 +395,7 @@ class UI(HasPrivateTraits):
         """Restores a previously pushed search stack level."""
         del self._search[: len(self._search) - level]
 
+    @recorded("prepare_ui")
     def prepare_ui(self):
         """Performs all processing that occurs after the user interface is
         created.
@@ -385,7 +409,8 @@ class UI(HasPrivateTraits):
         del self._defined[:]
 
         # Synchronize all context traits with associated editor traits:
-        self.sync_view()
+        with record("sync_view"):
+            self.sync_view()
 
         # Hook all keyboard events:
         toolkit().hook_events(self, self.control, "keys", self.key_handler)
@@ -397,7 +422,8 @@ class UI(HasPrivateTraits):
 
         # Invoke the handler's 'init' method, and abort if it indicates
         # failure:
-        started = handler.init(info)
+        with record("Handler.init"):
+            started = handler.init(info)
         if started is False:
             raise TraitError("User interface creation aborted")
         elif not isinstance(started, bool):
@@ -413,20 +439,10 @@ class UI(HasPrivateTraits):
         # method immediately so initial user interface state can be correctly
         # set:
         context = self.context
-        for name in self._each_trait_method(handler):
-            if name[-8:] == "_changed":
-                prefix = name[:-8]
-                col = prefix.find("_", 1)
-                if col >= 0:
-                    object = context.get(prefix[:col])
-                    if object is not None:
-                        method = getattr(handler, name)
-                        trait_name = prefix[col + 1 :]
-                        self._dispatchers.append(
-                            Dispatcher(method, info, object, trait_name)
-                        )
-                        if object.base_trait(trait_name).type != "event":
-                            method(info)
+        with record("dispatchers"):
+            dispatch_changed_methods(
+                handler, info, context, self._dispatchers
+            )
 
         # If there are any Editor object's whose 'visible', 'enabled' or
         # 'checked' state is controlled by a 'visible_when', 'enabled_when' or
@@ -436,9 +452,10 @@ class UI(HasPrivateTraits):
         #  set. Also trigger the evaluation immediately, so the visible,
         # enabled or checked state of each Editor can be correctly initialized:
         if (len(self._visible) + len(self._enabled) + len(self._checked)) > 0:
-            for object in context.values():
-                object.on_trait_change(self._evaluate_when, dispatch="ui")
-            self._do_evaluate_when(at_init=True)
+            with record("evaluate_when"):
+                for object in context.values():
+                    object.on_trait_change(self._evaluate_when, dispatch="ui")
+                self._do_evaluate_when(at_init=True)
 
         # Indicate that the user interface has been initialized:
         info.initialized = True
@@ -481,18 +498,16 @@ class UI(HasPrivateTraits):
 
     def get_extended_value(self, name):
         """Gets the current value of a specified extended trait name."""
-        names = name.split(".")
-        if len(names) > 1:
-            value = self.context[names[0]]
-            del names[0]
+        base_name, __, name = name.partition(".")
+        if name:
+            value = self.context[base_name]
         else:
+            name = base_name
             value = self.context["object"]
 
-        for name in names:
-            value = getattr(value, name)
-
-        return value
+        return extended_getter(name)(value)
 
+    @recorded("restore_prefs")
     def restore_prefs(self):
         """Retrieves and restores any saved user preference information
         associated with the UI.
@@ -645,6 +660,28 @@ class UI(HasPrivateTraits):
             if undoable == -1:
                 self._undoable = -1
 
+    @contextmanager
+    def batch_updates(self):
+        """Context manager that defers editor updates until it exits.
+
+        While the context is active, editor refreshes triggered by trait
+        changes and the re-evaluation of 'visible_when', 'enabled_when' and
+        'checked_when' conditions are queued rather than performed. Each
+        editor is updated at most once, with the values current at exit time.
+        Batches may be nested; the queued updates are applied when the
+        outermost batch exits.  Editors of child UIs are batched along with
+        their parent.
+
+        The start and end of the batch are dispatched to the UI thread in
+        the same way as ``dispatch="ui"`` trait handlers, so a batch can be
+        opened from a worker thread that modifies the model.
+        """
+        ui_dispatch(self._begin_batch)
+        try:
+            yield self
+        finally:
+            ui_dispatch(self._end_batch)
+
     def route_event(self, event):
         """Routes a "hooked" event to the correct handler method."""
         toolkit().route_event(self, event)
@@ -720,7 +757,80 @@ class UI(HasPrivateTraits):
         controlled by a 'visible_when', 'enabled_when' or 'checked_when'
         expression.
         """
-        self._do_evaluate_when(at_init=False)
+        if not self._defer_update(self, self._evaluate_when):
+            self._do_evaluate_when(at_init=False)
+
+    def _begin_batch(self):
+        """Starts a (possibly nested) batch of deferred updates."""
+        self._batch_level += 1
+
+    def _end_batch(self):
+        """Ends a batch, applying the deferred updates if it is outermost."""
+        self._batch_level -= 1
+        if self._batch_level > 0:
+            return
+
+        pending = self._batch_pending
+        self._batch_pending = {}
+        for method, owner in pending.items():
+            # Skip editors and UIs which were disposed during the batch:
+            if owner.control is not None:
+                method()
+
+    def _defer_update(self, owner, method):
+        """Queues an update if this UI, or one of its parents, is batching.
+
+        Parameters
+        ----------
+        owner : Editor or UI
+            The object performing the update.  The update is dropped if the
+            owner's control has been destroyed by the time it is applied.
+        method : callable
+            The update to perform.
+
+        Returns
+        -------
+        deferred : bool
+            Whether the update was queued.  If False the caller should
+            perform the update immediately.
+        """
+        ui = self
+        while ui is not None:
+            if ui._batch_level > 0:
+                ui._batch_pending[method] = owner
+                return True
+            ui = ui.parent
+
+        return False
+
+    def _coalesce_update(self, owner, method):
+        """Queues an update until the next iteration of the event loop.
+
+        Each update is queued at most once, so that it is performed with the
+        values current when the queued updates are applied.
+
+        Parameters
+        ----------
+        owner : Editor
+            The object performing the update.  The update is dropped if the
+            owner's control has been destroyed by the time it is applied.
+        method : callable
+            The update to perform.
+        """
+        if not self._coalesced_pending:
+            from pyface.api import GUI
+
+            GUI.invoke_later(self._apply_coalesced)
+        self._coalesced_pending[method] = owner
+
+    def _apply_coalesced(self):
+        """Applies the updates queued by _coalesce_update."""
+        pending = self._coalesced_pending
+        self._coalesced_pending = {}
+        for method, owner in pending.items():
+            # Skip editors which were disposed in the meantime:
+            if owner.control is not None:
+                method()
 
     def _do_evaluate_when(self, at_init=False):
         """Set the 'visible', 'enabled', and 'checked' states for all Editors.
@@ -884,6 +994,107 @@ class UI(HasPrivateTraits):
                 parent.key_bindings.children.append(self.key_bindings)
 
 
+def dispatch_changed_methods(handler, info, context, dispatchers):
+    """Dispatches a handler's 'object_name_changed' methods.
+
+    For each method of the handler whose name is of the form
+    'object_name_changed', where 'object' is the name of an object in the
+    context, the method is called whenever the object's 'name' trait changes.
+    The method is also called immediately (unless 'name' is an event) so that
+    the initial user interface state can be correctly set.
+
+    Changes to each object are listened to by a single ObjectDispatcher,
+    which is reused if already present in *dispatchers*.
+
+    Parameters
+    ----------
+    handler : HasTraits
+        The handler whose methods are dispatched.
+    info : UIInfo
+        The UIInfo object passed to the methods.
+    context : dict
+        The context of the user interface.
+    dispatchers : list
+        The list of dispatchers of the user interface, to which any new
+        dispatchers are appended.
+    """
+    object_dispatchers = {
+        id(dispatcher.object): dispatcher
+        for dispatcher in dispatchers
+        if isinstance(dispatcher, ObjectDispatcher)
+    }
+    # The names each dispatcher must start listening to, keyed by its id:
+    new_names = {}
+    added = []
+    for object_name, trait_name, method_name in changed_methods(handler):
+        object = context.get(object_name)
+        if object is None:
+            continue
+
+        dispatcher = object_dispatchers.get(id(object))
+        if dispatcher is None:
+            dispatcher = ObjectDispatcher(info, object)
+            object_dispatchers[id(object)] = dispatcher
+            dispatchers.append(dispatcher)
+
+        method = getattr(handler, method_name)
+        if dispatcher.add(trait_name, method):
+            new_names.setdefault(id(dispatcher), (dispatcher, []))[1].append(
+                trait_name
+            )
+        added.append((object, trait_name, method))
+
+    for dispatcher, trait_names in new_names.values():
+        dispatcher.listen(trait_names)
+
+    for object, trait_name, method in added:
+        if object.base_trait(trait_name).type != "event":
+            method(info)
+
+
+class ObjectDispatcher(object):
+    """Dispatches handler methods for changes to the traits of an object,
+    using a single trait change listener for all of the traits.
+    """
+
+    def __init__(self, info, object):
+        """Initializes the object."""
+        self.info = info
+        self.object = object
+        self.methods = {}
+
+    def add(self, trait_name, method):
+        """Adds a method to call when the named trait changes.
+
+        Returns whether the trait is a new one, which must be listened to
+        (see listen).
+        """
+        methods = self.methods.get(trait_name)
+        if methods is None:
+            self.methods[trait_name] = [method]
+            return True
+
+        methods.append(method)
+        return False
+
+    def listen(self, trait_names):
+        """Listens to changes of the named traits of the object."""
+        self.object.on_trait_change(self.dispatch, trait_names)
+
+    def dispatch(self, object, name, old, new):
+        """Dispatches the methods for a trait change on the UI thread."""
+        methods = self.methods.get(name)
+        if methods is not None:
+            for method in methods:
+                ui_dispatch(method, self.info)
+
+    def remove(self):
+        """Removes the dispatcher."""
+        self.object.on_trait_change(
+            self.dispatch, list(self.methods), remove=True
+        )
+
+
 class Dispatcher(object):
     def __init__(self, method, info, object, method_name):
         """Initializes the object."""
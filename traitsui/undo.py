@@ -13,10 +13,13 @@
 """
 
 import collections.abc
+import sys
+import time
 
 from traits.api import (
     Bool,
     Event,
+    Float,
     HasPrivateTraits,
     HasStrictTraits,
     HasTraits,
@@ -42,6 +45,45 @@ from pyface.undo.api import (
 NumericTypes = (int, float, complex)
 SimpleTypes = (str, bytes) + NumericTypes
 
+#: The time window (in seconds) used to merge consecutive changes to the same
+#: trait in the undo histories that views create for themselves.
+DEFAULT_MERGE_WINDOW = 0.5
+
+#: The default maximum number of entries retained in the undo histories that
+#: views create for themselves (see View.undo_max_depth).
+DEFAULT_MAX_DEPTH = 1000
+
+
+def estimate_size(value):
+    """Returns a rough estimate of the memory retained by a value, in bytes.
+
+    The estimate is shallow: it includes the size of the value itself, the
+    data buffer of array-like values that expose an ``nbytes`` attribute and,
+    for lists, tuples, sets and dicts, the shallow size of their elements.
+
+    Parameters
+    ----------
+    value : any
+        The value to estimate the size of.
+
+    Returns
+    -------
+    size : int
+        The estimated size in bytes.
+    """
+    size = sys.getsizeof(value, 0)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int) and not isinstance(value, SimpleTypes):
+        size = max(size, nbytes)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item, 0) for item in value)
+    elif isinstance(value, dict):
+        size += sum(
+            sys.getsizeof(key, 0) + sys.getsizeof(item, 0)
+            for key, item in value.items()
+        )
+    return size
+
 
 class AbstractUndoItem(AbstractCommand):
     """Abstract base class for undo items.
@@ -195,6 +237,10 @@ class UndoItem(AbstractUndoItem):
                     return True
         return False
 
+    def estimated_size(self):
+        """Returns an estimate of the memory retained by the item, in bytes."""
+        return estimate_size(self.old_value) + estimate_size(self.new_value)
+
     def __repr__(self):
         """Returns a "pretty print" form of the object."""
         n = self.name
@@ -278,6 +324,10 @@ class ListUndoItem(AbstractUndoItem):
                         return True
         return False
 
+    def estimated_size(self):
+        """Returns an estimate of the memory retained by the item, in bytes."""
+        return estimate_size(self.added) + estimate_size(self.removed)
+
     def __repr__(self):
         """Returns a 'pretty print' form of the object."""
         return "undo( %s.%s[%d:%d] = %s )" % (
@@ -322,9 +372,45 @@ class _MultiUndoItem(AbstractCommand):
         for cmd in self.commands:
             cmd.undo()
 
+    def estimated_size(self):
+        """Returns an estimate of the memory retained by the item, in bytes."""
+        return sum(_command_size(cmd) for cmd in self.commands)
+
+
+def _command_size(command):
+    """Returns an estimate of the memory retained by a command, in bytes.
+
+    Commands which do not provide an ``estimated_size`` method are counted
+    using their shallow size only.
+    """
+    estimated_size = getattr(command, "estimated_size", None)
+    if estimated_size is None:
+        return sys.getsizeof(command, 0)
+    return estimated_size()
+
+
+def _stack_entries(stack):
+    """Returns the list of entries of a command stack, or None if they are
+    not available.
+
+    Merging entries and bounding the size of an UndoHistory depend on the
+    private '_stack' list and '_index' of pyface's CommandStack, as there is
+    no public API to modify or discard its entries.  For other ICommandStack
+    implementations, entries are neither merged nor discarded.
+    """
+    entries = getattr(stack, "_stack", None)
+    if not isinstance(entries, list) or not hasattr(stack, "_index"):
+        return None
+    return entries
+
 
 class UndoHistory(HasStrictTraits):
-    """Manages a list of undoable changes."""
+    """Manages a list of undoable changes.
+
+    The 'merge_window', 'max_depth' and 'max_bytes' features rely on the
+    internals of pyface's CommandStack, and are not applied to other
+    command stacks.
+    """
 
     # -------------------------------------------------------------------------
     #  Trait definitions:
@@ -351,17 +437,55 @@ class UndoHistory(HasStrictTraits):
     #: Can an action be redone?
     can_redo = Property(Bool, observe='_can_redo')
 
+    #: The maximum number of entries retained in the history, or 0 for no
+    #: limit.  The oldest entries are discarded first (see 'truncated').
+    max_depth = Int(0)
+
+    #: The (estimated) number of bytes the entries in the history may retain,
+    #: or 0 for no limit.  The oldest entries are discarded first, but the
+    #: most recent entry is always kept (see 'truncated').
+    max_bytes = Int(0)
+
+    #: Time window (in seconds) within which an UndoItem added for the same
+    #: object and trait as the most recent entry is merged into that entry
+    #: rather than creating a new one.  A value of 0 disables this merging.
+    merge_window = Float(0.0)
+
+    #: The number of entries currently in the history.
+    depth = Property(Int)
+
+    #: An estimate of the number of bytes retained by the history entries.
+    retained_bytes = Property(Int)
+
+    #: Whether entries have been discarded to keep the history within
+    #: 'max_depth' or 'max_bytes' since it was last cleared.  If so, 'revert'
+    #: can only undo the changes which are still in the history.
+    truncated = Bool(False)
+
     _can_undo = Bool()
 
     _can_redo = Bool()
 
+    #: The time at which the most recent entry was added.
+    _last_add_time = Float(float("-inf"))
+
+    #: The (entry, estimated size) pairs of the entries of the stack whose
+    #: size is known, in stack order.
+    _entry_sizes = List()
+
+    #: The sum of the sizes in '_entry_sizes'.
+    _retained_bytes = Int(0)
+
     def add(self, undo_item, extend=False):
         """Adds an UndoItem to the history."""
         if extend:
             self.extend(undo_item)
         else:
             self.manager.active_stack = self.stack
-            self.stack.push(undo_item)
+            if not self._merge_recent(undo_item):
+                self.stack.push(undo_item)
+            self._last_add_time = time.monotonic()
+            self._enforce_bounds()
 
     def extend(self, undo_item):
         """Extends the undo history.
@@ -383,6 +507,7 @@ class UndoHistory(HasStrictTraits):
         else:
             command = _MultiUndoItem(commands=[])
         command.push(undo_item)
+        self._enforce_bounds()
 
     def undo(self):
         """Undoes an operation."""
@@ -395,7 +520,11 @@ class UndoHistory(HasStrictTraits):
             self.manager.redo()
 
     def revert(self):
-        """Reverts all changes made so far and clears the history."""
+        """Reverts all changes made so far and clears the history.
+
+        If the history has been truncated (see 'truncated'), the changes
+        whose entries were discarded are not reverted.
+        """
         # undo everything
         self.manager.active_stack = self.stack
         self.stack.undo(sequence_nr=-1)
@@ -405,6 +534,128 @@ class UndoHistory(HasStrictTraits):
         """Clears the undo history."""
         self.manager.active_stack = self.stack
         self.stack.clear()
+        self._entry_sizes = []
+        self._retained_bytes = 0
+        self.truncated = False
+
+    def statistics(self):
+        """Returns statistics about the size of the history.
+
+        Returns
+        -------
+        statistics : dict
+            A dictionary with the number of entries ('depth'), the index of
+            the current entry ('now') and the estimated memory retained by
+            the entries in bytes ('retained_bytes').
+        """
+        return {
+            "depth": self.depth,
+            "now": self.now,
+            "retained_bytes": self.retained_bytes,
+        }
+
+    # -- Private methods ------------------------------------------------------
+
+    def _merge_recent(self, undo_item):
+        """Merges an UndoItem into the most recent entry if it is recent.
+
+        Returns True if the item was merged.
+        """
+        if self.merge_window <= 0 or not isinstance(undo_item, UndoItem):
+            return False
+
+        if time.monotonic() - self._last_add_time > self.merge_window:
+            return False
+
+        entries = _stack_entries(self.stack)
+        if (
+            entries is None
+            or len(entries) == 0
+            or self.stack._index != len(entries) - 1
+        ):
+            return False
+
+        command = entries[-1].command
+        if (
+            entries[-1].clean
+            or type(command) is not type(undo_item)
+            or command.object is not undo_item.object
+            or command.name != undo_item.name
+        ):
+            return False
+
+        command.new_value = undo_item.new_value
+        return True
+
+    def _enforce_bounds(self):
+        """Discards the oldest entries until the history is within bounds."""
+        max_depth = self.max_depth
+        max_bytes = self.max_bytes
+        if max_depth <= 0 and max_bytes <= 0:
+            if len(self._entry_sizes) > 0:
+                # don't keep the entries discarded by the stack alive
+                self._update_sizes()
+            return
+
+        stack = self.stack
+        entries = _stack_entries(stack)
+        if entries is None:
+            return
+
+        n_drop = 0
+        if max_depth > 0:
+            n_drop = max(len(entries) - max_depth, 0)
+        if max_bytes > 0:
+            self._update_sizes()
+            sizes = self._entry_sizes
+            total = self._retained_bytes - sum(
+                size for _, size in sizes[:n_drop]
+            )
+            while total > max_bytes and n_drop < len(entries) - 1:
+                total -= sizes[n_drop][1]
+                n_drop += 1
+
+        if n_drop > 0:
+            del entries[:n_drop]
+            stack._index = max(stack._index - n_drop, -1)
+            self.truncated = True
+            sizes = self._entry_sizes
+            if len(sizes) > 0:
+                n_sized = min(n_drop, len(sizes))
+                self._retained_bytes -= sum(
+                    size for _, size in sizes[:n_sized]
+                )
+                del sizes[:n_sized]
+
+    def _update_sizes(self):
+        """Brings the estimated sizes of the entries up to date.
+
+        Pushing onto the stack only discards the undone entries at its end,
+        then appends an entry or merges into the last one, so only the sizes
+        of the entries after the last unchanged one are computed.
+        """
+        entries = _stack_entries(self.stack)
+        if entries is None:
+            entries = []
+        sizes = self._entry_sizes
+        total = self._retained_bytes
+        n = len(sizes)
+        while n > 0 and (
+            n > len(entries) or sizes[n - 1][0] is not entries[n - 1]
+        ):
+            n -= 1
+            total -= sizes[n][1]
+        if n > 0 and n == len(entries):
+            # the last entry may have been merged into
+            n -= 1
+            total -= sizes[n][1]
+        del sizes[n:]
+
+        for entry in entries[n:]:
+            size = _command_size(entry.command)
+            sizes.append((entry, size))
+            total += size
+        self._retained_bytes = total
 
     @observe('manager.stack_updated')
     def _observe_stack_updated(self, event):
@@ -430,6 +681,16 @@ class UndoHistory(HasStrictTraits):
     def _get_can_redo(self):
         return self._can_redo
 
+    def _get_depth(self):
+        entries = _stack_entries(self.stack)
+        if entries is None:
+            return 0
+        return len(entries)
+
+    def _get_retained_bytes(self):
+        self._update_sizes()
+        return self._retained_bytes
+
     def _manager_default(self):
         manager = UndoManager()
         return manager
@@ -439,6 +700,28 @@ class UndoHistory(HasStrictTraits):
         return stack
 
 
+def view_undo_history(view):
+    """Returns a new undo history for a view.
+
+    The history merges high-frequency changes (see DEFAULT_MERGE_WINDOW) and
+    is bounded by the view's 'undo_max_depth' and 'undo_max_bytes'.
+
+    Parameters
+    ----------
+    view : View
+        The view the history is created for.
+
+    Returns
+    -------
+    history : UndoHistory
+    """
+    return UndoHistory(
+        merge_window=DEFAULT_MERGE_WINDOW,
+        max_depth=view.undo_max_depth,
+        max_bytes=view.undo_max_bytes,
+    )
+
+
 class UndoHistoryUndoItem(AbstractUndoItem):
     """An undo item for the undo history."""
 
@@ -22,9 +22,11 @@ from traits.api import (
     HasPrivateTraits,
     HasTraits,
     Instance,
+    Int,
     List,
     Str,
 )
+from traits.trait_list_object import TraitListEvent
 
 from .tree_node import ObjectTreeNode, TreeNode, TreeNodeObject
 
@@ -191,8 +193,18 @@ class OtherNode(SingleValueTreeNodeObject):
     pass
 
 
+#: The maximum number of children displayed for a node before the elements of
+#: a container are grouped into ranges.
+PAGE_SIZE = 1000
+
+
 class TupleNode(MultiValueTreeNodeObject):
-    """A tree node for tuples."""
+    """A tree node for tuples.
+
+    Containers with more than PAGE_SIZE elements display their elements in
+    ranges of (powers of) PAGE_SIZE elements, whose nodes are only created
+    when the range is expanded.
+    """
 
     def format_value(self, value):
         """Returns the formatted version of the value."""
@@ -206,16 +218,40 @@ class TupleNode(MultiValueTreeNodeObject):
 
     def tno_get_children(self, node):
         """Gets the object's children."""
-        node_for = self.node_for
-        value = self.value
-        if len(value) > 500:
-            return (
-                [node_for("[%d]" % i, x) for i, x in enumerate(value[:250])]
-                + [StringNode(value="...", readonly=True)]
-                + [node_for("[%d]" % i, x) for i, x in enumerate(value[-250:])]
+        return self.range_children(0, len(self.value))
+
+    def range_children(self, start, stop):
+        """Gets the nodes for the elements in a range of indices.
+
+        If the range has more than PAGE_SIZE elements, the nodes returned
+        are RangeNodes for at most PAGE_SIZE sub-ranges.
+        """
+        size = stop - start
+        if size <= PAGE_SIZE:
+            return [self.element_node(i) for i in range(start, stop)]
+
+        step = PAGE_SIZE
+        while size > step * PAGE_SIZE:
+            step *= PAGE_SIZE
+
+        return [
+            RangeNode(
+                parent=self,
+                container=self,
+                start=i,
+                stop=min(i + step, stop),
+                readonly=self.readonly,
             )
+            for i in range(start, stop, step)
+        ]
+
+    def element_node(self, index):
+        """Returns the node for the element at a specified index."""
+        return self.node_for("[%d]" % index, self.value[index])
 
-        return [node_for("[%d]" % i, x) for i, x in enumerate(value)]
+    def range_label(self, start, stop):
+        """Returns the label of a range of elements."""
+        return "[%d..%d]" % (start, stop - 1)
 
 
 class ListNode(TupleNode):
@@ -239,21 +275,76 @@ class ListNode(TupleNode):
 class SetNode(ListNode):
     """A tree node for sets."""
 
+    #: The elements of the set, in the order they are displayed
+    _elements = Any()
+
     def format_value(self, value):
         """Returns the formatted version of the value."""
         return "Set(%d)" % len(value)
 
+    def tno_get_children(self, node):
+        """Gets the object's children."""
+        # The set may have been modified since its elements were listed:
+        self._elements = None
+        return super().tno_get_children(node)
+
+    def element_node(self, index):
+        """Returns the node for the element at a specified index."""
+        if self._elements is None:
+            self._elements = list(self.value)
+        return self.node_for("[%d]" % index, self._elements[index])
+
+    def _value_changed(self):
+        """Handles the value of the node being changed."""
+        self._elements = None
+
 
 class ArrayNode(TupleNode):
-    """A tree node for arrays."""
+    """A tree node for arrays.
+
+    The children of an array are the slices along its first axis.
+    """
 
     def format_value(self, value):
         """Returns the formatted version of the value."""
         return "Array(%s)" % ",".join([str(n) for n in value.shape])
 
+    def tno_has_children(self, node):
+        """Returns whether the object has children, based on the shape of
+        the array.
+        """
+        return self.value.ndim > 0 and self.value.shape[0] > 0
+
+    def tno_get_children(self, node):
+        """Gets the object's children."""
+        if self.value.ndim == 0:
+            return []
+        return self.range_children(0, self.value.shape[0])
+
+    def element_node(self, index):
+        """Returns the node for the element at a specified index."""
+        label = "[%s]" % ", ".join(
+            [str(index)] + [":"] * (self.value.ndim - 1)
+        )
+        return self.node_for(label, self.value[index])
+
+    def range_label(self, start, stop):
+        """Returns the label of a range of elements."""
+        return "[%s]" % ", ".join(
+            ["%d..%d" % (start, stop - 1)] + [":"] * (self.value.ndim - 1)
+        )
+
 
 class DictNode(TupleNode):
-    """A tree node for dictionaries."""
+    """A tree node for dictionaries.
+
+    Dictionaries with at most PAGE_SIZE items are displayed sorted by the
+    repr of their keys; larger dictionaries are displayed in insertion order
+    so that only the visible keys need to be formatted.
+    """
+
+    #: The keys of the dictionary, in the order they are displayed
+    _keys = Any()
 
     def format_value(self, value):
         """Returns the formatted version of the value."""
@@ -261,23 +352,63 @@ class DictNode(TupleNode):
 
     def tno_get_children(self, node):
         """Gets the object's children."""
-        node_for = self.node_for
-        items = [(repr(k), v) for k, v in self.value.items()]
-        items.sort(key=itemgetter(0))
-        if len(items) > 500:
-            return (
-                [node_for("[%s]" % k, v) for k, v in items[:250]]
-                + [StringNode(value="...", readonly=True)]
-                + [node_for("[%s]" % k, v) for k, v in items[-250:]]
-            )
-
-        return [node_for("[%s]" % k, v) for k, v in items]
+        # The dictionary may have been modified since its keys were listed:
+        self._keys = None
+        if len(self.value) <= PAGE_SIZE:
+            node_for = self.node_for
+            items = [(repr(k), v) for k, v in self.value.items()]
+            items.sort(key=itemgetter(0))
+            return [node_for("[%s]" % k, v) for k, v in items]
+
+        return self.range_children(0, len(self.value))
+
+    def element_node(self, index):
+        """Returns the node for the item at a specified index."""
+        if self._keys is None:
+            self._keys = list(self.value)
+        key = self._keys[index]
+        return self.node_for("[%r]" % (key,), self.value[key])
+
+    def _value_changed(self):
+        """Handles the value of the node being changed."""
+        self._keys = None
 
     def tno_can_delete(self, node):
         """Returns whether the object's children can be deleted."""
         return not self.readonly
 
 
+class RangeNode(MultiValueTreeNodeObject):
+    """A tree node for a range of the elements of a large container.
+
+    The nodes for the elements are only created when the range is expanded.
+    """
+
+    #: The node of the container the elements belong to
+    container = Instance(TupleNode)
+
+    #: The index of the first element of the range
+    start = Int()
+
+    #: The index after the last element of the range
+    stop = Int()
+
+    def tno_get_label(self, node):
+        """Gets the label to display for a specified object."""
+        return "%s (%d)" % (
+            self.container.range_label(self.start, self.stop),
+            self.stop - self.start,
+        )
+
+    def tno_get_icon(self, node, is_expanded):
+        """Returns the icon for a specified object."""
+        return self.container.tno_get_icon(node, is_expanded)
+
+    def tno_get_children(self, node):
+        """Gets the object's children."""
+        return self.container.range_children(self.start, self.stop)
+
+
 class FunctionNode(SingleValueTreeNodeObject):
     """A tree node for functions"""
 
@@ -347,27 +478,48 @@ class ClassNode(ObjectNode):
 
 
 class TraitsNode(ObjectNode):
-    """A tree node for traits."""
+    """A tree node for traits.
+
+    While the tree is listening to the object, the child nodes are cached and
+    a change to a trait only replaces the node for that trait.
+    """
+
+    #: Mapping of the names of the cached children to their indices
+    _names = Any()
+
+    #: The cached child nodes (if any)
+    _children = Any()
+
+    #: The listener for changes to individual children
+    _changed_listener = Any()
 
     def tno_has_children(self, node):
         """Returns whether the object has children."""
+        if self._names is not None:
+            return len(self._names) > 0
         return len(self._get_names()) > 0
 
     def tno_get_children(self, node):
         """Gets the object's children."""
+        if self._children is not None:
+            return self._children
+
         names = sorted(self._get_names())
-        value = self.value
-        node_for = self.node_for
-        nodes = []
-        for name in names:
-            try:
-                item_value = getattr(value, name, "<unknown>")
-            except Exception as excp:
-                item_value = "<%s>" % excp
-            nodes.append(node_for("." + name, item_value))
+        nodes = [self._node_for_name(name) for name in names]
+        if self._listener is not None:
+            self._names = {name: i for i, name in enumerate(names)}
+            self._children = nodes
 
         return nodes
 
+    def _node_for_name(self, name):
+        """Returns the child node for a specified attribute name."""
+        try:
+            item_value = getattr(self.value, name, "<unknown>")
+        except Exception as excp:
+            item_value = "<%s>" % excp
+        return self.node_for("." + name, item_value)
+
     def _get_names(self):
         """Gets the names of all defined traits or attributes."""
         value = self.value
@@ -382,19 +534,56 @@ class TraitsNode(ObjectNode):
         """Sets up or removes a listener for children being replaced on a
         specified object.
         """
-        self._listener = listener
+        self._listener = None if remove else listener
+        self._names = self._children = None
         self.value.on_trait_change(
-            self._children_replaced, remove=remove, dispatch="ui"
+            self._trait_changed, remove=remove, dispatch="ui"
         )
 
-    def _children_replaced(self):
-        self._listener(self)
+    def _trait_changed(self, object, name, old, new):
+        """Handles a trait of the object changing."""
+        if name.endswith("_items") and (
+            self._names is None or name not in self._names
+        ):
+            # This is the event fired for the items of a container trait
+            # (rather than a trait such as 'selected_items'):
+            name = name[:-6]
+
+        if self._names is None:
+            index = None
+        else:
+            index = self._names.get(name)
+            if (
+                index is None
+                and name != "trait_added"
+                and name not in self._get_names()
+            ):
+                # The trait is not displayed (eg. it is an event):
+                return
+
+        if index is None or self._changed_listener is None:
+            # The set of names may have changed, so replace all children:
+            self._names = self._children = None
+            if self._listener is not None:
+                self._listener(self)
+            return
+
+        old_child = self._children[index]
+        new_child = self._node_for_name(name)
+        self._children[index] = new_child
+        self._changed_listener(
+            self,
+            "_items",
+            TraitListEvent(
+                index=index, removed=[old_child], added=[new_child]
+            ),
+        )
 
     def tno_when_children_changed(self, node, listener, remove):
         """Sets up or removes a listener for children being changed on a
         specified object.
         """
-        pass
+        self._changed_listener = None if remove else listener
 
 
 class RootNode(MultiValueTreeNodeObject):
@@ -478,6 +667,7 @@ value_tree_nodes = [
             ArrayNode,
             DictNode,
             SetNode,
+            RangeNode,
             FunctionNode,
             MethodNode,
             ObjectNode,
@@ -512,6 +702,7 @@ value_tree_editor_with_root = TreeEditor(
                 ArrayNode,
                 DictNode,
                 SetNode,
+                RangeNode,
                 FunctionNode,
                 MethodNode,
                 ObjectNode,
@@ -23,6 +23,7 @@ from traits.api import (
     Event,
     Float,
     Instance,
+    Int,
     List,
     PrefixList,
     Str,
@@ -53,6 +54,10 @@ from .item import Item
 
 from .include import Include
 
+from .profiling import record_view
+
+from .undo import DEFAULT_MAX_DEPTH
+
 # -------------------------------------------------------------------------
 #  Trait definitions:
 # -------------------------------------------------------------------------
@@ -210,6 +215,15 @@ class View(ViewElement):
     #: pressing Enter will not activate any button.
     default_button = AButton
 
+    #: The maximum number of changes retained in the undo history of the view,
+    #: or 0 for no limit. The oldest changes are discarded first.
+    undo_max_depth = Int(DEFAULT_MAX_DEPTH)
+
+    #: The (estimated) number of bytes the changes retained in the undo
+    #: history of the view may hold on to, or 0 for no limit. The oldest
+    #: changes are discarded first.
+    undo_max_bytes = Int(0)
+
     #: The set of global key bindings for the view. Each time a key is pressed
     #: while the view has keyboard focus, the key is checked to see if it is one
     #: of the keys recognized by the KeyBindings object. If it is, the matching
@@ -454,7 +468,8 @@ class View(ViewElement):
         if kind is None:
             kind = self.kind
 
-        ui.ui(parent, kind)
+        with record_view(self, kind):
+            ui.ui(parent, kind)
 
         return ui
 
@@ -18,7 +18,7 @@ import wx
 
 from traits.api import Property
 
-from traitsui.helper import enum_values_changed
+from traitsui.helper import enum_values_changed, invalidate_enum_values
 
 from .editor import Editor
 
@@ -181,12 +181,15 @@ class SimpleEditor(Editor):
             self._names,
             self._mapping,
             self._inverse_mapping,
-        ) = enum_values_changed(self._value(), self.string_value)
+        ) = enum_values_changed(
+            self._value(), self.string_value, self.string_value_key()
+        )
 
-    def _values_changed(self):
+    def _values_changed(self, new):
         """Handles the underlying object model's enumeration set or factory's
         values being changed.
         """
+        invalidate_enum_values(self._value(), new)
         self.values_changed()
         self.update_editor()
 
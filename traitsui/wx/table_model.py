@@ -14,6 +14,8 @@
 
 
 import logging
+from bisect import bisect_left
+from operator import itemgetter
 
 import wx
 
@@ -95,7 +97,7 @@ class TableModel(GridModel):
         # Set up listeners for any of the model data changing:
         object.on_trait_change(self._on_data_changed, name, dispatch="ui")
         object.on_trait_change(
-            self.fire_content_changed, name + ".-", dispatch="ui"
+            self._on_item_changed, name + ".-", dispatch="ui"
         )
 
         # Set up listeners for any column definitions changing:
@@ -124,7 +126,7 @@ class TableModel(GridModel):
         # Remove listeners for any of the model data changing:
         object.on_trait_change(self._on_data_changed, name, remove=True)
         object.on_trait_change(
-            self.fire_content_changed, name + ".-", remove=True
+            self._on_item_changed, name + ".-", remove=True
         )
 
         # Remove listeners for any column definitions changing:
@@ -176,11 +178,40 @@ class TableModel(GridModel):
                 raise IndexError
         elif index >= 0:
             mapped_index = self.editor.filtered_indices[index] + 1
-        self.__items().insert(mapped_index, item)
-        sorted = self._sort_model()
-        if sorted:
-            mapped_index = self.__items().index(item)
-        self._filtered_cache = None
+
+        editor = self.editor
+        sorted = editor.factory.sort_model and (self._sorter is not None)
+        if sorted and self._sorted_keys is None:
+            # We don't know the sort keys of the model, so sort it fully:
+            self.__items().insert(mapped_index, item)
+            self._sort_model()
+            self._filtered_cache = None
+            return (self.__items().index(item), sorted)
+
+        self._updating_items = True
+        try:
+            if sorted:
+                # Insert the item into its sorted position in the raw list:
+                key = self._sorter(item)
+                raw_index = _bisect(
+                    self._sorted_keys, key, self.reverse ^ self._reverse
+                )
+                self.__items(False).insert(raw_index, item)
+                self._sorted_keys.insert(raw_index, key)
+                mapped_index = raw_index
+                if self.reverse:
+                    mapped_index = len(self._sorted_keys) - 1 - raw_index
+            else:
+                items = self.__items()
+                items.insert(mapped_index, item)
+        finally:
+            self._updating_items = False
+
+        if not sorted and self.reverse and mapped_index == 0:
+            # Inserting at the start of a ReversedList appends to its end:
+            self._filtered_item_inserted(len(items) - 1, item)
+        else:
+            self._filtered_item_inserted(mapped_index, item)
         return (mapped_index, sorted)
 
     def delete_filtered_item_at(self, index):
@@ -191,8 +222,19 @@ class TableModel(GridModel):
         mapped_index = self.editor.filtered_indices[index]
         items = self.__items()
         object = items[mapped_index]
-        del items[mapped_index]
-        self._filtered_cache = None
+        if self._sorted_keys is not None:
+            raw_index = mapped_index
+            if self.reverse:
+                raw_index = len(items) - 1 - mapped_index
+            del self._sorted_keys[raw_index]
+
+        self._updating_items = True
+        try:
+            del items[mapped_index]
+        finally:
+            self._updating_items = False
+
+        self._filtered_item_deleted(index, mapped_index)
         return (mapped_index, object)
 
     def update_columns(self):
@@ -203,7 +245,7 @@ class TableModel(GridModel):
 
     def no_column_sort(self):
         """Resets any sorting being performed on the underlying model."""
-        self._sorter = self._filtered_cache = None
+        self._sorter = self._filtered_cache = self._sorted_keys = None
         self.column_sorted = GridSortEvent(index=-1)
         # self.fire_structure_changed()
 
@@ -216,6 +258,11 @@ class TableModel(GridModel):
         self.fire_structure_changed()
         self.editor.filter_modified()
 
+    def _auto_add_row_changed(self):
+        """Handles the 'auto_add' row being replaced."""
+        # The cached filtered items end with the previous 'auto_add' row:
+        self._filtered_cache = None
+
     def _click_changed(self, event):
         """Handles the grid firing a 'click' event."""
         row, col = event
@@ -308,15 +355,16 @@ class TableModel(GridModel):
         if not factory.sortable:
             return
 
-        # Flush the object cache:
-        self._filtered_cache = None
-
         # Cache the sorting information for later:
         self._sorter = self.__get_column(col).key
         self._reverse = reverse
 
-        # If model sorting is requested, do it now:
-        self._sort_model()
+        # If model sorting is requested, do it now, otherwise re-sort the
+        # items which pass the filter (if known):
+        if self._sort_model() or (self._filtered_cache is None):
+            self._filtered_cache = None
+        else:
+            self._sort_filtered_cache()
 
         # Indicate the we have been sorted:
         self.sorted = True
@@ -640,11 +688,21 @@ class TableModel(GridModel):
 
     def _on_data_changed(self):
         """Forces the grid to refresh when the underlying list changes."""
-        # Invalidate the current cache (if any):
-        self._filtered_cache = None
+        # Invalidate the current cache (if any), unless the change is being
+        # made by the model itself, which updates the cache:
+        if not self._updating_items:
+            self._filtered_cache = self._sorted_keys = None
 
         self.fire_structure_changed()
 
+    def _on_item_changed(self):
+        """Forces the grid to refresh when an item of the list changes."""
+        # The item's sort key may have changed:
+        if not self._updating_items:
+            self._sorted_keys = self._filtered_keys = None
+
+        self.fire_content_changed()
+
     def _mouse_cell_changed(self, new):
         """Handles the user mousing over a specified cell."""
         row, col = new
@@ -697,13 +755,114 @@ class TableModel(GridModel):
         editor = self.editor
         sorted = editor.factory.sort_model and (self._sorter is not None)
         if sorted:
-            items = self.__items(False)[:]
-            items.sort(key=self._sorter)
+            sorter = self._sorter
+            keyed = [(sorter(item), item) for item in self.__items(False)]
+            keyed.sort(key=itemgetter(0))
             if self.reverse ^ self._reverse:
-                items.reverse()
-            editor.value = items
+                keyed.reverse()
+            editor.value = [item for key, item in keyed]
+
+            # Remember the sort keys, so items can be inserted in order:
+            self._sorted_keys = [key for key, item in keyed]
         return sorted
 
+    def _filtered_item_inserted(self, index, item):
+        """Updates the filtered items after an item is inserted at a
+        specified (ordered) index of the model.
+        """
+        fc = self._filtered_cache
+        sorter = self._sorter
+        if fc is None or (sorter is not None and self._filtered_keys is None):
+            self._filtered_cache = None
+            return
+
+        indices = [i + (i >= index) for i in self.editor.filtered_indices]
+        filter = self._get_filter()
+        if filter is None or filter(item):
+            if sorter is None:
+                position = bisect_left(indices, index)
+            else:
+                key = sorter(item)
+                position = _bisect_pairs(
+                    self._filtered_keys, indices, (key, index), self._reverse
+                )
+                self._filtered_keys.insert(position, key)
+            indices.insert(position, index)
+            fc.insert(position, item)
+
+        self.editor.filtered_indices = indices
+        self._update_filter_summary(len(indices))
+
+    def _filtered_item_deleted(self, position, index):
+        """Updates the filtered items after the item at a specified filtered
+        position and (ordered) model index is deleted.
+        """
+        fc = self._filtered_cache
+        if fc is None:
+            return
+
+        indices = self.editor.filtered_indices
+        indices = [i - (i > index) for i in indices[:position]] + [
+            i - (i > index) for i in indices[position + 1 :]
+        ]
+        del fc[position]
+        if self._filtered_keys is not None:
+            del self._filtered_keys[position]
+
+        self.editor.filtered_indices = indices
+        self._update_filter_summary(len(indices))
+
+    def _sort_filtered_cache(self):
+        """Re-sorts the items which pass the filter using the current sort
+        column, without re-applying the filter.
+        """
+        fc = self._filtered_cache
+        if self.auto_add_row is not None:
+            fc = fc[:-1]
+
+        # Restore the model order, then sort stably:
+        nitems = sorted(
+            zip(self.editor.filtered_indices, fc), key=itemgetter(0)
+        )
+        self._set_filtered_cache(nitems)
+
+    def _get_filter(self):
+        """Returns the current filter function (if any)."""
+        filter = self.filter
+        if filter is not None and not callable(filter):
+            filter = filter.filter
+        return filter
+
+    def _update_filter_summary(self, n_filtered):
+        """Updates the filter summary message."""
+        if self.filter is None:
+            self.filter_summary = "All %s items" % n_filtered
+        else:
+            self.filter_summary = "%s of %s items" % (
+                n_filtered,
+                len(self.__items()),
+            )
+
+    def _set_filtered_cache(self, nitems):
+        """Sets the filtered items from a list of (index, item) pairs in model
+        order, sorting them using the current sort column (if any).
+        """
+        sorter = self._sorter
+        if sorter is not None:
+            keyed = [(sorter(nitem[1]), nitem) for nitem in nitems]
+            keyed.sort(key=itemgetter(0))
+            if self._reverse:
+                keyed.reverse()
+            self._filtered_keys = [key for key, nitem in keyed]
+            nitems = [nitem for key, nitem in keyed]
+        else:
+            self._filtered_keys = None
+
+        self.editor.filtered_indices = [x[0] for x in nitems]
+        self._filtered_cache = [x[1] for x in nitems]
+        if self.auto_add_row is not None:
+            self._filtered_cache.append(self.auto_add_row)
+
     def __items(self, ordered=True):
         """Returns the raw list of model objects."""
         result = self.editor.value
@@ -720,30 +879,16 @@ class TableModel(GridModel):
         fc = self._filtered_cache
         if fc is None:
             items = self.__items()
-            filter = self.filter
+            filter = self._get_filter()
             if filter is None:
                 nitems = [nitem for nitem in enumerate(items)]
-                self.filter_summary = "All %s items" % len(nitems)
             else:
-                if not callable(filter):
-                    filter = filter.filter
                 nitems = [
                     nitem for nitem in enumerate(items) if filter(nitem[1])
                 ]
-                self.filter_summary = "%s of %s items" % (
-                    len(nitems),
-                    len(items),
-                )
-            sorter = self._sorter
-            if sorter is not None:
-                nitems.sort(key=lambda x: sorter(x[1]))
-                if self._reverse:
-                    nitems.reverse()
-
-            self.editor.filtered_indices = [x[0] for x in nitems]
-            self._filtered_cache = fc = [x[1] for x in nitems]
-            if self.auto_add_row is not None:
-                self._filtered_cache.append(self.auto_add_row)
+            self._update_filter_summary(len(nitems))
+            self._set_filtered_cache(nitems)
+            fc = self._filtered_cache
 
         return fc
 
@@ -776,3 +921,32 @@ class TableModel(GridModel):
         for i, col in enumerate(self.__get_columns()):
             if name == col.name:
                 return i
+
+
+def _bisect(keys, key, descending=False):
+    """Returns the index at which to insert a key into a sorted list of keys,
+    after any equal keys.
+    """
+    lo, hi = 0, len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if (keys[mid] < key) if descending else (key < keys[mid]):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _bisect_pairs(keys, indices, pair, descending=False):
+    """Returns the index at which to insert a (key, index) pair into the
+    parallel lists of keys and indices sorted by (key, index).
+    """
+    lo, hi = 0, len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        mid_pair = (keys[mid], indices[mid])
+        if (mid_pair < pair) if descending else (pair < mid_pair):
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
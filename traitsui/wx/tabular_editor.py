@@ -660,13 +660,8 @@ class TabularEditor(Editor):
                 if (ds.result == wx.DragMove) and (
                     self._drag_local or self.factory.drag_move
                 ):
-                    # Then delete all of the original items (in reverse order
-                    # from highest to lowest, so the indices don't need to be
-                    # adjusted):
-                    rows = self._drag_rows
-                    rows.reverse()
-                    for row in rows:
-                        adapter.delete(object, name, row)
+                    # Then delete all of the original items:
+                    adapter.delete_rows(object, name, self._drag_rows)
             finally:
                 self._drag_rows = None
                 self._drag_local = False
@@ -1082,10 +1077,8 @@ class TabularEditor(Editor):
             if len(selected) == 0:
                 return
 
-            delete = self.adapter.delete
-            selected.reverse()
-            for row in selected:
-                delete(self.object, self.name, row)
+            self.adapter.delete_rows(self.object, self.name, selected)
+            row = min(selected)
 
             n = self.adapter.len(self.object, self.name)
             if not self.factory.multi_select:
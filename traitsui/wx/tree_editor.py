@@ -24,7 +24,7 @@ except:
     PythonDropSource = PythonDropTarget = None
 
 from pyface.ui.wx.image_list import ImageList
-from traits.api import HasStrictTraits, Any, Str, Event, TraitError
+from traits.api import HasStrictTraits, Any, Str, Event, Int, TraitError
 from traitsui.api import View, TreeNode, ObjectTreeNode, MultiTreeNode
 
 from traitsui.editors.tree_editor import (
@@ -35,6 +35,7 @@ from traitsui.editors.tree_editor import (
     PasteAction,
     RenameAction,
 )
+from traitsui.helper import IdentityMap
 from traitsui.undo import ListUndoItem
 from traitsui.tree_node import ITreeNodeAdapterBridge
 from traitsui.menu import Menu, Action, Separator
@@ -95,6 +96,10 @@ class SimpleEditor(Editor):
     #: The event fired when the application wants to veto an operation:
     veto = Event()
 
+    #: The number of nodes in the tree (not counting the children which have
+    #: not been created yet):
+    node_count = Int()
+
     def init(self, parent):
         """Finishes initializing the editor by creating the underlying toolkit
         widget.
@@ -218,7 +223,7 @@ class SimpleEditor(Editor):
             tree.AssignImageList(self._image_list)
 
         # Set up the mapping between objects and tree id's:
-        self._map = {}
+        self._map = IdentityMap()
 
         # Initialize the 'undo state' stack:
         self._undoable = []
@@ -249,6 +254,7 @@ class SimpleEditor(Editor):
         self.sync_value(factory.click, "click", "to")
         self.sync_value(factory.dclick, "dclick", "to")
         self.sync_value(factory.veto, "veto", "from")
+        self.sync_value(factory.node_count, "node_count", "to")
 
         # Set up the drag and drop target:
         if PythonDropTarget is not None:
@@ -413,7 +419,8 @@ class SimpleEditor(Editor):
                 self._root_nid = nid = tree.AddRoot(
                     node.get_label(object), icon, icon
                 )
-                self._map[id(object)] = [(node.get_children_id(object), nid)]
+                self._map[object] = [(node.get_children_id(object), nid)]
+                self.node_count += 1
                 self._add_listeners(node, object)
                 self._set_node_data(nid, (False, node, object))
                 if self.factory.hide_root or self._has_children(node, object):
@@ -454,9 +461,10 @@ class SimpleEditor(Editor):
         has_children = self._has_children(node, object)
         tree.SetItemHasChildren(cnid, has_children)
         self._set_node_data(cnid, (False, node, object))
-        self._map.setdefault(id(object), []).append(
+        self._map.setdefault(object, []).append(
             (node.get_children_id(object), cnid)
         )
+        self.node_count += 1
         self._add_listeners(node, object)
 
         # Automatically expand the new node (if requested):
@@ -472,16 +480,16 @@ class SimpleEditor(Editor):
             self._delete_node(cnid)
 
         expanded, node, object = self._get_node_data(nid)
-        id_object = id(object)
-        object_info = self._map[id_object]
+        object_info = self._map[object]
         for i, info in enumerate(object_info):
             if nid == info[1]:
                 del object_info[i]
+                self.node_count -= 1
                 break
 
         if len(object_info) == 0:
             self._remove_listeners(node, object)
-            del self._map[id_object]
+            del self._map[object]
 
         # We set the '_locked' flag here because wx seems to generate a
         # 'node selected' event when the node is deleted. This can lead to
@@ -603,7 +611,7 @@ class SimpleEditor(Editor):
         """Returns the tree node data for a specified object in the form
         ( expanded, node, nid ).
         """
-        info = self._map[id(object)]
+        info = self._map[object]
         for name2, nid in info:
             if name == name2:
                 break
@@ -619,7 +627,7 @@ class SimpleEditor(Editor):
         form: [ ( expanded, node, nid ), ... ].
         """
         result = []
-        for name2, nid in self._map[id(object)]:
+        for name2, nid in self._map[object]:
             if name == name2:
                 expanded, node, ignore = self._get_node_data(nid)
                 result.append((expanded, node, nid))
@@ -780,7 +788,7 @@ class SimpleEditor(Editor):
 
     def _get_object_nid(self, object, name=""):
         """Gets the ID associated with a specified object (if any)."""
-        info = self._map.get(id(object))
+        info = self._map.get(object)
         if info is None:
             return None
 
@@ -1594,7 +1602,7 @@ class SimpleEditor(Editor):
     def _label_updated(self, object, name, label):
         """Handles the label of an object being changed."""
         nids = {}
-        for name2, nid in self._map[id(object)]:
+        for name2, nid in self._map[object]:
             if nid not in nids:
                 nids[nid] = None
                 node = self._get_node_data(nid)[1]
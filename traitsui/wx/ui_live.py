@@ -24,7 +24,7 @@ from .ui_base import BaseDialog
 from .ui_panel import panel
 
 from .constants import DefaultTitle, WindowColor, scrollbar_dx
-from traitsui.undo import UndoHistory
+from traitsui.undo import view_undo_history
 
 from traitsui.menu import (
     UndoButton,
@@ -169,7 +169,7 @@ class LiveWindow(BaseDialog):
         )
         if has_buttons or (view.menubar is not None):
             if history is None:
-                history = UndoHistory()
+                history = view_undo_history(view)
         else:
             history = None
         ui.history = history
@@ -22,7 +22,7 @@ from traits.api import Instance, Undefined
 
 from traitsui.api import Group
 
-from traitsui.undo import UndoHistory
+from traitsui.undo import view_undo_history
 
 from traitsui.dockable_view_element import DockableViewElement
 
@@ -30,6 +30,8 @@ from traitsui.help_template import help_template
 
 from traitsui.menu import UndoButton, RevertButton, HelpButton
 
+from traitsui.profiling import recorded
+
 from pyface.api import SystemMetrics
 
 from pyface.dock.api import (
@@ -141,7 +143,7 @@ class Panel(BaseDialog):
                 if self.is_button(button, "Undo") or self.is_button(
                     button, "Revert"
                 ):
-                    history = UndoHistory()
+                    history = view_undo_history(view)
                     break
         ui.history = history
 
@@ -246,6 +248,7 @@ class Panel(BaseDialog):
 # -------------------------------------------------------------------------
 
 
+@recorded("panel")
 def panel(ui, parent):
     """Creates a panel-based wxPython user interface for a specified UI object.
 